@@ -43,6 +43,9 @@ def _build_parser() -> argparse.ArgumentParser:
     cache_group = cache_parser.add_mutually_exclusive_group(required=True)
     cache_group.add_argument("--user-yaml", type=Path, help="Path to user yaml config")
     cache_group.add_argument("--user-id", type=str, help="User id (e.g. 3523285)")
+    cache_parser.add_argument("--full", action="store_true", help="Download all publications instead of only changes")
+    cache_parser.add_argument("--workers", type=int, default=1,
+                              help="Processes for affiliation clustering (default: 1, serial)")
 
     delete_parser = subparsers.add_parser("delete-dois", help="Delete publications by DOI")
     delete_group = delete_parser.add_mutually_exclusive_group(required=True)
@@ -119,7 +122,7 @@ def main(argv: list[str] | None = None) -> int:
         user_yaml_path = args.user_yaml
         if args.user_id:
             user_yaml_path = USER_DATA_DIR / f"user_{args.user_id}" / "metadata.yaml"
-        refresh_pubman_cache(user_yaml_path)
+        refresh_pubman_cache(user_yaml_path, incremental=not args.full, workers=args.workers)
         return 0
     if args.command == "delete-dois":
         if args.doi_yaml:
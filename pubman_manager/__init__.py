@@ -47,6 +47,7 @@ def get_user_dir(user_id) -> Path:
 from .util import *
 from .excel_generator import create_sheet, Cell
 from .pubman_base import PubmanBase
+from .async_pubman_base import AsyncPubmanBase
 from .pubman_creator import PubmanCreator
 from .pubman_extractor import PubmanExtractor
 from .api_manager_scopus import ScopusManager
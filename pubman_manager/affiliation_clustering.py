@@ -0,0 +1,97 @@
+import re
+from collections import defaultdict
+
+from rapidfuzz import fuzz
+
+_NON_WORD = re.compile(r"(?ui)\W")
+# fuzzywuzzy's force_ascii drops exactly these code points
+_LATIN1_TABLE = dict.fromkeys(range(128, 256))
+# Strings without a common blocking key score at most 89 (see _blocking_keys)
+MIN_THRESHOLD = 90
+
+
+def similarity_key(text):
+    """
+    Normalize `text` the way fuzzywuzzy's extractOne + token_set_ratio did: non-word
+    characters become spaces, Latin-1 characters are dropped, lower case, single spaces.
+    """
+    return " ".join(_NON_WORD.sub(" ", text).translate(_LATIN1_TABLE).lower().split())
+
+
+def _blocking_keys(key):
+    """
+    Tokens plus character trigrams of the sorted token string.
+
+    Without a common token, token_set_ratio is the ratio of the sorted token strings,
+    2M / (2M + U) for M matched and U unmatched characters. Without a common trigram
+    the matched characters come in runs of at most two, each separated by an unmatched
+    one, so U >= M/2 - 1 and the score peaks at 8/9 (89, e.g. "abcd" and "abxcd").
+    Strings shorter than three characters have no trigrams and are always compared.
+    """
+    tokens = sorted(set(key.split()))
+    joined = " ".join(tokens)
+    keys = {("t", token) for token in tokens}
+    keys.update(("g", joined[i:i + 3]) for i in range(len(joined) - 2))
+    return keys
+
+
+class AffiliationClusterer:
+    """
+    Incrementally clusters strings whose token_set_ratio reaches `threshold`.
+
+    Each new string is assigned to the best scoring existing representative (earliest
+    one on ties) or becomes a representative itself, exactly like calling
+    extractOne(s, representatives, scorer=token_set_ratio) for every string. Candidates
+    are narrowed with an inverted index over tokens and character trigrams and only
+    those are scored, with a score cutoff. The blocking is only lossless for thresholds
+    of at least MIN_THRESHOLD, lower ones are rejected.
+    """
+
+    def __init__(self, threshold=95):
+        if threshold < MIN_THRESHOLD:
+            raise ValueError(f"AffiliationClusterer needs a threshold of at least {MIN_THRESHOLD}, got {threshold}")
+        self.threshold = threshold
+        self.representatives = []
+        self._keys = []
+        self._index = defaultdict(list)
+        self._short = []  # representatives too short for trigrams
+        self._resolved = {}
+
+    def _candidates(self, blocking_keys):
+        candidates = set(self._short)
+        for blocking_key in blocking_keys:
+            candidates.update(self._index.get(blocking_key, ()))
+        return sorted(candidates)
+
+    def add(self, text):
+        """Return the representative `text` is assigned to."""
+        rep = self._resolved.get(text)
+        if rep is not None:
+            return rep
+
+        key = similarity_key(text)
+        blocking_keys = _blocking_keys(key)
+        best_index, best_score = None, -1
+        for i in self._candidates(blocking_keys):
+            # fuzzywuzzy compared rounded integer scores
+            score = round(fuzz.token_set_ratio(key, self._keys[i], score_cutoff=self.threshold - 0.5))
+            if score > best_score:
+                best_index, best_score = i, score
+
+        if best_index is not None and best_score >= self.threshold:
+            rep = self.representatives[best_index]
+            if best_score == 100:
+                # no later representative can beat an earlier perfect match
+                self._resolved[text] = rep
+            return rep
+
+        index = len(self.representatives)
+        self.representatives.append(text)
+        self._keys.append(key)
+        if len(key) < 3:
+            self._short.append(index)
+        for blocking_key in blocking_keys:
+            self._index[blocking_key].append(index)
+        self._resolved[text] = text
+        return text
+
@@ -0,0 +1,117 @@
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+
+from pathlib import Path
+
+from pubman_manager import USER_DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+# Shared by all users: decisions only depend on the authors_info version they were made with
+AFFILIATION_DECISIONS_FILE = USER_DATA_DIR / "affiliation_decisions.sqlite"
+# Decisions older than this are dropped; by then their authors_info version is long gone
+DECISION_MAX_AGE = 30 * 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS affiliation_decisions (
+    version TEXT NOT NULL,
+    author TEXT NOT NULL,
+    affiliation TEXT NOT NULL,
+    decision TEXT NOT NULL,
+    color TEXT NOT NULL,
+    compare_error REAL NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (version, author, affiliation)
+);
+CREATE INDEX IF NOT EXISTS idx_affiliation_decisions_created ON affiliation_decisions (created);
+"""
+
+
+class AffiliationDecisionCache:
+    """
+    Persistent cache of affiliation matching decisions.
+
+    Keyed by the authors_info version (a content hash), the resolved PuRe author and the
+    raw publication affiliation; stores the chosen affiliation, the DecisionColor name
+    and the compare_error. A refreshed PuRe cache has a new version, so its decisions
+    are made anew. Decisions older than `max_age` are ignored and deleted with the first
+    write.
+    """
+
+    def __init__(self, path=None, max_age=DECISION_MAX_AGE):
+        self.path = Path(path or AFFILIATION_DECISIONS_FILE)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+        self._pruned = False
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM affiliation_decisions").fetchone()[0]
+
+    def get(self, version, author, affiliation):
+        """(decision, color name, compare_error) or None."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT decision, color, compare_error FROM affiliation_decisions "
+                "WHERE version = ? AND author = ? AND affiliation = ? AND created >= ?",
+                (version, json.dumps(list(author)), affiliation, time.time() - self.max_age),
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def put(self, version, author, affiliation, decision, color, compare_error):
+        self.put_many(version, [(author, affiliation, decision, color, compare_error)])
+
+    def put_many(self, version, decisions):
+        """Store (author, affiliation, decision, color name, compare_error) tuples in one transaction."""
+        now = time.time()
+        rows = [(version, json.dumps(list(author)), affiliation, decision, color, compare_error, now)
+                for author, affiliation, decision, color, compare_error in decisions]
+        if not rows:
+            return
+        with self._lock, self.conn:
+            if not self._pruned:
+                self.conn.execute("DELETE FROM affiliation_decisions WHERE created < ?", (now - self.max_age,))
+                self._pruned = True
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO affiliation_decisions "
+                "(version, author, affiliation, decision, color, compare_error, created) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+
+_shared_cache = None
+_shared_cache_pid = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_decision_cache():
+    """
+    Return the process-wide AffiliationDecisionCache on AFFILIATION_DECISIONS_FILE; it is
+    closed when the process exits.
+    """
+    global _shared_cache, _shared_cache_pid
+    with _shared_cache_lock:
+        # a connection inherited from a forked parent must not be used
+        if _shared_cache is None or _shared_cache_pid != os.getpid():
+            _shared_cache = AffiliationDecisionCache()
+            _shared_cache_pid = os.getpid()
+            atexit.register(_shared_cache.close)
+        return _shared_cache
@@ -1,32 +1,44 @@
-from habanero import Crossref
 from unidecode import unidecode
 import pandas as pd
 from collections import OrderedDict
-import requests
-import time
 from typing import List, Dict, Tuple, Any
 import logging
+import threading
 
 from pubman_manager import is_mpi_affiliation
+from pubman_manager.http_session import get_session
 from pubman_manager.util import date_to_cell
 
 logger = logging.getLogger(__name__)
 
+CROSSREF_WORKS_URL = "https://api.crossref.org/works"
+
 class CrossrefManager:
     def __init__(self):
         self.metadata_map = {}
+        self.session = get_session("crossref")
+        self._lock = threading.Lock()
 
     def get_metadata(self, doi):
-        if doi not in self.metadata_map:
-            cr = Crossref()
-            try:
-                result = cr.works(ids=doi)
-                self.metadata_map[doi] = result['message']
-                logger.debug(f'crossref {self.metadata_map[doi]}')
-            except Exception as e:
-                logger.error(f"Failed to retrieve Crossref data for DOI {doi}: {e}")
-                return None
-        return self.metadata_map[doi]
+        """
+        Crossref metadata of `doi`, or None if Crossref does not know it.
+
+        Transient failures are retried by the shared session; a DOI that still cannot
+        be fetched raises instead of being dropped from the overview.
+        """
+        with self._lock:
+            if doi in self.metadata_map:
+                return self.metadata_map[doi]
+        response = self.session.get(f"{CROSSREF_WORKS_URL}/{doi}")
+        if response.status_code == 404:
+            logger.error(f"No Crossref data for DOI {doi}")
+            return None
+        if response.status_code != 200:
+            raise RuntimeError(f"Crossref works API error {response.status_code} for DOI {doi}: {response.text}")
+        metadata = response.json()['message']
+        logger.debug(f'crossref {metadata}')
+        with self._lock:
+            return self.metadata_map.setdefault(doi, metadata)
 
     def get_overview(self, doi):
         crossref_metadata = self.get_metadata(doi)
@@ -91,8 +103,6 @@ class CrossrefManager:
         """
         Use Crossref API to generate a list of DOIs for an author.
         """
-        BASE_CROSSREF_URL = "https://api.crossref.org/works"
-
         author_name = f'{first_name} {last_name}'
         dois = []
         params = {
@@ -106,30 +116,24 @@ class CrossrefManager:
             params["filter"].append(f"until-pub-date:{pubyear_end}")
         # params["filter"].append("has-affiliation:true")
         params["filter"] = ",".join(params["filter"])
-        attempt = 0
-        while True:
-            response = requests.get(BASE_CROSSREF_URL, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                items = data.get('message', {}).get('items', [])
-                for item in items:
-                    doi = item['DOI']
-                    if item.get('subtype') == 'preprint':
-                        logger.debug(f"Skipping preprint {doi} {item.get('published', {})}")
-                        continue
-                    if 'proceeding' in item.get('type', ''):
-                        logger.debug(f"Skipping proceeding article {doi} {item.get('type', '')}")
-                        continue
-                    if 'ssrn' in doi.lower() or 'egusphere' in doi.lower():
-                        logger.debug(f"Skipping ssrn or egusphere {doi}")
-                        continue
-                    for author_data in item.get('author', []):
-                        if author_name == f"{author_data.get('given', '').strip()} {author_data.get('family', '').strip()}".strip():
-                            dois.append(doi)
-            else:
-                if attempt>3:
-                    raise RuntimeError(f"Crossref query API error {response.status_code}: {response.text}")
-                else:
-                    attempt+=1
-                    time.sleep(5)
-            return dois
+        # transient failures are retried by the shared session
+        response = self.session.get(CROSSREF_WORKS_URL, params=params)
+        if response.status_code != 200:
+            raise RuntimeError(f"Crossref query API error {response.status_code}: {response.text}")
+        data = response.json()
+        items = data.get('message', {}).get('items', [])
+        for item in items:
+            doi = item['DOI']
+            if item.get('subtype') == 'preprint':
+                logger.debug(f"Skipping preprint {doi} {item.get('published', {})}")
+                continue
+            if 'proceeding' in item.get('type', ''):
+                logger.debug(f"Skipping proceeding article {doi} {item.get('type', '')}")
+                continue
+            if 'ssrn' in doi.lower() or 'egusphere' in doi.lower():
+                logger.debug(f"Skipping ssrn or egusphere {doi}")
+                continue
+            for author_data in item.get('author', []):
+                if author_name == f"{author_data.get('given', '').strip()} {author_data.get('family', '').strip()}".strip():
+                    dois.append(doi)
+        return dois
@@ -1,4 +1,5 @@
-import time
+import os
+import threading
 import pandas as pd
 from collections import OrderedDict
 import requests
@@ -9,6 +10,7 @@ from urllib.parse import urlencode
 import yaml
 
 from pubman_manager import FILES_DIR, ENV_SCOPUS_API_KEY, USER_DATA_DIR, is_mpi_affiliation
+from pubman_manager.http_session import get_session, request_policy, RateLimiter
 from pubman_manager.util import date_to_cell
 
 logger = logging.getLogger(__name__)
@@ -17,6 +19,15 @@ BASE_URL =             "https://api.elsevier.com/content"
 BASE_AUTHOR_URL =      f"{BASE_URL}/search/author"
 BASE_AFFILIATION_URL = f"{BASE_URL}/search/affiliation"
 BASE_SEARCH_URL = "https://api.elsevier.com/content/search/scopus"
+# Seconds between Scopus requests, shared by all threads and ScopusManager instances (one API key)
+SCOPUS_MIN_INTERVAL = 2
+
+_rate_limiter = RateLimiter(SCOPUS_MIN_INTERVAL)
+
+
+def quota_exceeded(response):
+    """The weekly Scopus quota is exhausted; retrying won't help until it resets."""
+    return "QUOTA_EXCEEDED" in response.headers.get("X-ELS-Status", "")
 
 class ScopusManager:
     def __init__(self, org_name, api_key = None, author_name_cache_path=None):
@@ -27,8 +38,15 @@ class ScopusManager:
         self.author_id_map = {}
         self.author_name_cache_path = author_name_cache_path or (USER_DATA_DIR / "scopus_author_names.yaml")
         self.author_name_cache = self._load_author_name_cache()
-        self.last_request = time.time()
-        self.rate_limit = 2
+        self.session = get_session("scopus")
+        self.rate_limiter = _rate_limiter
+        # get_overview runs on several threads (DOIParser.collect_data_for_dois)
+        self._lock = threading.Lock()
+
+    def _get(self, url, **kwargs):
+        """GET from Scopus; every attempt, retries included, waits for the shared rate limiter."""
+        with request_policy(self.session, give_up=quota_exceeded, rate_limiter=self.rate_limiter):
+            return self.session.get(url, **kwargs)
 
     def _load_author_name_cache(self) -> Dict[str, Dict[str, str]]:
         if not self.author_name_cache_path.exists():
@@ -37,8 +55,13 @@ class ScopusManager:
             return yaml.safe_load(fh) or {}
 
     def _save_author_name_cache(self) -> None:
-        with self.author_name_cache_path.open("w", encoding="utf-8") as fh:
-            yaml.safe_dump(self.author_name_cache, fh, sort_keys=False)
+        """Write a snapshot of the cache atomically; call with self._lock held."""
+        tmp_path = self.author_name_cache_path.with_name(
+            f"{self.author_name_cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with tmp_path.open("w", encoding="utf-8") as fh:
+            yaml.safe_dump(dict(self.author_name_cache), fh, sort_keys=False)
+        os.replace(tmp_path, self.author_name_cache_path)
 
     @property
     def af_id(self):
@@ -52,7 +75,7 @@ class ScopusManager:
             "X-ELS-APIKey": self.api_key,
             "Accept": "application/json"
         }
-        response = requests.get(f"{BASE_AFFILIATION_URL}?{encoded_params}", headers=headers)
+        response = self._get(f"{BASE_AFFILIATION_URL}?{encoded_params}", headers=headers)
         if response.status_code == 200:
             data = response.json()
             if "search-results" in data and "entry" in data["search-results"]:
@@ -67,22 +90,23 @@ class ScopusManager:
             raise RuntimeError(f"Scopus API request to get AF-ID unsuccessful: {response.status_code} - {response.text}")
 
     def get_metadata(self, doi):
-        if doi not in self.metadata_map:
-            url = "https://api.elsevier.com/content/abstract/doi/"
-            headers = {
-                'Accept': 'application/json',
-                'X-ELS-APIKey': self.api_key,
-            }
-            try:
-                time.sleep(max(self.rate_limit - (time.time()-self.last_request), 0))
-                response = requests.get(url + doi, headers=headers)
-                self.last_request = time.time()
-                response.raise_for_status()
-                self.metadata_map[doi] = response.json()
-            except requests.HTTPError as e:
-                logger.error(f"Failed to retrieve Scopus data for DOI {doi}: {e}")
-                self.metadata_map[doi] = {}
-        return self.metadata_map[doi]
+        with self._lock:
+            if doi in self.metadata_map:
+                return self.metadata_map[doi]
+        url = "https://api.elsevier.com/content/abstract/doi/"
+        headers = {
+            'Accept': 'application/json',
+            'X-ELS-APIKey': self.api_key,
+        }
+        try:
+            response = self._get(url + doi, headers=headers)
+            response.raise_for_status()
+            metadata = response.json()
+        except requests.HTTPError as e:
+            logger.error(f"Failed to retrieve Scopus data for DOI {doi}: {e}")
+            metadata = {}
+        with self._lock:
+            return self.metadata_map.setdefault(doi, metadata)
 
     def get_overview(self, doi):
         """Fetch overview from Scopus for the given DOI."""
@@ -114,7 +138,8 @@ class ScopusManager:
         return overview
 
     def get_author_full_name(self, author_id):
-        cached = self.author_name_cache.get(author_id)
+        with self._lock:
+            cached = self.author_name_cache.get(author_id)
         if cached:
             return cached.get("first", ""), cached.get("last", "")
         author_api_url = f"https://api.elsevier.com/content/author/author_id/{author_id}"
@@ -122,36 +147,28 @@ class ScopusManager:
             'Accept': 'application/json',
             'X-ELS-APIKey': self.api_key
         }
-        while True:
-            time.sleep(max(self.rate_limit - (time.time()-self.last_request),0))
-            try:
-                response = requests.get(author_api_url, headers=headers)
-                self.last_request = time.time()
-                if response.status_code == 200:
-                    author_data = response.json()
-                    preferred_name = author_data.get('author-retrieval-response', [{}])[0].get('author-profile', {}).get('preferred-name', {})
-                    if '.' in (first_name:=preferred_name.get('given-name', '').split()[0]):
-                        name_variants = author_data.get('author-retrieval-response', [{}])[0].get('author-profile', {}).get('name-variant', [])
-                        if isinstance(name_variants, list):
-                            for variant in name_variants:
-                                if len(variant_name:=variant.get('given-name', '')) > len(first_name):
-                                    first_name = variant_name
-                                    break
-                    self.author_name_cache[author_id] = {"first": first_name, "last": preferred_name.get('surname', '')}
-                    self._save_author_name_cache()
-                    return first_name, preferred_name.get('surname', '')
-            except Exception as e:
-                import traceback
-                logger.error(f"Failed to get response from {author_api_url}: {e}\n\n{traceback.format_exc()}")
-            else:
-                if response.status_code == 429 or "QUOTA_EXCEEDED" in response.headers.get("X-ELS-Status", ""):
-                    raise RuntimeError(
-                        f"Quota exceeded for Scopus author {author_id} (status code: {response.status_code})"
-                    )
-                else:
-                    logger.error(f"Failed to retrieve Scopus author data for author {author_id} "
-                                f"(status code: {response.status_code}, {response.text})")
-            time.sleep(30)
+        # transient failures are retried by the shared session
+        response = self._get(author_api_url, headers=headers)
+        if response.status_code == 200:
+            author_data = response.json()
+            preferred_name = author_data.get('author-retrieval-response', [{}])[0].get('author-profile', {}).get('preferred-name', {})
+            if '.' in (first_name:=preferred_name.get('given-name', '').split()[0]):
+                name_variants = author_data.get('author-retrieval-response', [{}])[0].get('author-profile', {}).get('name-variant', [])
+                if isinstance(name_variants, list):
+                    for variant in name_variants:
+                        if len(variant_name:=variant.get('given-name', '')) > len(first_name):
+                            first_name = variant_name
+                            break
+            with self._lock:
+                self.author_name_cache[author_id] = {"first": first_name, "last": preferred_name.get('surname', '')}
+                self._save_author_name_cache()
+            return first_name, preferred_name.get('surname', '')
+        if response.status_code == 429 or quota_exceeded(response):
+            raise RuntimeError(
+                f"Quota exceeded for Scopus author {author_id} (status code: {response.status_code})"
+            )
+        raise RuntimeError(f"Failed to retrieve Scopus author data for author {author_id} "
+                           f"(status code: {response.status_code}, {response.text})")
 
     def extract_authors_affiliations(self, scopus_metadata) -> "OrderedDict[Tuple[str, str], List[str]]":
         """
@@ -297,9 +314,7 @@ class ScopusManager:
                 "query": query,
                 "count": 1
             }
-            time.sleep(max(self.rate_limit - (time.time()-self.last_request), 0))
-            response = requests.get(BASE_AUTHOR_URL, headers=headers, params=params)
-            self.last_request = time.time()
+            response = self._get(BASE_AUTHOR_URL, headers=headers, params=params)
             if response.status_code == 200:
                 data = response.json()
                 entries = data['search-results'].get('entry', [])
@@ -349,7 +364,7 @@ class ScopusManager:
         total_results = 1
         while start < total_results:
             params['start'] = start
-            response = requests.get(BASE_SEARCH_URL, headers=headers, params=params)
+            response = self._get(BASE_SEARCH_URL, headers=headers, params=params)
 
             if response.status_code == 200:
                 data = response.json()
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import logging
+
+from pubman_manager.http_session import DEFAULT_POOL_SIZE
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = DEFAULT_POOL_SIZE
+
+
+def run_sync(coro):
+    """
+    Run `coro` to completion from synchronous code (CLI, Flask routes, cron jobs).
+
+    If the calling thread already runs an event loop (e.g. a notebook), the coroutine
+    is executed on a fresh loop in a helper thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    result = {}
+
+    def _runner():
+        try:
+            result["value"] = asyncio.run(coro)
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=_runner)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+class AsyncPubmanBase:
+    """
+    asyncio counterpart of PubmanBase.
+
+    Wraps an authenticated PubmanBase (or subclass) and exposes the same calls as
+    coroutines. Each call runs the blocking request on a worker thread through the
+    shared connection pool, and at most `concurrency` calls are in flight at once, no
+    matter how many event loops or threads use the instance.
+    """
+
+    def __init__(self, pubman_api, concurrency=DEFAULT_CONCURRENCY):
+        self.pubman_api = pubman_api
+        self.concurrency = concurrency
+        self._semaphore = threading.BoundedSemaphore(concurrency)
+
+    def _call(self, func, *args, **kwargs):
+        with self._semaphore:
+            return func(*args, **kwargs)
+
+    async def run(self, func, *args, **kwargs):
+        """Run a blocking `func(*args, **kwargs)` within the concurrency limit."""
+        return await asyncio.to_thread(self._call, func, *args, **kwargs)
+
+    async def map(self, func, args_list):
+        """Run `func(*args)` for every tuple in `args_list`; results keep the input order."""
+        return await asyncio.gather(*(self.run(func, *args) for args in args_list))
+
+    async def get_item(self, publication_id):
+        return await self.run(self.pubman_api.get_item, publication_id)
+
+    async def search_items(self, query, format="json", citation=None, cslConeId=None, scroll=False, source=None):
+        return await self.run(self.pubman_api.search_items, query, format=format, citation=citation,
+                              cslConeId=cslConeId, scroll=scroll, source=source)
+
+    async def search_items_scroll(self, scrollId, format="json", citation=None, cslConeId=None):
+        return await self.run(self.pubman_api.search_items_scroll, scrollId, format=format,
+                              citation=citation, cslConeId=cslConeId)
+
+    async def fetch_scroll_results(self, scroll_id):
+        return await self.run(self.pubman_api.fetch_scroll_results, scroll_id)
+
+    async def iter_scroll_pages(self, scroll_id):
+        """Yield raw scroll pages until PuRe stops returning a scroll id."""
+        while scroll_id:
+            page = await self.fetch_scroll_results(scroll_id)
+            if not page:
+                break
+            yield page
+            scroll_id = page.get('_scroll_id')
+
+    async def search_publication_by_criteria(self, match_criteria, size=100000, source=None):
+        return await self.run(self.pubman_api.search_publication_by_criteria, match_criteria, size=size,
+                              source=source)
+
+    async def search_publications_by_criteria_many(self, criteria_list, size=100000, source=None):
+        """Search for every criteria dict concurrently; results keep the input order."""
+        return await asyncio.gather(*(
+            self.search_publication_by_criteria(criteria, size=size, source=source) for criteria in criteria_list
+        ))
+
+    async def create_item(self, request_json):
+        return await self.run(self.pubman_api.create_item, request_json)
+
+    async def update_item(self, item_id, item_data):
+        return await self.run(self.pubman_api.update_item, item_id, item_data)
+
+    async def submit_item(self, item_id, last_modification_date):
+        return await self.run(self.pubman_api.submit_item, item_id, last_modification_date)
+
+    async def delete_item(self, item_id, last_modification_date):
+        return await self.run(self.pubman_api.delete_item, item_id, last_modification_date)
+
+    async def delete_items(self, items):
+        """Delete (item_id, last_modification_date) pairs concurrently; returns one bool per item."""
+        return await asyncio.gather(*(self.delete_item(item_id, last_mod) for item_id, last_mod in items))
@@ -9,6 +9,7 @@ import pandas as pd
 from collections import OrderedDict, Counter
 import requests
 import unicodedata
+import hashlib
 import os
 import html
 import logging
@@ -20,11 +21,16 @@ from dataclasses import dataclass
 from typing import List, Dict, Tuple, Iterable, Optional
 
 from pubman_manager import create_sheet, Cell, ScopusManager, CrossrefManager, FILES_DIR, is_mpi_affiliation, get_user_cache_dir
-from pubman_manager.util import date_to_cell, load_yaml
+from pubman_manager.util import date_to_cell, load_yaml_derived
+from pubman_manager.pubman_base import criteria_key
+from pubman_manager.affiliation_decisions import get_decision_cache
 
 logger = logging.getLogger(__name__)
 
 AFFILIATION_MATCH_THRESHOLD = 90
+# Concurrent metadata requests in collect_data_for_dois; Scopus is additionally rate limited
+CROSSREF_WORKERS = 8
+SCOPUS_WORKERS = 4
 
 
 class DecisionColor(Enum):
@@ -65,6 +71,140 @@ def find_best_fuzzy_match(proposed: str, candidates: Iterable[str]) -> Tuple[Opt
     compare_error = (100 - score) / 100.0
     return (match if score >= AFFILIATION_MATCH_THRESHOLD else None), compare_error
 
+def build_affiliation_counters(authors_info):
+    """Per-author affiliation Counters and all MPI affiliations ranked by total count."""
+    authors_affiliation_counters = {
+        author: Counter(info["affiliation_counts"])
+        for author, info in authors_info.items()
+    }
+    mpi_affiliation_counter = Counter()
+    for author, counter in authors_affiliation_counters.items():
+        for affiliation, count in counter.items():
+            if 'Max-Planck' in affiliation:
+                mpi_affiliation_counter[affiliation] += count
+    mpi_affiliations = [item[0] for item in sorted(mpi_affiliation_counter.items(), key=lambda x: x[1], reverse=True)]
+    return authors_affiliation_counters, mpi_affiliations
+
+@dataclass(frozen=True)
+class RankedAffiliations:
+    """An author's PuRe affiliations by descending count, and the MPI / non-MPI subsets."""
+    ranked: Tuple[str, ...] = ()
+    mpi: Tuple[str, ...] = ()
+    external: Tuple[str, ...] = ()
+
+
+NO_AFFILIATIONS = RankedAffiliations()
+
+
+def build_ranked_affiliations(affiliation_counts_by_author) -> Dict[Tuple[str, str], RankedAffiliations]:
+    """RankedAffiliations per author from {author: {affiliation: count}}; ties keep the stored order."""
+    ranked_by_author = {}
+    for author, counts in affiliation_counts_by_author.items():
+        ranked = tuple(sorted(counts, key=lambda affiliation: counts.get(affiliation, 0), reverse=True))
+        ranked_by_author[author] = RankedAffiliations(
+            ranked=ranked,
+            mpi=tuple(a for a in ranked if is_mpi_affiliation(a)),
+            external=tuple(a for a in ranked if not is_mpi_affiliation(a)),
+        )
+    return ranked_by_author
+
+
+def normalize_name_for_comparison(name: str) -> str:
+    ascii_name = unicodedata.normalize("NFD", name).encode("ascii", "ignore").decode("utf-8")
+    spaced_hyphens = ascii_name.replace("-", " ")
+    camel_split = re.sub(r"([a-z])([A-Z])", r"\1 \2", spaced_hyphens)
+    stripped = camel_split.replace(".", "").lower()
+    return "".join(stripped.split())
+
+
+def _primary_first_name(first_name: str) -> str:
+    return (first_name.split() or [""])[0] if first_name else ""
+
+
+_UMLAUT_DIGRAPHS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "Ä": "Ae", "Ö": "Oe", "Ü": "Ue"})
+
+
+def transliteration_keys(name: str) -> frozenset:
+    """
+    ASCII keys of a name covering its transliterations: umlauts written as ae/oe/ue and
+    as plain vowels, ß as ss, other diacritics dropped, letters only. Spellings are
+    only folded where a diacritic is involved, so e.g. Xu and Xue stay apart.
+    """
+    return frozenset(
+        re.sub(r"[^a-z]", "", unidecode(variant).lower()) for variant in (name.translate(_UMLAUT_DIGRAPHS), name)
+    )
+
+
+def is_initials(first_name: str) -> bool:
+    """True for first names made of initials only, e.g. "L." or "J.-P."."""
+    parts = [part for part in re.split(r"[\s.\-]+", first_name or "") if part]
+    return bool(parts) and all(len(part) == 1 for part in parts)
+
+
+def _transliterated_name_keys(first_name: str, surname: str) -> set:
+    return {(last_key, first_key) for last_key in transliteration_keys(surname)
+            for first_key in transliteration_keys(first_name) if first_key}
+
+
+class AuthorNameIndex:
+    """
+    PuRe author names indexed by normalized (surname, first name) and by normalized
+    (surname, primary first name), so `resolve` is a dict lookup instead of a scan.
+
+    Names without an exact match can be looked up with `resolve_approximate`, which
+    only folds transliterations of the same name, e.g. Mueller and Müller.
+    """
+
+    def __init__(self, pure_author_names: Iterable[Tuple[str, str]]):
+        self.by_full_name: Dict[Tuple[str, str], Tuple[int, Tuple[str, str]]] = {}
+        self.by_primary_name: Dict[Tuple[str, str], Tuple[int, Tuple[str, str]]] = {}
+        self.by_transliterated_full_name: Dict[Tuple[str, str], Dict[Tuple[str, str], int]] = {}
+        self.by_transliterated_primary_name: Dict[Tuple[str, str], Dict[Tuple[str, str], int]] = {}
+        for position, (pure_first, pure_last) in enumerate(pure_author_names):
+            pure_last_key = normalize_name_for_comparison(pure_last)
+            entry = (position, (pure_first, pure_last))
+            self.by_full_name.setdefault((pure_last_key, normalize_name_for_comparison(pure_first)), entry)
+            self.by_primary_name.setdefault(
+                (pure_last_key, normalize_name_for_comparison(_primary_first_name(pure_first))), entry
+            )
+            for first_name, by_key in ((pure_first, self.by_transliterated_full_name),
+                                       (_primary_first_name(pure_first), self.by_transliterated_primary_name)):
+                for key in _transliterated_name_keys(first_name, pure_last):
+                    by_key.setdefault(key, {}).setdefault((pure_first, pure_last), position)
+
+    def resolve(self, first_name: str, surname: str) -> Optional[Tuple[str, str]]:
+        """The earliest PuRe name matching on the full or the primary first name, or None."""
+        surname_key = normalize_name_for_comparison(surname)
+        matches = [
+            match for match in (
+                self.by_full_name.get((surname_key, normalize_name_for_comparison(first_name))),
+                self.by_primary_name.get(
+                    (surname_key, normalize_name_for_comparison(_primary_first_name(first_name)))
+                ),
+            ) if match
+        ]
+        return min(matches)[1] if matches else None
+
+    def resolve_approximate(self, first_name: str, surname: str) -> Optional[Tuple[str, str]]:
+        """
+        The PuRe name that is a transliteration of `first_name` and `surname`, or None.
+
+        Transliterations of the full first name are tried before those of the primary
+        first name; several PuRe names matching equally well and first names given as
+        initials only are left unresolved.
+        """
+        if is_initials(first_name):
+            return None
+        for names, by_key in ((first_name, self.by_transliterated_full_name),
+                              (_primary_first_name(first_name), self.by_transliterated_primary_name)):
+            candidates = {}
+            for key in _transliterated_name_keys(names, surname):
+                candidates.update(by_key.get(key, {}))
+            if candidates:
+                return next(iter(candidates)) if len(candidates) == 1 else None
+        return None
+
+
 class DOIParser:
     def __init__(self, pubman_api, scopus_api_key = None):
         self.crossref_manager = CrossrefManager()
@@ -77,55 +217,98 @@ class DOIParser:
 
         self.pubman_api = pubman_api
         cache_dir = get_user_cache_dir(pubman_api.user_id)
-        raw_authors_info = load_yaml(cache_dir / 'authors_info.yaml')
-        self.authors_affiliation_counters = {
-            author: Counter(info["affiliation_counts"])
-            for author, info in raw_authors_info.items()
-        }
-        mpi_affiliation_counter = Counter()
-        for author, counter in self.authors_affiliation_counters.items():
-            for affiliation, count in counter.items():
-                if 'Max-Planck' in affiliation:
-                    mpi_affiliation_counter[affiliation] += count
-        self.mpi_affiliations = [item[0] for item in sorted(mpi_affiliation_counter.items(), key=lambda x: x[1], reverse=True)]
+        self.authors_affiliation_counters, self.mpi_affiliations = load_yaml_derived(
+            cache_dir / 'authors_info.yaml', 'affiliation_counters', build_affiliation_counters
+        )
+        self._author_name_index = load_yaml_derived(
+            cache_dir / 'authors_info.yaml', 'author_name_index', lambda authors_info: AuthorNameIndex(authors_info)
+        )
+        # content hash, so persisted affiliation decisions don't outlive the PuRe cache they were made with
+        self.authors_info_version = load_yaml_derived(
+            cache_dir / 'authors_info.yaml', 'version',
+            lambda authors_info: hashlib.sha256(repr(authors_info).encode("utf-8")).hexdigest()
+        )
+        self.decision_cache = get_decision_cache()
+        self._ranked_affiliations = load_yaml_derived(
+            cache_dir / 'authors_info.yaml', 'ranked_affiliations',
+            lambda authors_info: build_ranked_affiliations(
+                {author: info["affiliation_counts"] for author, info in authors_info.items()}
+            )
+        )
         self.af_id_ = None
 
+    @property
+    def author_name_index(self) -> AuthorNameIndex:
+        """AuthorNameIndex over the PuRe authors of authors_affiliation_counters."""
+        if getattr(self, '_author_name_index', None) is None:
+            self._author_name_index = AuthorNameIndex(self.authors_affiliation_counters)
+        return self._author_name_index
+
+    @property
+    def ranked_affiliations(self) -> Dict[Tuple[str, str], RankedAffiliations]:
+        """RankedAffiliations per PuRe author of authors_affiliation_counters."""
+        if getattr(self, '_ranked_affiliations', None) is None:
+            self._ranked_affiliations = build_ranked_affiliations(self.authors_affiliation_counters)
+        return self._ranked_affiliations
+
     def compare_author_name_to_pure_db(
         self,
-        pure_author_names: Iterable[Tuple[str, str]],
+        pure_author_names: Iterable[Tuple[str, str]] | AuthorNameIndex,
         first_name: str,
         surname: str,
     ) -> Tuple[str, str]:
         """
         Compare name to all authors in PuRe DB to make sure middle names or different writing styles match.
 
+        `pure_author_names` is best passed as a prebuilt AuthorNameIndex (see
+        `author_name_index`); plain name tuples are indexed on every call. Without an
+        exact match, transliteration variants are resolved approximately.
+
         Returns corrected name if correction was needed.
         """
-        def normalize_name_for_comparison(name: str) -> str:
-            ascii_name = unicodedata.normalize("NFD", name).encode("ascii", "ignore").decode("utf-8")
-            spaced_hyphens = ascii_name.replace("-", " ")
-            camel_split = re.sub(r"([a-z])([A-Z])", r"\1 \2", spaced_hyphens)
-            stripped = camel_split.replace(".", "").lower()
-            return "".join(stripped.split())
-
-        surname_key = normalize_name_for_comparison(surname)
-        first_name_key = normalize_name_for_comparison(first_name)
-        first_name_primary = first_name.split()[0] if first_name else ""
-        first_name_primary_key = normalize_name_for_comparison(first_name_primary)
-
-        for pure_first, pure_last in pure_author_names:
-            pure_last_key = normalize_name_for_comparison(pure_last)
-            pure_first_key = normalize_name_for_comparison(pure_first)
-            if surname_key == pure_last_key and first_name_key == pure_first_key:
-                return pure_first, pure_last
-            pure_first_primary = pure_first.split()[0] if pure_first else ""
-            pure_first_primary_key = normalize_name_for_comparison(pure_first_primary)
-            if surname_key == pure_last_key and first_name_primary_key == pure_first_primary_key:
-                return pure_first, pure_last
+        index = pure_author_names if isinstance(pure_author_names, AuthorNameIndex) else AuthorNameIndex(pure_author_names)
+        resolved = index.resolve(first_name, surname) or index.resolve_approximate(first_name, surname)
+        if resolved is not None:
+            return resolved
 
         first_name_without_middles = first_name.split()[0] if first_name else ""
         return first_name_without_middles, surname
 
+    def match_external_affiliation(
+        self,
+        author: Tuple[str, str],
+        publication_affiliation: str,
+        external_pure_affiliations: Iterable[str],
+        new_decisions: Optional[List[tuple]] = None,
+    ) -> AffiliationResult:
+        """
+        Fuzzy match a non-MPI publication affiliation against the author's non-MPI PuRe
+        affiliations (GREEN), or keep the normalized publication affiliation (GRAY).
+
+        Decisions are persisted in the decision cache for the current authors_info version,
+        or appended to `new_decisions` for the caller to store them in one batch.
+        """
+        decision_cache = getattr(self, 'decision_cache', None)
+        version = getattr(self, 'authors_info_version', None)
+        if decision_cache is not None and version:
+            decision = decision_cache.get(version, author, publication_affiliation)
+            if decision:
+                affiliation, color, compare_error = decision
+                return AffiliationResult(affiliation, DecisionColor[color], compare_error=compare_error)
+
+        best_match, compare_error = find_best_fuzzy_match(publication_affiliation, external_pure_affiliations)
+        if best_match:
+            result = AffiliationResult(best_match, DecisionColor.GREEN, compare_error=compare_error)
+        else:
+            result = AffiliationResult(normalize_affiliation(publication_affiliation), DecisionColor.GRAY)
+        if decision_cache is not None and version:
+            decision = (author, publication_affiliation, result.affiliation, result.color.name, result.compare_error)
+            if new_decisions is not None:
+                new_decisions.append(decision)
+            else:
+                decision_cache.put(version, *decision)
+        return result
+
     def compare_author_list_to_pure_db(
         self,
         affiliations_by_author_name: Dict[Tuple[str, str], List[str]],
@@ -157,21 +340,22 @@ class DOIParser:
 
         cache: Dict[str, str] = {}
         results_by_author: Dict[Tuple[str, str], List[AffiliationResult]] = {}
+        ranked_affiliations = self.ranked_affiliations
+        new_decisions: List[tuple] = []
 
         for (first_name, last_name), publication_affiliations in affiliations_by_author_name.items():
             resolved_author: Tuple[str, str] = self.compare_author_name_to_pure_db(
-                self.authors_affiliation_counters.keys(), first_name, last_name
+                self.author_name_index, first_name, last_name
             )
             author_results: List[AffiliationResult] = []
-            pure_affiliations: List[str] = sorted(self.authors_affiliation_counters.get(resolved_author, {}).keys(),
-                                                  key=lambda x: self.authors_affiliation_counters.get(resolved_author, {}).get(x, 0),
-                                                  reverse=True) if resolved_author in self.authors_affiliation_counters else []
+            author_affiliations = ranked_affiliations.get(resolved_author, NO_AFFILIATIONS)
+            pure_affiliations = author_affiliations.ranked
 
             for publication_affiliation in publication_affiliations:
                 is_mpi = is_mpi_affiliation(publication_affiliation)
 
                 if is_mpi:
-                    mpi_affiliations_for_author = [a for a in pure_affiliations if is_mpi_affiliation(a)]
+                    mpi_affiliations_for_author = author_affiliations.mpi
                     if mpi_affiliations_for_author:
                         # Pick the most frequent MPI affiliation for this author
                         author_results.append(AffiliationResult(mpi_affiliations_for_author[0], DecisionColor.PURPLE))
@@ -185,13 +369,11 @@ class DOIParser:
                     if publication_affiliation in cache:
                         author_results.append(AffiliationResult(cache[publication_affiliation], DecisionColor.GREEN))
                     else:
-                        external_pure_affiliations: List[str] = [affiliation for affiliation in pure_affiliations if not is_mpi_affiliation(affiliation)]
-                        best_match, compare_error = find_best_fuzzy_match(publication_affiliation, external_pure_affiliations)
-                        if best_match:
-                            cache[publication_affiliation] = best_match
-                            author_results.append(AffiliationResult(best_match, DecisionColor.GREEN, compare_error=compare_error))
-                        else:
-                            author_results.append(AffiliationResult(normalize_affiliation(publication_affiliation), DecisionColor.GRAY))
+                        result = self.match_external_affiliation(resolved_author, publication_affiliation,
+                                                                 author_affiliations.external, new_decisions)
+                        if result.color == DecisionColor.GREEN:
+                            cache[publication_affiliation] = result.affiliation
+                        author_results.append(result)
                 else:
                     author_results.append(AffiliationResult(normalize_affiliation(publication_affiliation), DecisionColor.GRAY))
 
@@ -200,27 +382,26 @@ class DOIParser:
                                                         color=DecisionColor.RED))
             results_by_author[resolved_author] = author_results
 
+        if new_decisions:
+            self.decision_cache.put_many(self.authors_info_version, new_decisions)
+
         # Post-processing: Ensure consistency across authors
         assigned_mpi = [res.affiliation for author_results in results_by_author.values() for res in author_results if res.color == DecisionColor.PURPLE and res.affiliation]
         if assigned_mpi:
             most_common_aff = Counter(assigned_mpi).most_common(1)[0][0]
             for author, author_results in results_by_author.items():
-                pure_affiliations = sorted(self.authors_affiliation_counters.get(author, {}).keys(), key=lambda x: self.authors_affiliation_counters.get(author, {}).get(x, 0), reverse=True) if author in self.authors_affiliation_counters else []
+                mpi_affiliations_for_author = ranked_affiliations.get(author, NO_AFFILIATIONS).mpi
                 for res in author_results:
                     # If an author's most common mpi group is not the same as the most common group from this publication,
                     # but the author has been part of this publication-specific group in the past, override common author group with common publication group
                     if res.color == DecisionColor.PURPLE and res.affiliation and res.affiliation != most_common_aff and \
-                        most_common_aff in [a for a in pure_affiliations if is_mpi_affiliation(a)]:
+                        most_common_aff in mpi_affiliations_for_author:
                         res.affiliation = most_common_aff
 
         # Assume that very similar affiliations overlap (see fuzz_threshold)
         canon: list[str] = []
         for _author, res_list in results_by_author.items():
-            pure_affiliations = sorted(
-                self.authors_affiliation_counters.get(_author, {}).keys(),
-                key=lambda x: self.authors_affiliation_counters.get(_author, {}).get(x, 0),
-                reverse=True
-            ) if _author in self.authors_affiliation_counters else []
+            pure_affiliations = ranked_affiliations.get(_author, NO_AFFILIATIONS).ranked
             allowed = set(pure_affiliations)
             allowed.update(res.affiliation for res in res_list if res.affiliation)
             for res in res_list:
@@ -283,25 +464,51 @@ class DOIParser:
             return False
 
     def has_pubman_entry(self, doi, title=None):
-        pub = self.pubman_api.search_publication_by_criteria({
-            "metadata.identifiers": {
-                "id": doi,
-                "type": "DOI",
-            }
-        })
-        if not pub and title:
+        return doi in self.has_pubman_entries([(doi, title)])
+
+    def has_pubman_entries(self, candidates: Iterable[Tuple[str, Optional[str]]]) -> set:
+        """
+        Check many (doi, title) pairs against PuRe with batched searches.
+
+        DOIs are looked up first; for DOIs without a match the title (or both title halves for
+        long titles) is searched instead. Returns the set of DOIs that already have an entry.
+        """
+        candidates = list(candidates)
+        if not candidates:
+            return set()
+
+        doi_criteria = {
+            doi: {"metadata.identifiers": {"id": doi, "type": "DOI"}}
+            for doi, _ in candidates
+        }
+        found = self.pubman_api.search_publications_by_criteria_batch(doi_criteria.values())
+        existing = {doi for doi, criteria in doi_criteria.items() if found.get(criteria_key(criteria))}
+
+        title_criteria = OrderedDict()
+        for doi, title in candidates:
+            if doi in existing or not title or doi in title_criteria:
+                continue
             logger.info(f'Unable to find DOI match in PuRe database, trying to find title instead: "{title}"')
             if len(title) < 50:
-                pub = self.pubman_api.search_publication_by_criteria({"metadata.title": title})
+                title_criteria[doi] = [{"metadata.title": title}]
             else:
                 title_words = title.split(' ')
-                pub_first_half = self.pubman_api.search_publication_by_criteria({"metadata.title": ' '.join(title_words[:int(len(title_words)//1.5)])})
-                pub_latter_half = self.pubman_api.search_publication_by_criteria({"metadata.title": ' '.join(title_words[int(len(title_words)//1.5):])})
-                if pub_first_half or pub_latter_half:
+                title_criteria[doi] = [
+                    {"metadata.title": ' '.join(title_words[:int(len(title_words)//1.5)])},
+                    {"metadata.title": ' '.join(title_words[int(len(title_words)//1.5):])},
+                ]
+        if title_criteria:
+            found = self.pubman_api.search_publications_by_criteria_batch(
+                [criteria for criteria_list in title_criteria.values() for criteria in criteria_list]
+            )
+            for doi, criteria_list in title_criteria.items():
+                hits = [found.get(criteria_key(criteria)) for criteria in criteria_list]
+                if len(criteria_list) == 1:
+                    if hits[0]:
+                        existing.add(doi)
+                elif any(hits):
                     logger.info(f'Found Title match in Database, ignoring new entry')
-                else:
-                    pub = pub_first_half if pub_first_half else pub_latter_half
-        return bool(pub)
+        return existing
 
     def get_dois_for_author(
         self,
@@ -329,21 +536,15 @@ class DOIParser:
         return list(set(dois_crossref).union(set(dois_scopus)))
 
     def collect_data_for_dois(self, dois_crossref: List[str], dois_scopus: List[str]) -> pd.DataFrame:
-        results = {}
-        dois_to_process = list(set(list(dois_crossref) + list(dois_scopus)))
-        for doi in dois_to_process:
-            crossref_result = self.crossref_manager.get_overview(doi)
-            results[doi] = crossref_result
-        # with ThreadPoolExecutor(max_workers=2) as executor:
-        #     futures = {executor.submit(self.crossref_manager.get_overview, doi): doi
-        #             for doi in [d for d in dois_to_process if d in dois_crossref and d not in dois_to_skip]}
-        #     for future in as_completed(futures):
-        #         doi = futures[future]
-        #         crossref_result = future.result()
-        #         print("crossref_result",crossref_result)
-        #         results[doi] = crossref_result
-        for doi in dois_to_process:
-            scopus_result = self.scopus_manager.get_overview(doi)
+        dois_to_process = list(dict.fromkeys(list(dois_crossref) + list(dois_scopus)))
+        # Crossref and Scopus are queried at the same time, each with its own worker limit
+        with ThreadPoolExecutor(max_workers=CROSSREF_WORKERS) as crossref_executor, \
+                ThreadPoolExecutor(max_workers=SCOPUS_WORKERS) as scopus_executor:
+            crossref_results = crossref_executor.map(self.crossref_manager.get_overview, dois_to_process)
+            scopus_results = scopus_executor.map(self.scopus_manager.get_overview, dois_to_process)
+            results = dict(zip(dois_to_process, crossref_results))
+            scopus_results = list(scopus_results)
+        for doi, scopus_result in zip(dois_to_process, scopus_results):
             if scopus_result:
                 if doi not in results:
                     results[doi] = scopus_result
@@ -372,6 +573,26 @@ class DOIParser:
         Returns a list of processed publication dicts that can be converted to table rows.
         """
         processed: List[OrderedDict[str, Tuple[str, int, str]]] = []
+
+        def clean_html(raw_html):
+            soup = BeautifulSoup(raw_html, "html.parser")
+            cleaned = str(soup).strip()
+            cleaned = ' '.join(cleaned.split())
+            return cleaned
+
+        def pubman_title(crossref_metadata):
+            return html.unescape(unidecode(clean_html(crossref_metadata.get('title', [None])[0])))
+
+        # Look up all candidate publications in PuRe with a few batched searches up front
+        existence_candidates = []
+        for _, row in dois_data.iterrows():
+            if (row['Field'] and not force) or not row['crossref']:
+                continue
+            crossref_metadata = self.crossref_manager.get_metadata(row['DOI'])
+            if crossref_metadata and crossref_metadata.get('title'):
+                existence_candidates.append((row['DOI'], pubman_title(crossref_metadata)))
+        existing_in_pubman = self.has_pubman_entries(existence_candidates)
+
         for index, row in dois_data.iterrows():
             if row['Field'] and not force:
                 logger.info(f'Skipping {row["DOI"]}, reason: {row["Field"]}')
@@ -381,12 +602,6 @@ class DOIParser:
 
             logger.debug(f"Processing Publication DOI {doi}")
 
-            def clean_html(raw_html):
-                soup = BeautifulSoup(raw_html, "html.parser")
-                cleaned = str(soup).strip()
-                cleaned = ' '.join(cleaned.split())
-                return cleaned
-
             if not row['crossref']:
                 logger.warning(f'Publication {row["DOI"]} has no crossref entry, ignoring for now...')
                 continue
@@ -415,8 +630,8 @@ class DOIParser:
             if skip:
                 continue
 
-            title = html.unescape(unidecode(clean_html(crossref_metadata.get('title', [None])[0])))
-            if self.has_pubman_entry(doi, title=title):
+            title = pubman_title(crossref_metadata)
+            if doi in existing_in_pubman:
                 logger.info(f'Skipping {doi}, already exists in PuRe')
                 continue
             license_list = crossref_metadata.get('license')
@@ -0,0 +1,278 @@
+import random
+import threading
+import time
+import logging
+
+from contextlib import contextmanager, nullcontext
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 16
+DEFAULT_TIMEOUT = (10, 300)  # (connect, read) in seconds
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# PuRe's PUT/DELETE calls change item state, a retry after a lost response could repeat them
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised without contacting the host while its circuit breaker is open."""
+
+
+class RetryPolicy:
+    """
+    How often and how long to retry transient failures.
+
+    Connection errors, timeouts and RETRY_STATUSES responses are retried up to
+    `max_retries` times with exponential backoff and full jitter, honoring Retry-After.
+    The summed wait of one call never exceeds `max_retry_time` seconds; if the server asks
+    for a longer wait, the last response is returned instead.
+    """
+
+    def __init__(self, max_retries=4, backoff_base=1.0, backoff_max=30.0, max_retry_time=120.0,
+                 statuses=RETRY_STATUSES):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_time = max_retry_time
+        self.statuses = frozenset(statuses)
+
+    def backoff(self, attempt):
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
+def retry_after_seconds(response):
+    """Parse a Retry-After header (seconds or HTTP date); None if absent or invalid."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Spaces out request starts by at least `min_interval` seconds across threads.
+
+    Each caller reserves the next free slot and sleeps until it outside the lock, so
+    requests may overlap while their start times still respect the limit.
+    """
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker: after `failure_threshold` consecutive transient failures
+    the host is skipped for `reset_timeout` seconds, then a single trial call decides
+    whether it is closed again.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+        self._trial_thread = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_timeout and not self.trial_running:
+                self.trial_running = True
+                self._trial_thread = threading.get_ident()
+                return True
+            return False
+
+    def end_trial(self):
+        """Let the next trial call through if this thread's trial ended without a verdict."""
+        with self._lock:
+            if self._trial_thread == threading.get_ident():
+                self.trial_running = False
+                self._trial_thread = None
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+            self._trial_thread = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.trial_running = False
+            self._trial_thread = None
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+class PooledSession(requests.Session):
+    """
+    requests.Session with a bounded keep-alive connection pool, a default timeout and
+    retries with a per-host circuit breaker.
+
+    Connections to the same host are reused across calls, so only the first request
+    pays for the TCP/TLS handshake. When all `pool_size` connections are busy, further
+    requests wait for a free connection instead of opening throwaway ones.
+
+    Only GET, HEAD and OPTIONS are retried unless the request is sent within
+    `policy(idempotent=True)` (e.g. POST searches). The policy's `give_up(response)` marks
+    a retryable status as final, e.g. an exhausted API quota, and its `rate_limiter` is
+    waited for before every attempt, retries included. `request` keeps the signature of
+    requests.Session, so callers work with any session (see `request_policy`).
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, retry=None,
+                 failure_threshold=5, reset_timeout=30.0):
+        super().__init__()
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retry = retry or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers = {}
+        self._breakers_lock = threading.Lock()
+        self._local = threading.local()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self.headers["Connection"] = "keep-alive"
+
+    def breaker(self, url):
+        host = urlsplit(url).netloc
+        with self._breakers_lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self._breakers[host] = breaker
+            return breaker
+
+    @contextmanager
+    def policy(self, idempotent=None, give_up=None, rate_limiter=None):
+        """Retry policy for the requests this thread sends within the block."""
+        previous = getattr(self._local, "policy", None)
+        self._local.policy = (idempotent, give_up, rate_limiter)
+        try:
+            yield
+        finally:
+            self._local.policy = previous
+
+    def request(self, method, url, **kwargs):
+        idempotent, give_up, rate_limiter = getattr(self._local, "policy", None) or (None, None, None)
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        max_retries = self.retry.max_retries if idempotent else 0
+        breaker = self.breaker(url)
+        waited = 0.0
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {urlsplit(url).netloc}, skipping {method} {url}")
+            if rate_limiter is not None:
+                rate_limiter.wait()
+            try:
+                response = super().request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record_failure(breaker, url)
+                delay = self.retry.backoff(attempt)
+                if attempt >= max_retries or waited + delay > self.retry.max_retry_time:
+                    raise
+                logger.warning(f"{method} {url} failed ({e}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in self.retry.statuses:
+                    breaker.record_success()
+                    return response
+                if give_up is not None and give_up(response):
+                    return response
+                self._record_failure(breaker, url)
+                delay = retry_after_seconds(response)
+                if delay is None:
+                    delay = self.retry.backoff(attempt)
+                if attempt >= max_retries or waited + delay > self.retry.max_retry_time:
+                    return response
+                logger.warning(f"{method} {url} returned {response.status_code}, retrying in {delay:.1f}s")
+                response.close()
+            finally:
+                # other errors and give_up responses don't decide the trial, free it for the next call
+                breaker.end_trial()
+            time.sleep(delay)
+            waited += delay
+            attempt += 1
+
+    def _record_failure(self, breaker, url):
+        if breaker.record_failure():
+            logger.error(f"Circuit opened for {urlsplit(url).netloc} for {self.reset_timeout}s")
+
+
+def request_policy(session, idempotent=None, give_up=None, rate_limiter=None):
+    """
+    `session.policy(...)` for sessions that retry (see PooledSession). Other sessions
+    send a single attempt, so they only wait for `rate_limiter` once.
+    """
+    policy = getattr(session, "policy", None)
+    if policy is not None:
+        return policy(idempotent=idempotent, give_up=give_up, rate_limiter=rate_limiter)
+    if rate_limiter is not None:
+        rate_limiter.wait()
+    return nullcontext()
+
+
+def get_session(name="pubman"):
+    """
+    Return the process-wide session for `name` (one pool per remote service).
+    """
+    with _sessions_lock:
+        session = _sessions.get(name)
+        if session is None:
+            session = PooledSession()
+            _sessions[name] = session
+        return session
+
+
+def configure_session(name="pubman", pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, retry=None):
+    """
+    Replace the shared session for `name` with one using the given pool size, timeout
+    and RetryPolicy.
+    Instances created afterwards pick up the new session; open connections of the old
+    one are closed.
+    """
+    with _sessions_lock:
+        old = _sessions.get(name)
+        _sessions[name] = PooledSession(pool_size=pool_size, timeout=timeout, retry=retry)
+    if old is not None:
+        old.close()
+    logger.debug(f"Configured '{name}' session: pool_size={pool_size}, timeout={timeout}")
+    return _sessions[name]
@@ -0,0 +1,121 @@
+import codecs
+import json
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+# Consumed text is dropped from the buffer once it grows beyond this
+_COMPACT_SIZE = 1 << 16
+
+
+class JSONStream:
+    """
+    Incremental parser for a JSON object arriving in byte chunks (e.g. a streamed HTTP body).
+
+    Elements of the arrays at `array_paths` (tuples of keys, e.g. ("hits", "hits")) are
+    yielded one by one as soon as they are complete, so the caller never holds the
+    whole document. Everything else is collected into `document`, where the streamed
+    arrays appear empty; it is complete once iteration has finished.
+    """
+
+    def __init__(self, chunks, array_paths):
+        self.chunks = iter(chunks)
+        self.array_paths = [tuple(path) for path in array_paths]
+        self.document = {}
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self):
+        self._expect("{")
+        yield from self._object((), self.document)
+        self._skip_whitespace()
+        if self._pos < len(self._buffer):
+            raise ValueError(f"Unexpected data after JSON document: {self._buffer[self._pos:self._pos + 20]!r}")
+
+    def _fill(self):
+        for chunk in self.chunks:
+            if not chunk:
+                continue
+            text = self._text.decode(chunk) if isinstance(chunk, bytes) else chunk
+            if self._pos > _COMPACT_SIZE:
+                self._buffer = self._buffer[self._pos:]
+                self._pos = 0
+            self._buffer += text
+            return True
+        self._buffer += self._text.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def _skip_whitespace(self):
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return
+
+    def _peek(self):
+        self._skip_whitespace()
+        if self._pos >= len(self._buffer):
+            raise ValueError("Unexpected end of JSON stream")
+        return self._buffer[self._pos]
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError(f"Expected {char!r} at {self._buffer[self._pos:self._pos + 20]!r}")
+        self._pos += 1
+
+    def _value(self):
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # a number at the end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            self._fill()
+
+    def _object(self, path, target):
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            key_path = path + (key,)
+            start = self._peek()
+            if start == "[" and key_path in self.array_paths:
+                target[key] = []
+                self._pos += 1
+                yield from self._array()
+            elif start == "{" and any(p[:len(key_path)] == key_path for p in self.array_paths):
+                target[key] = {}
+                self._pos += 1
+                yield from self._object(key_path, target[key])
+            else:
+                target[key] = self._value()
+            separator = self._peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' in JSON object, got {separator!r}")
+
+    def _array(self):
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            separator = self._peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {separator!r}")
+
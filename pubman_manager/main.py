@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +14,11 @@ import pandas as pd
 from .pubman_extractor import PubmanExtractor
 from .doi_parser import DOIParser
 from .pubman_creator import PubmanCreator
+from .async_pubman_base import AsyncPubmanBase, run_sync
+from .pubman_base import criteria_key
+from .publication_store import PUBLICATIONS_STORE_FILE
+from .organization_directory import OrganizationDirectory
+from . import org_cache
 from . import PUBLICATIONS_DIR, FILES_DIR, get_user_cache_dir
 from .talk_template import (
     TALK_TEMPLATE_COLUMN_DETAILS,
@@ -120,11 +126,13 @@ def generate_author_overview(
         )
         existing_in_pure = set()
         if dois_data is not None:
+            candidates = []
             for _, row in dois_data.iterrows():
                 doi_value = row.get("DOI")
                 title_value = row.get("Title")
-                if doi_value and title_value and not pd.isna(title_value) and doi_parser.has_pubman_entry(str(doi_value), title=title_value):
-                    existing_in_pure.add(str(doi_value))
+                if doi_value and title_value and not pd.isna(title_value):
+                    candidates.append((str(doi_value), title_value))
+            existing_in_pure = doi_parser.has_pubman_entries(candidates)
         collected_dois.update(new_dois - existing_in_pure)
         if dois_data is not None:
             table_overview = doi_parser.process_dois(dois_data)
@@ -165,40 +173,59 @@ def generate_doi_overview(
     return output_path
 
 
-def refresh_pubman_cache_for_user(user_id: str, org_ids: Iterable[str]) -> Path:
+# Organizations refreshed from PuRe at the same time
+FETCH_WORKERS = 4
+# Per-user corpus files from before the shared org cache
+LEGACY_CACHE_FILES = ("publications.yaml", PUBLICATIONS_STORE_FILE, "refresh_state.yaml")
+
+
+def refresh_pubman_cache_for_user(user_id: str, org_ids: Iterable[str], incremental: bool = True,
+                                  workers: int = 1) -> Path:
+    """
+    Refresh the user's PuRe cache (derived authors/org/journal data).
+
+    The raw corpus of every org is shared by all users (see org_cache). With
+    `incremental`, only publications modified since the last refresh of an org (by any
+    user) are downloaded and merged into it. The orgs are refreshed concurrently,
+    FETCH_WORKERS at a time. The derived files are built once per combination of org
+    corpora and hard linked into the user's cache dir; publications shared by several
+    orgs are counted once. Affiliation clustering runs serially unless `workers` > 1
+    processes are requested.
+    """
     org_ids = list(dict.fromkeys(org_ids))
     if not org_ids:
         raise ValueError("department_org_ids missing in user yaml.")
 
     pubman_api = PubmanExtractor()
-    raw_departments = pubman_api.fetch_all_organizations()
-    mpg_department_ids_by_name = {
-        str(k): (str(v) if v is not None else "")
-        for k, v in (raw_departments or {}).items()
-        if k is not None
-    }
-
-    publications = []
-    for org_id in org_ids:
-        publications.extend(pubman_api.search_publications_by_organization(org_id, size=200000))
-
+    with OrganizationDirectory() as directory:
+        directory.refresh(pubman_api)
+        mpg_department_ids_by_name = directory.as_mapping()
     cache_dir = get_user_cache_dir(user_id)
     cache_dir.mkdir(parents=True, exist_ok=True)
     save_yaml(mpg_department_ids_by_name, cache_dir / "mpg_departments.yaml")
-    save_yaml(publications, cache_dir / "publications.yaml")
-    save_yaml(pubman_api.extract_authors_info(publications), cache_dir / "authors_info.yaml")
-    save_yaml(pubman_api.extract_organization_mapping(publications), cache_dir / "identifier_paths.yaml")
-    save_yaml(pubman_api.extract_journals(publications), cache_dir / "journals.yaml")
+
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(org_ids))) as executor:
+        content_hashes = dict(zip(org_ids, executor.map(
+            lambda org_id: org_cache.refresh_org_corpus(pubman_api, org_id, incremental=incremental), org_ids
+        )))
+
+    # authors_info.yaml, identifier_paths.yaml, journals.yaml
+    with org_cache.views_lock():
+        view_dir = org_cache.build_view(pubman_api, content_hashes, workers=workers)
+        org_cache.link_view(view_dir, cache_dir)
+    for name in LEGACY_CACHE_FILES:
+        (cache_dir / name).unlink(missing_ok=True)
+    org_cache.prune_views()
     return cache_dir
 
 
-def refresh_pubman_cache(user_yaml_path: Path) -> Path:
+def refresh_pubman_cache(user_yaml_path: Path, incremental: bool = True, workers: int = 1) -> Path:
     user_data = load_user_config(user_yaml_path)
     if not isinstance(user_data, dict):
         raise ValueError("User yaml must be a dict with department_org_ids.")
     org_ids = user_data.get("department_org_ids", [])
     user_id = normalize_user_id(user_yaml_path.parent.name.replace("user_", "", 1))
-    return refresh_pubman_cache_for_user(user_id, org_ids)
+    return refresh_pubman_cache_for_user(user_id, org_ids, incremental=incremental, workers=workers)
 
 
 def generate_talks_template(
@@ -311,6 +338,7 @@ def delete_publications_by_dois(
     dry_run: bool = False,
 ) -> dict:
     pubman_api = PubmanCreator()
+    async_api = AsyncPubmanBase(pubman_api)
     dois_list = [str(doi).strip() for doi in dois if str(doi).strip()]
     missing = []
     deleted = 0
@@ -318,9 +346,12 @@ def delete_publications_by_dois(
     found = 0
     skipped_ctx = 0
 
+    criteria_by_doi = {doi: {"metadata.identifiers": {"id": doi, "type": "DOI"}} for doi in dois_list}
+    records_by_criteria = pubman_api.search_publications_by_criteria_batch(criteria_by_doi.values())
+
+    to_delete = []
     for doi in dois_list:
-        criteria = {"metadata.identifiers": {"id": doi, "type": "DOI"}}
-        records = pubman_api.search_publication_by_criteria(criteria) or []
+        records = records_by_criteria.get(criteria_key(criteria_by_doi[doi]), [])
         if not records:
             missing.append(doi)
             continue
@@ -339,7 +370,11 @@ def delete_publications_by_dois(
                 failed += 1
                 logger.info(f"Missing item metadata for DOI {doi}: {data}")
                 continue
-            if pubman_api.delete_item(item_id, last_mod):
+            to_delete.append((item_id, last_mod))
+
+    if to_delete:
+        for deleted_ok in run_sync(async_api.delete_items(to_delete)):
+            if deleted_ok:
                 deleted += 1
             else:
                 failed += 1
@@ -0,0 +1,218 @@
+import fcntl
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import logging
+
+from contextlib import contextmanager
+from itertools import chain
+
+from pubman_manager import USER_DATA_DIR
+from pubman_manager.publication_store import PublicationStore, PUBLICATIONS_STORE_FILE
+from pubman_manager.pubman_extractor import reduce_publications, CORPUS_SOURCE_FIELDS
+from pubman_manager.util import save_yaml, load_yaml, later_date
+
+logger = logging.getLogger(__name__)
+
+# Shared by all users: one corpus per organization, one derived snapshot per set of corpora
+ORG_CACHE_DIR = USER_DATA_DIR / "org_cache"
+ORG_STATE_FILE = "refresh_state.yaml"
+ORG_LOCK_FILE = ".lock"
+VIEWS_LOCK_FILE = ".lock"
+# Incremental refreshes never see publications that left an org, so the corpus is
+# downloaded anew when its last full refresh is older than this
+FULL_REFRESH_INTERVAL = 7 * 24 * 3600
+# Bump when the derived files change, so existing views aren't reused
+VIEW_VERSION = 1
+# Unreferenced views younger than this are kept, they may be about to be linked
+VIEW_GRACE_PERIOD = 3600
+
+_org_locks = {}
+_org_locks_lock = threading.Lock()
+
+
+@contextmanager
+def _org_lock(org_id):
+    """Serialize refreshes of one org corpus across threads (in-process lock) and processes (file lock)."""
+    with _org_locks_lock:
+        thread_lock = _org_locks.setdefault(org_id, threading.Lock())
+    with thread_lock, open(org_corpus_dir(org_id) / ORG_LOCK_FILE, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+@contextmanager
+def views_lock(exclusive=False, blocking=True):
+    """
+    File lock over the views dir: building and linking a view hold it shared, pruning
+    holds it exclusively, so no view is removed between being found and being linked.
+    Without `blocking`, raises BlockingIOError if the lock is taken.
+    """
+    views_dir().mkdir(parents=True, exist_ok=True)
+    with open(views_dir() / VIEWS_LOCK_FILE, "a") as lock_file:
+        fcntl.flock(lock_file, (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | (0 if blocking else fcntl.LOCK_NB))
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _save_state(state, state_path):
+    """Write the refresh state atomically, so a crash never leaves a truncated file behind."""
+    fd, tmp_name = tempfile.mkstemp(prefix=f"{state_path.name}.", suffix=".tmp", dir=state_path.parent)
+    os.close(fd)
+    try:
+        save_yaml(state, tmp_name)
+        os.replace(tmp_name, state_path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
+def org_corpus_dir(org_id):
+    return ORG_CACHE_DIR / "orgs" / re.sub(r"[^\w.-]", "_", str(org_id))
+
+
+def views_dir():
+    return ORG_CACHE_DIR / "views"
+
+
+def refresh_org_corpus(extractor, org_id, incremental=True):
+    """
+    Bring the shared corpus of `org_id` up to date and return its content hash.
+
+    With `incremental`, only publications modified since the previous refresh (by any
+    user) are downloaded and merged; otherwise, and once the last full refresh is older
+    than FULL_REFRESH_INTERVAL, the corpus is downloaded anew. The corpus and its
+    high-water mark only change once the whole scroll has been received.
+    """
+    corpus_dir = org_corpus_dir(org_id)
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    store_path = corpus_dir / PUBLICATIONS_STORE_FILE
+    state_path = corpus_dir / ORG_STATE_FILE
+    with _org_lock(org_id):
+        state = {}
+        if incremental and store_path.exists() and state_path.exists():
+            state = load_yaml(state_path) or {}
+            if time.time() - state.get("full_refresh_at", 0) >= FULL_REFRESH_INTERVAL:
+                state = {}
+        modified_since = state.get("high_water_mark")
+        full_refresh_at = state.get("full_refresh_at") if modified_since else time.time()
+        latest = modified_since
+
+        def _iter_org():
+            nonlocal latest
+            for record in extractor.iter_publications_by_organization(org_id, modified_since=modified_since,
+                                                                      source=CORPUS_SOURCE_FIELDS):
+                latest = later_date(latest, (record.get("data", {}) or {}).get("lastModificationDate"))
+                yield record
+
+        if modified_since:
+            count = PublicationStore.merge(store_path, _iter_org())
+            logger.info(f"{org_id}: merged changes since {modified_since}, {count} publications cached")
+        else:
+            count = PublicationStore.replace(store_path, _iter_org())
+            logger.info(f"{org_id}: full refresh, {count} publications cached")
+        with PublicationStore(store_path) as store:
+            content_hash = store.content_hash()
+        _save_state({"high_water_mark": latest, "content_hash": content_hash, "full_refresh_at": full_refresh_at},
+                    state_path)
+        return content_hash
+
+
+def _file_hash(path):
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def view_key(content_hashes, input_files=()):
+    """Key of the derived snapshot for {org_id: content_hash} and the reducers' `input_files`."""
+    payload = json.dumps([VIEW_VERSION, sorted(content_hashes.items()),
+                          sorted((str(path), _file_hash(path)) for path in input_files)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def build_view(extractor, content_hashes, workers=1):
+    """
+    Return the directory with the derived cache files for the orgs in `content_hashes`,
+    building it from their corpora unless a view with the same key exists. Publications
+    shared by several orgs are counted once. Call it under `views_lock` and link the
+    view before releasing the lock.
+    """
+    reducers = extractor.cache_reducers(workers=workers)
+    input_files = {path for reducer in reducers.values() for path in reducer.input_files}
+    view_dir = views_dir() / view_key(content_hashes, input_files)
+    if view_dir.exists():
+        logger.info(f"Reusing cached view {view_dir.name}")
+        return view_dir
+
+    org_ids = sorted(content_hashes)
+    stores = [PublicationStore(org_corpus_dir(org_id) / PUBLICATIONS_STORE_FILE) for org_id in org_ids]
+    try:
+        results = reduce_publications(chain.from_iterable(store.iter_records() for store in stores),
+                                      reducers, unique=True)
+    finally:
+        for store in stores:
+            store.close()
+
+    tmp_dir = view_dir.with_name(f"{view_dir.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    for name, result in results.items():
+        save_yaml(result, tmp_dir / f"{name}.yaml")
+    try:
+        os.replace(tmp_dir, view_dir)
+    except OSError:
+        # built concurrently by someone else
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    logger.info(f"Built view {view_dir.name} for {org_ids}")
+    return view_dir
+
+
+def link_view(view_dir, cache_dir):
+    """
+    Point the derived files in a user's `cache_dir` to `view_dir`. Files are hard links,
+    so readers see regular files and a view stays alive while any user links to it.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for source in view_dir.glob("*.yaml"):
+        target = cache_dir / source.name
+        tmp_target = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_target.unlink(missing_ok=True)
+        try:
+            os.link(source, tmp_target)
+        except OSError:
+            shutil.copyfile(source, tmp_target)
+        os.replace(tmp_target, target)
+
+
+def prune_views(grace_period=None):
+    """
+    Remove views no user links to anymore. Returns the number of removed views; while
+    views are being built or linked, nothing is pruned.
+    """
+    grace_period = VIEW_GRACE_PERIOD if grace_period is None else grace_period
+    if not views_dir().exists():
+        return 0
+    removed = 0
+    now = time.time()
+    try:
+        with views_lock(exclusive=True, blocking=False):
+            for view_dir in views_dir().iterdir():
+                if not view_dir.is_dir() or now - view_dir.stat().st_mtime < grace_period:
+                    continue
+                if all(path.stat().st_nlink <= 1 for path in view_dir.iterdir()):
+                    shutil.rmtree(view_dir, ignore_errors=True)
+                    removed += 1
+    except BlockingIOError:
+        logger.info("Views are in use, skipping pruning")
+    return removed
@@ -0,0 +1,120 @@
+import fcntl
+import sqlite3
+import logging
+
+from contextlib import contextmanager
+from pathlib import Path
+
+from pubman_manager import USER_DATA_DIR
+from pubman_manager.pubman_extractor import record_organizations
+from pubman_manager.util import later_date
+
+logger = logging.getLogger(__name__)
+
+# Shared by all users: the PuRe organization names don't depend on who asks
+ORGANIZATIONS_FILE = USER_DATA_DIR / "organizations.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS organization_names (
+    name TEXT PRIMARY KEY,
+    org_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_organization_names_id ON organization_names (org_id);
+CREATE TABLE IF NOT EXISTS directory_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class OrganizationDirectory:
+    """
+    Local directory of PuRe organizations (name <-> id), built from the creators'
+    organizations of all items.
+
+    `refresh` scrolls over all items projected to their organization fields; later
+    refreshes only fetch items modified since the previous one. A name always maps to
+    the id it was last seen with. Only one process refreshes at a time.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path or ORGANIZATIONS_FILE)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # writes from concurrent processes wait for each other; they're short, see `refresh`
+        self.conn = sqlite3.connect(self.path, timeout=60)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM organization_names").fetchone()[0]
+
+    @property
+    def high_water_mark(self):
+        row = self.conn.execute("SELECT value FROM directory_state WHERE key = 'high_water_mark'").fetchone()
+        return row[0] if row else None
+
+    @contextmanager
+    def _refresh_lock(self):
+        """Serialize refreshes across processes (file lock next to the database)."""
+        with open(self.path.with_name(f"{self.path.name}.lock"), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def refresh(self, extractor, full=False):
+        """
+        Update the directory from PuRe via `extractor` (a PubmanExtractor). Returns the number of names.
+
+        Concurrent refreshes wait for each other and then continue from the mark the
+        previous one left, so all of PuRe is scrolled only once. The scroll runs outside
+        of any transaction and readers aren't locked out meanwhile; the collected names
+        and the new high-water mark are written in one short transaction once the scroll
+        is complete. A failed scroll raises and leaves the directory unchanged.
+        """
+        with self._refresh_lock():
+            return self._refresh(extractor, full)
+
+    def _refresh(self, extractor, full):
+        since = None if full else self.high_water_mark
+        latest = since
+        org_ids_by_name = {}
+        for record in extractor.iter_organization_records(modified_since=since):
+            latest = later_date(latest, record.get('data', {}).get('lastModificationDate'))
+            org_ids_by_name.update(record_organizations(record))
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO organization_names (name, org_id) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET org_id = excluded.org_id",
+                org_ids_by_name.items(),
+            )
+            if latest:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO directory_state (key, value) VALUES ('high_water_mark', ?)", (latest,)
+                )
+        count = len(self)
+        logger.info(f"Organization directory refreshed {'fully' if since is None else f'since {since}'}: {count} names")
+        return count
+
+    def get_id(self, name):
+        row = self.conn.execute("SELECT org_id FROM organization_names WHERE name = ?", (name.strip(),)).fetchone()
+        return row[0] if row else None
+
+    def get_names(self, org_id):
+        rows = self.conn.execute(
+            "SELECT name FROM organization_names WHERE org_id = ? ORDER BY name", (org_id,)
+        ).fetchall()
+        return [name for (name,) in rows]
+
+    def as_mapping(self):
+        """name -> org_id for all organizations, sorted by name."""
+        return dict(self.conn.execute("SELECT name, org_id FROM organization_names ORDER BY name"))
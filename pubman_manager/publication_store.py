@@ -0,0 +1,219 @@
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import zlib
+import logging
+
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PUBLICATIONS_STORE_FILE = "publications.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS publications (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    object_id TEXT NOT NULL UNIQUE,
+    last_modified TEXT,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS publication_dois (
+    doi TEXT NOT NULL,
+    object_id TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS publication_orgs (
+    org_id TEXT NOT NULL,
+    object_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_publication_dois ON publication_dois (doi);
+CREATE INDEX IF NOT EXISTS idx_publication_dois_object ON publication_dois (object_id);
+CREATE INDEX IF NOT EXISTS idx_publication_orgs ON publication_orgs (org_id);
+CREATE INDEX IF NOT EXISTS idx_publication_orgs_object ON publication_orgs (object_id);
+"""
+
+
+def _encode(record):
+    return zlib.compress(json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def _decode(blob):
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def _record_data(record):
+    return record.get("data", {}) or {}
+
+
+def _record_dois(record):
+    metadata = _record_data(record).get("metadata", {}) or {}
+    return {
+        str(identifier.get("id")).strip().lower()
+        for identifier in metadata.get("identifiers", []) or []
+        if identifier.get("type") == "DOI" and identifier.get("id")
+    }
+
+
+def _record_org_ids(record):
+    metadata = _record_data(record).get("metadata", {}) or {}
+    org_ids = set()
+    for creator in metadata.get("creators", []) or []:
+        for org in (creator.get("person", {}) or {}).get("organizations", []) or []:
+            if org.get("identifier"):
+                org_ids.add(org["identifier"])
+            org_ids.update(path for path in org.get("identifierPath", []) or [] if path)
+    return org_ids
+
+
+def is_withdrawn(record):
+    data = _record_data(record)
+    return "WITHDRAWN" in (data.get("versionState"), data.get("publicState"))
+
+
+def _tmp_store_path(path):
+    """A fresh temporary file next to `path`, unique across threads and processes."""
+    fd, tmp_name = tempfile.mkstemp(prefix=f"{path.name}.", suffix=".tmp", dir=path.parent)
+    os.close(fd)
+    return Path(tmp_name)
+
+
+class PublicationStore:
+    """
+    On-disk store of raw PuRe records (the refresh corpus).
+
+    Records are kept as compressed JSON in SQLite, keyed by objectId and indexed by DOI and
+    by every organization id in the creators' identifier paths. Iteration streams records
+    in insertion order. Writers build a copy next to the target and move it into place,
+    so readers never see a half-written store.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM publications").fetchone()[0]
+
+    def iter_records(self, batch_size=500):
+        cursor = self.conn.execute("SELECT data FROM publications ORDER BY seq")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for (blob,) in rows:
+                yield _decode(blob)
+
+    def content_hash(self):
+        """Hash over all (objectId, lastModificationDate) pairs; changes whenever the content does."""
+        digest = hashlib.sha256()
+        for object_id, last_modified in self.conn.execute(
+            "SELECT object_id, last_modified FROM publications ORDER BY object_id"
+        ):
+            digest.update(f"{object_id}\t{last_modified}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, object_id):
+        row = self.conn.execute("SELECT data FROM publications WHERE object_id = ?", (object_id,)).fetchone()
+        return _decode(row[0]) if row else None
+
+    def find_by_doi(self, doi):
+        rows = self.conn.execute(
+            "SELECT p.data FROM publications p JOIN publication_dois d ON d.object_id = p.object_id "
+            "WHERE d.doi = ? ORDER BY p.seq",
+            (str(doi).strip().lower(),),
+        ).fetchall()
+        return [_decode(blob) for (blob,) in rows]
+
+    def iter_by_org(self, org_id, batch_size=500):
+        cursor = self.conn.execute(
+            "SELECT p.data FROM publications p JOIN publication_orgs o ON o.object_id = p.object_id "
+            "WHERE o.org_id = ? ORDER BY p.seq",
+            (org_id,),
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for (blob,) in rows:
+                yield _decode(blob)
+
+    def upsert(self, record):
+        """Insert a record or replace it in place (keeping its position) if the objectId exists."""
+        data = _record_data(record)
+        object_id = data.get("objectId")
+        if not object_id:
+            logger.debug(f"Skipping record without objectId: {record}")
+            return
+        self.conn.execute(
+            "INSERT INTO publications (object_id, last_modified, data) VALUES (?, ?, ?) "
+            "ON CONFLICT(object_id) DO UPDATE SET last_modified = excluded.last_modified, data = excluded.data",
+            (object_id, data.get("lastModificationDate"), _encode(record)),
+        )
+        self.conn.execute("DELETE FROM publication_dois WHERE object_id = ?", (object_id,))
+        self.conn.execute("DELETE FROM publication_orgs WHERE object_id = ?", (object_id,))
+        self.conn.executemany("INSERT INTO publication_dois (doi, object_id) VALUES (?, ?)",
+                              [(doi, object_id) for doi in _record_dois(record)])
+        self.conn.executemany("INSERT INTO publication_orgs (org_id, object_id) VALUES (?, ?)",
+                              [(org_id, object_id) for org_id in _record_org_ids(record)])
+
+    def delete(self, object_id):
+        for table in ("publications", "publication_dois", "publication_orgs"):
+            self.conn.execute(f"DELETE FROM {table} WHERE object_id = ?", (object_id,))
+
+    @classmethod
+    def replace(cls, path, records):
+        """
+        Atomically replace the store at `path` with `records`, leaving out withdrawn ones
+        as `merge` does. Returns the number of records stored.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _tmp_store_path(path)
+        try:
+            with cls(tmp_path) as store:
+                with store.conn:
+                    for record in records:
+                        if not is_withdrawn(record):
+                            store.upsert(record)
+                count = len(store)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return count
+
+    @classmethod
+    def merge(cls, path, records):
+        """
+        Atomically merge changed `records` into the store at `path`.
+
+        Existing records are replaced in place, withdrawn ones are removed and unknown
+        ones are appended. Returns the number of records stored afterwards.
+        """
+        path = Path(path)
+        tmp_path = _tmp_store_path(path)
+        try:
+            shutil.copyfile(path, tmp_path)
+            with cls(tmp_path) as store:
+                with store.conn:
+                    for record in records:
+                        if is_withdrawn(record):
+                            store.delete(_record_data(record).get("objectId"))
+                        else:
+                            store.upsert(record)
+                count = len(store)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return count
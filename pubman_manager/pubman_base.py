@@ -1,21 +1,194 @@
-import requests
 import json
 import logging
+import re
+import threading
 import pandas as pd
 import jwt
 
 from collections import OrderedDict
 from pathlib import Path
+from unidecode import unidecode
 
 from pubman_manager import ENV_USERNAME, ENV_PASSWORD, ENV_USERID
+from pubman_manager.http_session import get_session, request_policy
+from pubman_manager.token_cache import cached_login, cached_user_info
 
 logger = logging.getLogger(__name__)
 
+# Fields needed to decide whether a record exists and to skip, delete or submit it
+EXISTENCE_SOURCE_FIELDS = [
+    "objectId",
+    "lastModificationDate",
+    "versionState",
+    "context.objectId",
+    "metadata.identifiers",
+    "metadata.title",
+    "metadata.event.title",
+]
+
+
+def with_source(query, source):
+    """
+    Return `query` limited to the `source` fields (Elasticsearch `_source` projection).
+    A `source` of None keeps the full item documents.
+    """
+    if source is None:
+        return query
+    return {**query, "_source": list(source)}
+
+
+def criteria_key(match_criteria):
+    """Hashable key for a match_criteria dict as passed to search_publication_by_criteria."""
+    return tuple(sorted(
+        (key, tuple(sorted(value.items())) if isinstance(value, dict) else value)
+        for key, value in match_criteria.items()
+    ))
+
+
+def criteria_clauses(match_criteria):
+    must_clauses = []
+    for key, value in match_criteria.items():
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                must_clauses.append({
+                    "nested": {
+                        "path": key,
+                        "query": {
+                            "bool": {
+                                "must": [
+                                    {"match_phrase": {f"{key}.{sub_key}": sub_value}}
+                                ]
+                            }
+                        }
+                    }
+                })
+        else:
+            must_clauses.append({
+                "match_phrase": {
+                    key: value
+                }
+            })
+    return must_clauses
+
+
+def _phrase_tokens(text):
+    # like the standard analyzer with ascii folding: "_" separates tokens, diacritics are dropped
+    return re.findall(r"[^\W_]+", unidecode(str(text or "")).lower())
+
+
+def _phrase_matches(phrase, text):
+    """Client-side approximation of an Elasticsearch match_phrase on an analyzed text field."""
+    needle = _phrase_tokens(phrase)
+    haystack = _phrase_tokens(text)
+    if not needle:
+        return False
+    n = len(needle)
+    return any(haystack[i:i + n] == needle for i in range(len(haystack) - n + 1))
+
+
+def normalize_doi(doi):
+    """DOIs are case-insensitive and often given as doi.org URLs."""
+    return re.sub(r"^(https?://)?(dx\.)?doi\.org/", "", str(doi or "").strip().lower())
+
+
+def _is_doi_criterion(value):
+    return isinstance(value, dict) and str(value.get("type", "")).upper() == "DOI"
+
+
+def _values_at(data, dotted_path):
+    values = [data]
+    for part in dotted_path.split('.'):
+        next_values = []
+        for value in values:
+            if isinstance(value, list):
+                next_values.extend(v.get(part) for v in value if isinstance(v, dict))
+            elif isinstance(value, dict):
+                next_values.append(value.get(part))
+        values = [v for v in next_values if v is not None]
+    flattened = []
+    for value in values:
+        flattened.extend(value if isinstance(value, list) else [value])
+    return flattened
+
+
+def record_matches_criteria(record, match_criteria):
+    """
+    Check whether a search record satisfies every clause of match_criteria. DOIs must be
+    equal after normalize_doi, other values match as phrases (like match_phrase).
+    """
+    data = record.get('data', {})
+    for key, value in match_criteria.items():
+        if isinstance(value, dict):
+            entries = _values_at(data, key)
+            for sub_key, sub_value in value.items():
+                if _is_doi_criterion(value) and sub_key == "id":
+                    matches = lambda entry: normalize_doi(entry.get(sub_key)) == normalize_doi(sub_value)
+                else:
+                    matches = lambda entry: _phrase_matches(sub_value, entry.get(sub_key))
+                if not any(isinstance(e, dict) and matches(e) for e in entries):
+                    return False
+        elif not any(_phrase_matches(value, v) for v in _values_at(data, key)):
+            return False
+    return True
+
+
+def _has_doi_criterion(match_criteria):
+    return any(_is_doi_criterion(value) for value in match_criteria.values())
+
+
+def _exact_matches(records, match_criteria):
+    """
+    PuRe's match_phrase finds "10.1000/abc" in "10.1000/abc.def" too; for DOI criteria
+    only keep the records whose DOI is the same.
+    """
+    if not _has_doi_criterion(match_criteria):
+        return records
+    return [record for record in records if record_matches_criteria(record, match_criteria)]
+
+
+class _ReauthenticatingSession:
+    """
+    Sends PuRe requests through `session`; a request rejected with 401 because the
+    token expired mid-run is sent once more after `pubman` logged in again.
+    """
+
+    def __init__(self, pubman, session):
+        self.pubman = pubman
+        self.session = session
+
+    def policy(self, **policy):
+        return request_policy(self.session, **policy)
+
+    def request(self, method, url, **kwargs):
+        response = self.session.request(method, url, **kwargs)
+        headers = kwargs.get("headers") or {}
+        if response.status_code != 401 or "Authorization" not in headers:
+            return response
+        response.close()
+        kwargs["headers"] = {**headers, "Authorization": self.pubman.renew_auth_token(headers["Authorization"])}
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+
 class PubmanBase:
-    def __init__(self, base_url = "https://pure.mpg.de/rest", auth_token = None, user_id=None):
+    def __init__(self, base_url = "https://pure.mpg.de/rest", auth_token = None, user_id=None, session=None):
         logging.basicConfig(level=logging.INFO)
         logger = logging.getLogger()
         self.base_url = base_url
+        session = session if session is not None else get_session("pubman")
+        self.session = session
+        self._auth_lock = threading.Lock()
 
         # self.org_id = 'ou_1863381' # PuRe Org ID for all MPIE publications, TODO: fetch based on Institute name
         # self.user_id = "user_1944725"  # PuRe User id for user PuRe user "Mentock", TODO: fetch automatically based on username
@@ -25,7 +198,8 @@ class PubmanBase:
             self.user_id = user_id
         else:
             logger.info('No auth_token provided, using ENV_USERNAME and ENV_PASSWORD')
-            self.auth_token, self.user_id, = self.login(ENV_USERNAME, ENV_PASSWORD)
+            self.auth_token, self.user_id, = cached_login(ENV_USERNAME, ENV_PASSWORD, PubmanBase.login)
+            self.session = _ReauthenticatingSession(self, session)
             if not self.user_id and ENV_USERID:
                 logger.warning('No user_id from auth; using ENV_USERID')
                 self.user_id = ENV_USERID
@@ -37,16 +211,30 @@ class PubmanBase:
             "Authorization": self.auth_token,
             "Content-Type": "application/json"
         }
-        user_info = PubmanBase.get_user_info(self.auth_token, self.user_id)
+        user_info = cached_user_info(self.auth_token, self.user_id, PubmanBase.get_user_info)
         self.ctx_id = user_info['ctx_id']
         self.org_id = user_info['org_id']
         self.org_name = user_info['org_name']
         self.user_name = user_info['user_name']
         self.user_email = user_info['user_email']
 
+    def renew_auth_token(self, rejected_token):
+        """
+        Log in again after PuRe rejected `rejected_token` and return the current token.
+        Threads rejected with the same token share one login.
+        """
+        with self._auth_lock:
+            if self.auth_token == rejected_token:
+                logger.info("PuRe rejected the auth token, logging in again")
+                self.auth_token, _ = cached_login(ENV_USERNAME, ENV_PASSWORD, PubmanBase.login,
+                                                  stale_token=rejected_token)
+                self.headers["Authorization"] = self.auth_token
+                self.headers_json["Authorization"] = self.auth_token
+            return self.auth_token
+
     @staticmethod
     def login(username, password):
-        login_response = requests.post(
+        login_response = get_session("pubman").post(
             f"https://pure.mpg.de/rest/login",
             headers={"Content-Type": "text/plain"},
             data=f"{username}:{password}"
@@ -60,7 +248,7 @@ class PubmanBase:
             raise Exception(f"Failed to log in to PuRe with '{username}': {login_response.text}")
 
     def logout(self):
-        logout_response = requests.get(
+        logout_response = self.session.get(
             f"{self.base_url}/logout",
             headers=self.headers
         )
@@ -69,7 +257,7 @@ class PubmanBase:
 
     @staticmethod
     def get_user_info(auth_token, user_id):
-        response = requests.get(
+        response = get_session("pubman").get(
             f"https://pure.mpg.de/rest/users/{user_id}",
             headers={
                     "Authorization": auth_token,
@@ -88,34 +276,34 @@ class PubmanBase:
         }
 
     def get_item(self, publication_id):
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/items/{publication_id}",
             headers=self.headers
         )
         return response.json()
 
     def get_item_history(self, publication_id):
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/items/{publication_id}/history",
             headers=self.headers
         )
         return response.json()
 
     def get_component_content(self, publication_id, file_id):
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/items/{publication_id}/component/{file_id}/content",
             headers=self.headers
         )
         return response.content
 
     def get_component_metadata(self, publication_id, file_id):
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/items/{publication_id}/component/{file_id}/metadata",
             headers=self.headers
         )
         return response.json()
 
-    def search_items(self, query, format="json", citation=None, cslConeId=None, scroll=False):
+    def search_items(self, query, format="json", citation=None, cslConeId=None, scroll=False, source=None):
         params = {
             "format": format,
             "citation": citation,
@@ -123,12 +311,13 @@ class PubmanBase:
             "scroll": str(scroll).lower()
         }
         headers = self.headers_json
-        response = requests.post(
-            f"{self.base_url}/items/search",
-            headers=headers,
-            params=params,
-            data=json.dumps(query)
-        )
+        with request_policy(self.session, idempotent=True):
+            response = self.session.post(
+                f"{self.base_url}/items/search",
+                headers=headers,
+                params=params,
+                data=json.dumps(with_source(query, source))
+            )
         return response.json()
 
     def search_items_scroll(self, scrollId, format="json", citation=None, cslConeId=None):
@@ -139,18 +328,20 @@ class PubmanBase:
             "scrollId": scrollId
         }
         headers = self.headers
-        response = requests.get(
-            f"{self.base_url}/items/search/scroll",
-            headers=headers,
-            params=params
-        )
+        # each scroll call advances the cursor, so a repeated request could skip a page
+        with request_policy(self.session, idempotent=False):
+            response = self.session.get(
+                f"{self.base_url}/items/search/scroll",
+                headers=headers,
+                params=params
+            )
         return response.json()
 
     def stage_file(self, component_name, file_path):
         with open(file_path, 'rb') as f:
             file_data = f.read()
         headers = self.headers
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/staging/{component_name}",
             headers=headers,
             data=file_data
@@ -159,7 +350,7 @@ class PubmanBase:
 
     def update_item(self, item_id, item_data):
         headers = self.headers_json
-        response = requests.put(
+        response = self.session.put(
             f"{self.base_url}/items/{item_id}",
             headers=headers,
             data=json.dumps(item_data)
@@ -168,7 +359,7 @@ class PubmanBase:
 
     def delete_item(self, item_id, last_modification_date):
         headers = self.headers_json
-        response = requests.delete(
+        response = self.session.delete(
             f"{self.base_url}/items/{item_id}",
             headers=headers,
             data=json.dumps({"lastModificationDate": last_modification_date})
@@ -180,7 +371,7 @@ class PubmanBase:
 
     def submit_item(self, item_id, last_modification_date, comment):
         headers = self.headers_json
-        response = requests.put(
+        response = self.session.put(
             f"{self.base_url}/items/{item_id}/submit",
             headers=headers,
             data=json.dumps({"lastModificationDate": last_modification_date, "comment": comment})
@@ -189,7 +380,7 @@ class PubmanBase:
 
     def release_item(self, item_id, last_modification_date, comment):
         headers = self.headers_json
-        response = requests.put(
+        response = self.session.put(
             f"{self.base_url}/items/{item_id}/release",
             headers=headers,
             data=json.dumps({"lastModificationDate": last_modification_date, "comment": comment})
@@ -198,7 +389,7 @@ class PubmanBase:
 
     def withdraw_item(self, item_id, last_modification_date, comment):
         headers = self.headers_json
-        response = requests.put(
+        response = self.session.put(
             f"{self.base_url}/items/{item_id}/withdraw",
             headers=headers,
             data=json.dumps({"lastModificationDate": last_modification_date, "comment": comment})
@@ -207,7 +398,7 @@ class PubmanBase:
 
     def revise_item(self, item_id, last_modification_date, comment):
         headers = self.headers_json
-        response = requests.put(
+        response = self.session.put(
             f"{self.base_url}/items/{item_id}/revise",
             headers=headers,
             data=json.dumps({"lastModificationDate": last_modification_date, "comment": comment})
@@ -216,63 +407,115 @@ class PubmanBase:
 
     def fetch_scroll_results(self, scroll_id):
         headers = self.headers_json
-        response = requests.get(
-            f"{self.base_url}/items/search/scroll?scrollId={scroll_id}",
-            headers=headers
-        )
+        # each scroll call advances the cursor, so a repeated request could skip a page
+        with request_policy(self.session, idempotent=False):
+            response = self.session.get(
+                f"{self.base_url}/items/search/scroll?scrollId={scroll_id}",
+                headers=headers
+            )
         if response.status_code == 200:
             return response.json()
         return None
 
-    def search_publication_by_criteria(self, match_criteria, size=100000):
-        must_clauses = []
-        for key, value in match_criteria.items():
-            if isinstance(value, dict):
-                for sub_key, sub_value in value.items():
-                    must_clauses.append({
-                        "nested": {
-                            "path": key,
-                            "query": {
-                                "bool": {
-                                    "must": [
-                                        {"match_phrase": {f"{key}.{sub_key}": sub_value}}
-                                    ]
-                                }
-                            }
-                        }
-                    })
-            else:
-                must_clauses.append({
-                    "match_phrase": {
-                        key: value
-                    }
-                })
-
+    def search_publication_by_criteria(self, match_criteria, size=100000, source=None):
         query = {
             "query": {
                 "bool": {
-                    "must": must_clauses
+                    "must": criteria_clauses(match_criteria)
                 }
             },
             "size": size  # Adjust the size as needed
         }
 
         headers = self.headers_json
-        response = requests.post(
-            f"{self.base_url}/items/search",
-            headers=headers,
-            data=json.dumps(query)
-        )
+        with request_policy(self.session, idempotent=True):
+            response = self.session.post(
+                f"{self.base_url}/items/search",
+                headers=headers,
+                data=json.dumps(with_source(query, source))
+            )
         if response.status_code in [200, 201]:
             results = response.json()
-            return results.get('records')
+            records = results.get('records')
+            return _exact_matches(records, match_criteria) if records else records
         else:
             logger.error(f'Failed to get pubman data for match_criteria {match_criteria}, response.status_code { response.status_code}')
             return []
 
+    def search_publications_by_criteria_batch(self, criteria_list, chunk_size=50, records_per_criteria=4,
+                                              source=EXISTENCE_SOURCE_FIELDS):
+        """
+        Look up many match_criteria dicts (as used by search_publication_by_criteria) at once.
+
+        Each chunk of criteria is sent as one bool/should query with a small result size and a
+        `_source` projection; the returned records are then assigned to the criteria they match.
+        If a returned record matches none of them client-side, the unmatched criteria of that
+        chunk are searched one by one instead, except for DOI criteria, which are compared
+        exactly. A failed search raises rather than reporting the chunk as missing.
+
+        Returns a dict mapping criteria_key(criteria) -> list of matching records (only for
+        criteria with at least one match).
+        """
+        unique_criteria = OrderedDict()
+        for criteria in criteria_list:
+            unique_criteria.setdefault(criteria_key(criteria), criteria)
+        unique_criteria = list(unique_criteria.items())
+
+        matches = {}
+        for i in range(0, len(unique_criteria), chunk_size):
+            chunk = unique_criteria[i:i + chunk_size]
+            query = {
+                "query": {
+                    "bool": {
+                        "should": [{"bool": {"must": criteria_clauses(criteria)}} for _, criteria in chunk],
+                        "minimum_should_match": 1,
+                    }
+                },
+                "size": len(chunk) * records_per_criteria,
+            }
+            query = with_source(query, source)
+            results = self._search_chunk(query)
+            total = results.get('numberOfRecords') or 0
+            records = results.get('records') or []
+            if total > len(records):
+                # more hits than the small page holds, fetch the complete chunk result once
+                query["size"] = total
+                records = self._search_chunk(query).get('records') or []
+            assigned = set()
+            unmatched = []
+            for key, criteria in chunk:
+                matched = [record for record in records if record_matches_criteria(record, criteria)]
+                assigned.update(id(record) for record in matched)
+                if matched:
+                    matches[key] = matched
+                else:
+                    unmatched.append((key, criteria))
+            if unmatched and any(id(record) not in assigned for record in records):
+                # PuRe matched a record our phrase matching doesn't, ask PuRe per criteria instead
+                for key, criteria in unmatched:
+                    single = {"query": {"bool": {"must": criteria_clauses(criteria)}}, "size": total}
+                    if _has_doi_criterion(criteria):
+                        # DOIs are compared exactly, PuRe can't know better
+                        continue
+                    matched = self._search_chunk(with_source(single, source)).get('records')
+                    if matched:
+                        matches[key] = matched
+        return matches
+
+    def _search_chunk(self, query):
+        with request_policy(self.session, idempotent=True):
+            response = self.session.post(
+                f"{self.base_url}/items/search",
+                headers=self.headers_json,
+                data=json.dumps(query)
+            )
+        if response.status_code in [200, 201]:
+            return response.json()
+        raise Exception("Failed batched pubman search", response.status_code, response.text)
+
     def create_item(self, request_json):
         headers = self.headers_json
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/items",
             headers=headers,
             data=json.dumps(request_json)
@@ -288,7 +531,7 @@ class PubmanBase:
             "comment": "Item Submitted via API",
             "lastModificationDate": last_modification_date
         }
-        response = requests.put(
+        response = self.session.put(
             f"{self.base_url}/items/{item_id}/submit",
             headers=headers,
             data=json.dumps(submit_data)
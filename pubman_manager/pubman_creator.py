@@ -2,9 +2,9 @@ import json
 import logging
 import math
 import re
-import requests
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from dateutil import parser
 from typing import Any
@@ -12,13 +12,20 @@ from pathlib import Path
 from openpyxl import load_workbook
 
 from pubman_manager import PubmanBase, FILES_DIR
+from pubman_manager.pubman_base import criteria_key, with_source
+from pubman_manager.http_session import request_policy
 from pubman_manager import get_user_cache_dir
 from pubman_manager.talk_template import TALK_EXTERNAL_LINK_HEADER
-from pubman_manager.util import is_mpi_affiliation, load_yaml
+from pubman_manager.util import is_mpi_affiliation, load_yaml_snapshot
 
 
 logger = logging.getLogger(__name__)
 
+# Concurrent requests per stage of create_publications/create_items
+UPLOAD_WORKERS = 4
+CREATE_WORKERS = 4
+SUBMIT_WORKERS = 4
+
 
 class PubmanCreator(PubmanBase):
     """
@@ -32,9 +39,9 @@ class PubmanCreator(PubmanBase):
         super().__init__(auth_token=auth_token, user_id=user_id, base_url=base_url)
 
         cache_dir = get_user_cache_dir(self.user_id)
-        self.identifier_paths = load_yaml(cache_dir / 'identifier_paths.yaml')
-        self.authors_info = load_yaml(cache_dir / 'authors_info.yaml')
-        self.journals = load_yaml(cache_dir / 'journals.yaml')
+        self.identifier_paths = load_yaml_snapshot(cache_dir / 'identifier_paths.yaml')
+        self.authors_info = load_yaml_snapshot(cache_dir / 'authors_info.yaml')
+        self.journals = load_yaml_snapshot(cache_dir / 'journals.yaml')
 
 
     @staticmethod
@@ -291,7 +298,7 @@ class PubmanCreator(PubmanBase):
 
         with open(pdf_path, 'rb') as file_data:
             payload = file_data.read()
-            response = requests.post(staging_url, headers=headers, data=payload)
+            response = self.session.post(staging_url, headers=headers, data=payload)
 
         if response.status_code in [200, 201]:
             return response.json()
@@ -328,7 +335,9 @@ class PubmanCreator(PubmanBase):
 
         headers = {"Authorization": self.auth_token, "Content-Type": "application/json"}
 
-        resp = requests.post(f"{self.base_url}/items/search", headers=headers, data=json.dumps(query))
+        with request_policy(self.session, idempotent=True):
+            resp = self.session.post(f"{self.base_url}/items/search", headers=headers,
+                                     data=json.dumps(with_source(query, ["metadata.sources"])))
         if resp.status_code != 200:
             raise Exception(f"Journal lookup failed: {resp.status_code} {resp.text}")
 
@@ -478,6 +487,7 @@ class PubmanCreator(PubmanBase):
         rows = self.extract_prefilled_rows(file_path, header_name="Title")
         request_list = []
         missing_pdfs = []
+        staged_uploads = []
 
         if not rows:
             raise RuntimeError("No publication rows found in the uploaded file.")
@@ -609,7 +619,6 @@ class PubmanCreator(PubmanBase):
                     logger.error(f'PDF for DOI {doi} not found: {pdf_path}')
                     missing_pdfs.append(pdf_path.name)
                 else:
-                    file_id = self.upload_pdf(pdf_path)
                     file_entry = {
                         "objectId": '',
                         "name": pdf_path.name,
@@ -617,7 +626,7 @@ class PubmanCreator(PubmanBase):
                         "creationDate": "",
                         "creator": {"objectId": ""},
                         "pid": "",
-                        'content': file_id,
+                        'content': None,
                         "visibility": "PUBLIC",
                         "checksum": "",
                         "checksumAlgorithm": "MD5",
@@ -643,6 +652,7 @@ class PubmanCreator(PubmanBase):
                         file_entry["metadata"]["contentCategory"] = "pre-print"
                     file_entry["metadata"]["rights"] = "The Authors"
                     files.append(file_entry)
+                    staged_uploads.append((file_entry, pdf_path))
 
             # Build final request
             request = {
@@ -668,6 +678,12 @@ class PubmanCreator(PubmanBase):
             criteria = {"metadata.identifiers": {"id": doi, "type": "DOI"}}
             request_list.append((criteria, request))
 
+        # PDFs are staged concurrently once every request is built
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as upload_pool:
+            file_ids = upload_pool.map(self.upload_pdf, [pdf_path for _, pdf_path in staged_uploads])
+            for (file_entry, _), file_id in zip(staged_uploads, file_ids):
+                file_entry['content'] = file_id
+
         summary = self.create_items(request_list, submit_items=submit_items, overwrite=overwrite)
         if missing_pdfs:
             raise RuntimeError(
@@ -677,52 +693,89 @@ class PubmanCreator(PubmanBase):
         return summary
 
     def create_items(self, request_list, create_items=True, submit_items=False, overwrite=False):
-        item_ids = []
-        created_count = 0
-        skipped_existing = 0
-        blocked_existing = 0
-
+        """
+        Create (and optionally submit) the items of `request_list`, skipping or overwriting
+        existing ones.
+
+        Existence checks are batched up front. Rows are then deleted/created by up to
+        CREATE_WORKERS threads and every resulting item is handed to the SUBMIT_WORKERS
+        pool as soon as it exists. The summary only depends on the rows, not on timing.
+        Rows repeating the criteria of an earlier row (e.g. the same DOI twice in a sheet)
+        are counted as existing and not created again. The first failing row aborts the
+        run: its exception is raised, rows that haven't started are not created and
+        pending submissions are cancelled; rows already in progress still complete.
+        """
+        existing_by_criteria = self.search_publications_by_criteria_batch(
+            [criteria for criteria, _ in request_list]
+        )
+        unique_requests = {}
         for criteria, request_json in request_list:
-            created_item = None
-            title = request_json['metadata']['title']
-            existing = self.search_publication_by_criteria(criteria)
-
-            if existing:
-                if overwrite:
-                    logger.info(f"Overwriting existing publication: '{title}'")
-                    item_already_released = False
-                    for pub in existing:
-                        deleted = self.delete_item(pub['data']['objectId'], pub['data']['lastModificationDate'])
-                        if not deleted:
-                            item_already_released = True
-                            logger.info(f"Could not delete publication '{title}', skipping")
-                    if item_already_released:
-                        blocked_existing += 1
-                        continue
-                else:
-                    logger.info(f"Skipping existing publication: '{criteria}'")
-                    pub = existing[0]['data']
-                    item_ids.append((pub['objectId'], pub['lastModificationDate'], pub['versionState']))
-                    skipped_existing += 1
-                    continue
+            key = criteria_key(criteria)
+            if key in unique_requests:
+                logger.info(f"Skipping duplicate publication in upload: '{criteria}'")
+            else:
+                unique_requests[key] = (criteria, request_json)
+
+        with ThreadPoolExecutor(max_workers=CREATE_WORKERS) as create_pool, \
+                ThreadPoolExecutor(max_workers=SUBMIT_WORKERS) as submit_pool:
+
+            def _process(criteria, request_json):
+                existing = existing_by_criteria.get(criteria_key(criteria), [])
+                outcome, item = self._create_or_reuse_item(criteria, request_json, existing, create_items, overwrite)
+                submission = submit_pool.submit(self._submit_if_pending, *item) if submit_items and item else None
+                return outcome, submission
+
+            futures = [create_pool.submit(_process, criteria, request_json)
+                       for criteria, request_json in unique_requests.values()]
+            outcomes = ["skipped_existing"] * (len(request_list) - len(unique_requests))
+            try:
+                for future in futures:
+                    outcome, submission = future.result()
+                    outcomes.append(outcome)
+                    if submission is not None:
+                        submission.result()
+            except BaseException:
+                create_pool.shutdown(cancel_futures=True)
+                submit_pool.shutdown(cancel_futures=True)
+                raise
 
-            if create_items:
-                created_item = self.create_item(request_json)
-                if created_item:
-                    item_ids.append((created_item['objectId'], created_item['lastModificationDate'],
-                                     created_item['versionState']))
-                    created_count += 1
-
-        if submit_items:
-            for obj_id, mod, state in item_ids:
-                if state not in ['PENDING', 'IN_REVISION']:
-                    logger.info(f"Item already in state '{state}', skipping submit")
-                    continue
-                submitted = self.submit_item(obj_id, mod)
-                logger.info(f"Submitted item: {submitted}")
         return {
-            "created": created_count,
-            "skipped_existing": skipped_existing,
-            "blocked_existing": blocked_existing,
+            "created": outcomes.count("created"),
+            "skipped_existing": outcomes.count("skipped_existing"),
+            "blocked_existing": outcomes.count("blocked_existing"),
             "total": len(request_list),
         }
+
+    def _create_or_reuse_item(self, criteria, request_json, existing, create_items, overwrite):
+        """Returns (outcome, (objectId, lastModificationDate, versionState) or None) for one row."""
+        title = request_json['metadata']['title']
+        if existing:
+            if overwrite:
+                logger.info(f"Overwriting existing publication: '{title}'")
+                item_already_released = False
+                for pub in existing:
+                    deleted = self.delete_item(pub['data']['objectId'], pub['data']['lastModificationDate'])
+                    if not deleted:
+                        item_already_released = True
+                        logger.info(f"Could not delete publication '{title}', skipping")
+                if item_already_released:
+                    return "blocked_existing", None
+            else:
+                logger.info(f"Skipping existing publication: '{criteria}'")
+                pub = existing[0]['data']
+                return "skipped_existing", (pub['objectId'], pub['lastModificationDate'], pub['versionState'])
+
+        if create_items:
+            created_item = self.create_item(request_json)
+            if created_item:
+                return "created", (created_item['objectId'], created_item['lastModificationDate'],
+                                   created_item['versionState'])
+        return None, None
+
+    def _submit_if_pending(self, obj_id, mod, state):
+        if state not in ['PENDING', 'IN_REVISION']:
+            logger.info(f"Item already in state '{state}', skipping submit")
+            return None
+        submitted = self.submit_item(obj_id, mod)
+        logger.info(f"Submitted item: {submitted}")
+        return submitted
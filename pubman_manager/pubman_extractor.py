@@ -1,10 +1,266 @@
 from pubman_manager import PubmanBase, get_user_cache_dir
-import requests
+from pubman_manager.pubman_base import with_source
+from pubman_manager.http_session import request_policy
+import abc
 import json
-from fuzzywuzzy import fuzz, process
+import logging
+import multiprocessing
+from fuzzywuzzy import fuzz
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from pubman_manager.util import save_yaml, load_yaml
+from pubman_manager.publication_store import PublicationStore, PUBLICATIONS_STORE_FILE
+from pubman_manager.affiliation_clustering import AffiliationClusterer
+from pubman_manager.json_stream import JSONStream
+
+logger = logging.getLogger(__name__)
+
+# Authors with fewer raw affiliations are clustered in the parent process
+MIN_PARALLEL_AFFILIATIONS = 50
+# Distinct organization lists remembered by process_affiliations
+PROCESS_AFFILIATIONS_CACHE_SIZE = 65536
+# Fields the publication store and the cache reducers read from an item
+CORPUS_SOURCE_FIELDS = [
+    "objectId",
+    "lastModificationDate",
+    "versionState",
+    "publicState",
+    "metadata.identifiers",
+    "metadata.creators",
+    "metadata.sources",
+]
+# Bytes read at a time from streamed scroll pages
+SCROLL_CHUNK_SIZE = 1 << 16
+# Affiliations of directors, which override the ones found in their publications
+DIRECTOR_AFFILIATIONS_FILE = Path(__file__).resolve().parents[1] / "director_affiliations.yaml"
+
+
+def as_record(hit):
+    """Bring raw Elasticsearch scroll hits into the {'data': item} shape of search records."""
+    if 'data' not in hit and '_source' in hit:
+        return {'data': hit['_source']}
+    return hit
+
+
+def canonicalize_affiliations(affs, threshold=95, replace_old_new=None):
+    """
+    Cluster near-duplicate strings (token_set_ratio >= threshold) and count occurrences.
+    Returns a Counter of canonical strings; keys keep first-seen order.
+    """
+    clusterer = AffiliationClusterer(threshold)
+    counts = Counter()      # rep -> frequency, keys in first-seen order
+    old, new = (replace_old_new or (None, None))
+
+    for s in affs:
+        s = s.strip().replace('\n', ' ').replace('  ', ' ')
+        if old:
+            s = s.replace(old, new)
+        counts[clusterer.add(s)] += 1
+
+    return counts
+
+
+@lru_cache(maxsize=PROCESS_AFFILIATIONS_CACHE_SIZE)
+def reduce_affiliations(affiliations):
+    """
+    Collapse near-duplicates of one record's normalized affiliation names and add the
+    Eisenforschung/Sustainable Materials twin of each institute name. Returns a tuple.
+    """
+    reduced = []
+    for s in affiliations:
+        found = False
+        for r in reduced:
+            if fuzz.token_set_ratio(s, r) >= 85:
+                found = True
+                break
+        if not found:
+            reduced.append(s.strip())
+    ein_suffix = "Max-Planck-Institut für Eisenforschung GmbH, Max Planck Society"
+    sus_suffix = "Max Planck Institute for Sustainable Materials, Max Planck Society"
+    additions = []
+    for aff in reduced:
+        if aff.endswith(ein_suffix):
+            prefix = aff[: -len(ein_suffix)].rstrip().rstrip(",")
+            swapped = f"{prefix}, {sus_suffix}" if prefix else sus_suffix
+            additions.append(swapped)
+        elif aff.endswith(sus_suffix):
+            prefix = aff[: -len(sus_suffix)].rstrip().rstrip(",")
+            swapped = f"{prefix}, {ein_suffix}" if prefix else ein_suffix
+            additions.append(swapped)
+    for aff in additions:
+        if aff not in reduced:
+            reduced.append(aff)
+    return tuple(reduced)
+
+
+def record_organizations(record):
+    """Yield (name, id) of every creator organization of `record` that has both."""
+    metadata = record.get('data', {}).get('metadata', {})
+    for creator in metadata.get("creators", []):
+        person = creator.get("person", {})
+        for org in person.get("organizations", []):
+            org_id = org.get("identifier")
+            org_name = org.get("name")
+            if org_id and org_name:
+                yield org_name.strip(), org_id.strip()
+
+
+class PublicationReducer(abc.ABC):
+    """
+    One output of the single-pass cache extraction (see reduce_publications).
+
+    `add_record` sees the `data` dict of every publication, `add_person` every creator's
+    `person` dict; `result` is called once after the last record. `input_files` lists
+    the files `result` reads besides the records.
+    """
+
+    input_files = ()
+
+    def add_record(self, data):
+        pass
+
+    def add_person(self, person):
+        pass
+
+    @abc.abstractmethod
+    def result(self):
+        pass
+
+
+class AuthorsReducer(PublicationReducer):
+    """authors_info: identifiers and ranked affiliation counts per (given name, family name)."""
+
+    input_files = (DIRECTOR_AFFILIATIONS_FILE,)
+
+    def __init__(self, extractor, workers=1):
+        self.extractor = extractor
+        self.workers = workers
+        self.authors_info = {}
+        self.raw_affiliations_by_author = defaultdict(list)
+        self.memo_before = reduce_affiliations.cache_info()
+
+    def add_person(self, person):
+        given_name = person.get('givenName', '')
+        family_name = person.get('familyName', '')
+
+        if not (given_name and family_name):
+            return
+
+        organizations = person.get('organizations', [])
+        affiliation_list = self.extractor.process_affiliations([org['name'] for org in organizations])
+
+        full_name = (given_name, family_name)
+        if full_name not in self.authors_info:
+            self.authors_info[full_name] = {}
+
+        self.raw_affiliations_by_author[full_name].extend(affiliation_list)
+
+        if (identifier := person.get('identifier')) and 'identifier' not in self.authors_info[full_name]:
+            self.authors_info[full_name]['identifier'] = identifier
+
+    def result(self):
+        authors_info = self.authors_info
+        memo_after = reduce_affiliations.cache_info()
+        logger.info(f"process_affiliations memo: {memo_after.hits - self.memo_before.hits} hits, "
+                    f"{memo_after.misses - self.memo_before.misses} misses, {memo_after.currsize} cached")
+
+        self.extractor._remove_abbreviated_duplicates(authors_info)
+
+        #  cluster near-duplicates and sort by frequency
+        for author, unified_counts in self.extractor._cluster_author_affiliations(
+            {author: self.raw_affiliations_by_author.get(author, []) for author in authors_info},
+            workers=self.workers,
+        ):
+            authors_info[author]['affiliation_counts'] = dict(unified_counts)
+
+        entries = load_yaml(DIRECTOR_AFFILIATIONS_FILE)
+        for entry in entries:
+            first = entry["first_name"]
+            last = entry["last_name"]
+            affiliation = entry["affiliation"]
+            key = (first, last)
+            authors_info.setdefault(key, {})
+            authors_info[key]["affiliation_counts"] = {affiliation: 1}
+        return authors_info
+
+
+class OrganizationMappingReducer(PublicationReducer):
+    """identifier_paths: organization name -> identifierPath."""
+
+    def __init__(self):
+        self.organizations = {}
+
+    def add_person(self, person):
+        for org in person.get('organizations', []):
+            org_name = org.get('name')
+            if org_name and org_name not in self.organizations and org.get('identifier') not in ['ou_persistent22', 'persistent22'] and org.get('identifierPath'):
+                self.organizations[org_name] = org.get('identifierPath')
+
+    def result(self):
+        return self.organizations
+
+
+class JournalsReducer(PublicationReducer):
+    """journals: ISSN -> CoNE journal info of every source with both identifiers."""
+
+    def __init__(self):
+        self.journals = {}
+
+    def add_record(self, data):
+        sources = data.get('metadata', {}).get('sources', [])
+        for source in sources:
+            ids = {i.get('type'): i.get('id') for i in source.get('identifiers', [])}
+            if {'CONE', 'ISSN'} <= ids.keys() and ids['ISSN'] not in self.journals:
+                self.journals[ids['ISSN']] = {
+                    'alternativeTitles': source.get('alternativeTitles'),
+                    'genre': source.get('genre'),
+                    'publishingInfo': source.get('publishingInfo'),
+                    'cone': ids['CONE'],
+                    'title': source['title'],
+                }
+
+    def result(self):
+        return self.journals
+
+
+def unique_records(publications):
+    """Yield publications by objectId, skipping records without one or with one seen before."""
+    seen = set()
+    for record in publications:
+        object_id = record.get('data', {}).get('objectId')
+        if not object_id or object_id in seen:
+            continue
+        seen.add(object_id)
+        yield record
+
+
+def feed_reducers(publications, reducers, unique=False):
+    """
+    Pass every publication to `reducers` and yield it on, so extraction can run while a
+    download is being streamed into the publication store. With `unique`, records are
+    filtered through `unique_records`, like the store does.
+    """
+    if unique:
+        publications = unique_records(publications)
+    for record in publications:
+        data = record.get('data', {})
+        for reducer in reducers:
+            reducer.add_record(data)
+        for creator in data.get('metadata', {}).get('creators', []):
+            person = creator.get('person', {})
+            for reducer in reducers:
+                reducer.add_person(person)
+        yield record
+
+
+def reduce_publications(publications, reducers, unique=False):
+    """Visit every publication once; returns {name: result} for the `reducers` dict."""
+    for _ in feed_reducers(publications, list(reducers.values()), unique=unique):
+        pass
+    return {name: reducer.result() for name, reducer in reducers.items()}
+
 
 class PubmanExtractor(PubmanBase):
 
@@ -12,68 +268,38 @@ class PubmanExtractor(PubmanBase):
         if cache_dir is None:
             cache_dir = get_user_cache_dir(self.user_id)
         cache_dir.mkdir(parents=True, exist_ok=True)
-        publications = []
-        org_publications = self.search_publications_by_organization(org_id, size=200000)
-        publications.extend(org_publications)
-        save_yaml(publications, cache_dir / "publications.yaml")
-        authors_info = self.extract_authors_info(publications)
-        save_yaml(authors_info, cache_dir / "authors_info.yaml")
-        save_yaml(self.extract_organization_mapping(publications), cache_dir / "identifier_paths.yaml")
-        journals = self.extract_journals(publications)
-        save_yaml(journals, cache_dir / "journals.yaml")
+        store_path = cache_dir / PUBLICATIONS_STORE_FILE
+        reducers = self.cache_reducers()
+        records = self.iter_publications_by_organization(org_id, source=CORPUS_SOURCE_FIELDS)
+        PublicationStore.replace(store_path, feed_reducers(records, list(reducers.values()), unique=True))
+        for name, reducer in reducers.items():
+            save_yaml(reducer.result(), cache_dir / f"{name}.yaml")
+
+    def cache_reducers(self, workers=1):
+        """Reducers for the per-user cache files, keyed by file stem."""
+        return {
+            "authors_info": AuthorsReducer(self, workers=workers),
+            "identifier_paths": OrganizationMappingReducer(),
+            "journals": JournalsReducer(),
+        }
 
     def extract_organization_mapping(self, data):
-        organizations = {}
-        for publication in data:
-            creators = publication.get('data', {}).get('metadata', {}).get('creators', [])
-            for creator in creators:
-                orgs = creator.get('person', {}).get('organizations', [])
-                for org in orgs:
-                    org_name = org.get('name')
-                    if org_name and org_name not in organizations and org.get('identifier') not in ['ou_persistent22', 'persistent22'] and org.get('identifierPath'):
-                        organizations[org_name] = org.get('identifierPath')
-        return organizations
+        return reduce_publications(data, {"identifier_paths": OrganizationMappingReducer()})["identifier_paths"]
 
     def _canonicalize_and_rank_affiliations(self, affs, *, threshold=95, replace_old_new=None):
         """
         Cluster near-duplicate strings (token_set_ratio >= threshold) and
-        count occurrences. Returns a list of canonical strings sorted by
-        descending frequency; ties keep first-seen order.
+        count occurrences. Returns a Counter of canonical strings; keys keep
+        first-seen order.
 
         Parameters
         ----------
         affs : List[str]
             Raw affiliations aggregated across all publications for one author.
         threshold : int
-            FuzzyWuzzy similarity threshold (0..100). 95 ≈ 0.05 distance.
+            token_set_ratio similarity threshold (0..100). 95 ≈ 0.05 distance.
         """
-        canon = []              # first-seen representatives
-        counts = Counter()      # rep -> frequency
-        old, new = (replace_old_new or (None, None))
-
-        for s in affs:
-            s = s.strip().replace('\n', ' ').replace('  ', ' ')
-            if old:
-                s = s.replace(old, new)
-
-            if not canon:
-                canon.append(s)
-                counts[s] += 1
-                continue
-
-            match = process.extractOne(s, canon, scorer=fuzz.token_set_ratio)
-            if match and match[1] >= threshold:
-                rep = match[0]
-            else:
-                rep = s
-                canon.append(rep)
-
-            counts[rep] += 1
-
-        # sort by frequency desc; tie-breaker = first-seen order (index in canon)
-        order_index = {c: i for i, c in enumerate(canon)}
-        ranked = sorted(counts.keys(), key=lambda x: (-counts[x], order_index[x]))
-        return counts
+        return canonicalize_affiliations(affs, threshold=threshold, replace_old_new=replace_old_new)
 
     def process_affiliations(self, affiliation_list):
         """
@@ -81,144 +307,123 @@ class PubmanExtractor(PubmanBase):
 
         We collapse near-duplicates within this one publication using
         fuzzywuzzy token_set_ratio >= 85 (~ Levenshtein distance <= 0.15).
+        Results are memoized per normalized name tuple, see reduce_affiliations.
         """
-        reduced = []
-        for affiliation in affiliation_list:
-            if '_' in affiliation or 'x0' in affiliation:
-                continue
-            s = affiliation.strip().replace('\n', ' ').replace('  ', ' ')
-            found = False
-            for r in reduced:
-                if fuzz.token_set_ratio(s, r) >= 85:
-                    found = True
-                    break
-            if not found:
-                reduced.append(s.strip())
-        ein_suffix = "Max-Planck-Institut für Eisenforschung GmbH, Max Planck Society"
-        sus_suffix = "Max Planck Institute for Sustainable Materials, Max Planck Society"
-        additions = []
-        for aff in reduced:
-            if aff.endswith(ein_suffix):
-                prefix = aff[: -len(ein_suffix)].rstrip().rstrip(",")
-                swapped = f"{prefix}, {sus_suffix}" if prefix else sus_suffix
-                additions.append(swapped)
-            elif aff.endswith(sus_suffix):
-                prefix = aff[: -len(sus_suffix)].rstrip().rstrip(",")
-                swapped = f"{prefix}, {ein_suffix}" if prefix else ein_suffix
-                additions.append(swapped)
-        for aff in additions:
-            if aff not in reduced:
-                reduced.append(aff)
-        return reduced
-
-    def extract_authors_info(self, publications):
-        # no need for smart_deduplicate; we will cluster at the end
-        authors_info = {}
-        raw_affiliations_by_author = defaultdict(list)
-        for record in publications:
-            metadata = record.get('data', {}).get('metadata', {})
-            creators = metadata.get('creators', [])
-            for creator in creators:
-                person = creator.get('person', {})
-                given_name = person.get('givenName', '')
-                family_name = person.get('familyName', '')
-
-                if not (given_name and family_name):
-                    continue
-
-                organizations = person.get('organizations', [])
-                affiliation_list = self.process_affiliations([org['name'] for org in organizations])
+        return list(reduce_affiliations(tuple(
+            affiliation.strip().replace('\n', ' ').replace('  ', ' ')
+            for affiliation in affiliation_list
+            if not ('_' in affiliation or 'x0' in affiliation)
+        )))
 
-                full_name = (given_name, family_name)
-                if full_name not in authors_info:
-                    authors_info[full_name] = {}
-
-                raw_affiliations_by_author[full_name].extend(affiliation_list)
+    def extract_authors_info(self, publications, workers=1):
+        """
+        Collect name, identifier and ranked affiliation counts of every creator.
 
-                if (identifier := person.get('identifier')) and 'identifier' not in authors_info[full_name]:
-                    authors_info[full_name]['identifier'] = identifier
+        With `workers` > 1 the per-author affiliation clustering of large authors runs in
+        a process pool (largest first); the result is identical to the serial run.
+        """
+        # no need for smart_deduplicate; we will cluster at the end
+        return reduce_publications(publications, {"authors_info": AuthorsReducer(self, workers=workers)})["authors_info"]
 
+    @staticmethod
+    def _remove_abbreviated_duplicates(authors_info):
+        """Drop abbreviated first-name variants (e.g. "J. Doe") that are ambiguous or have a full-name twin."""
         # remove ambiguous abbreviated-name duplicates
         to_remove = []
         for author in authors_info:
             if '.' in author[0]:
                 if len(author[0].split()[0]) <= 2:
-                    for author_ in authors_info:
-                        if len(author[0]) > 2 and author_[1] == author[1] and author[0][0] == author_[0][0]:
-                            to_remove.append(author)
+                    # an author always shares surname and initial with itself, so every
+                    # short abbreviation ("J.", "J. K.") of more than two characters is ambiguous
+                    if len(author[0]) > 2:
+                        to_remove.append(author)
                 elif (author[0].split()[0], author[1]) in authors_info:
                     to_remove.append(author)
         for author in set(to_remove):
             del authors_info[author]
 
-        # prefer full names over abbreviated variants that share the same surname
-        full_names = {name for name in authors_info.keys() if '.' not in name[0].split()[0]}
-        abbreviated_names = {name for name in authors_info.keys() if '.' in name[0].split()[0]}
-        for abbreviated_name in abbreviated_names:
-            for full_name in full_names:
-                if abbreviated_name[1] != full_name[1]:
-                    continue
-                ab_first = abbreviated_name[0].split()[0]
-                full_first = full_name[0].split()[0]
-                if ('.' not in ab_first and ab_first == full_first) or ('.' in ab_first and ab_first[0] == full_first[0]):
-                    authors_info.pop(abbreviated_name, None)
-                    break
+        # prefer full names over abbreviated variants that share the same surname and initial
+        full_initials_by_surname = defaultdict(set)
+        abbreviated_names = []
+        for name in authors_info:
+            first = name[0].split()[0]
+            if '.' in first:
+                abbreviated_names.append((name, first))
+            else:
+                full_initials_by_surname[name[1]].add(first[0])
+        for abbreviated_name, ab_first in abbreviated_names:
+            if ab_first[0] in full_initials_by_surname.get(abbreviated_name[1], ()):
+                authors_info.pop(abbreviated_name, None)
 
-        #  cluster near-duplicates and sort by frequency
-        for author in authors_info:
-            raw_list = list(raw_affiliations_by_author.get(author, []))
-            unified_counts = self._canonicalize_and_rank_affiliations(
-                raw_list,
-                threshold=95,                     # adjust to taste (97 for stricter)
+    def _cluster_author_affiliations(self, raw_by_author, workers=1, threshold=95):  # adjust to taste (97 for stricter)
+        """Yield (author, Counter) for every author of `raw_by_author`."""
+        large = []
+        if workers and workers > 1:
+            large = sorted(
+                (author for author, affs in raw_by_author.items() if len(affs) >= MIN_PARALLEL_AFFILIATIONS),
+                key=lambda author: len(raw_by_author[author]),
+                reverse=True,
             )
-            authors_info[author]['affiliation_counts'] = dict(unified_counts)
+        if len(large) < 2:
+            for author, affs in raw_by_author.items():
+                yield author, self._canonicalize_and_rank_affiliations(affs, threshold=threshold)
+            return
 
-        director_path = Path(__file__).resolve().parents[1] / "director_affiliations.yaml"
-        entries = load_yaml(director_path)
-        for entry in entries:
-            first = entry["first_name"]
-            last = entry["last_name"]
-            affiliation = entry["affiliation"]
-            key = (first, last)
-            authors_info.setdefault(key, {})
-            authors_info[key]["affiliation_counts"] = {affiliation: 1}
-        return authors_info
+        # spawn: forking a process that runs Flask or scheduler threads can deadlock the children
+        with ProcessPoolExecutor(max_workers=min(workers, len(large)),
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = {author: pool.submit(canonicalize_affiliations, raw_by_author[author], threshold)
+                       for author in large}
+            for author, affs in raw_by_author.items():
+                if author in futures:
+                    yield author, futures[author].result()
+                else:
+                    yield author, self._canonicalize_and_rank_affiliations(affs, threshold=threshold)
 
     def extract_journals(self, publications):
-        journals = {}
-        for record in publications:
-            metadata = record.get('data', {}).get('metadata', {})
-            sources = metadata.get('sources', [])
-            for source in sources:
-                ids = {i.get('type'): i.get('id') for i in source.get('identifiers', [])}
-                if {'CONE', 'ISSN'} <= ids.keys() and ids['ISSN'] not in journals:
-                    journals[ids['ISSN']] = {
-                        'alternativeTitles': source.get('alternativeTitles'),
-                        'genre': source.get('genre'),
-                        'publishingInfo': source.get('publishingInfo'),
-                        'cone': ids['CONE'],
-                        'title': source['title'],
-                    }
-        return journals
+        return reduce_publications(publications, {"journals": JournalsReducer()})["journals"]
 
-    def search_publications_by_organization(self, organization_id, size=50):
-        query = {
-            "query": {
-                "nested": {
-                    "path": "metadata.creators.person.organizations",
-                    "query": {
-                        "bool": {
-                            "must": [
-                                {
-                                    "match_phrase": {
-                                        "metadata.creators.person.organizations.identifierPath": organization_id
-                                    }
+    def search_publications_by_organization(self, organization_id, size=50, source=None):
+        return list(self.iter_publications_by_organization(organization_id, page_size=size, source=source))
+
+    def iter_publications_by_organization(self, organization_id, page_size=1000, modified_since=None,
+                                          source=None):
+        """
+        Yield all publications of an organization page by page via the PuRe scroll API.
+
+        Only one page is held in memory at a time. Scroll hits are yielded in the same
+        {'data': item} shape as regular search records. With `modified_since` (a PuRe
+        lastModificationDate), only items modified at or after that time are returned.
+        Full documents are returned unless `source` limits them to some fields, e.g.
+        CORPUS_SOURCE_FIELDS for the cache refresh.
+        """
+        org_query = {
+            "nested": {
+                "path": "metadata.creators.person.organizations",
+                "query": {
+                    "bool": {
+                        "must": [
+                            {
+                                "match_phrase": {
+                                    "metadata.creators.person.organizations.identifierPath": organization_id
                                 }
-                            ]
-                        }
+                            }
+                        ]
                     }
-                },
+                }
             },
+        }
+        if modified_since:
+            org_query = {
+                "bool": {
+                    "must": [
+                        org_query,
+                        {"range": {"lastModificationDate": {"gte": modified_since}}},
+                    ]
+                }
+            }
+        query = {
+            "query": org_query,
             "sort": [
                 {
                     "metadata.datePublishedInPrint": {
@@ -226,65 +431,77 @@ class PubmanExtractor(PubmanBase):
                     }
                 }
             ],
-            "size": size  # Adjust the size as needed
+            "size": page_size
         }
+        yield from self.iter_scroll(query, source=source)
+
+    def iter_scroll(self, query, source=None):
+        """
+        Run `query` as a PuRe scroll search and yield every hit as a {'data': item} record,
+        limited to the `source` fields if given.
+
+        Pages are streamed (gzip/deflate-compressed on the wire) and parsed incrementally,
+        so every hit is yielded as soon as it is decoded. A failed page raises, so callers
+        never mistake a truncated scroll for the complete result.
+        """
         headers = {
             "Authorization": self.auth_token,
             "Content-Type": "application/json"
         }
-        response = requests.post(
-            f"{self.base_url}/items/search?scroll=true",
-            headers=headers,
-            data=json.dumps(query)
-        )
-        if response.status_code != 200:
-            raise Exception("Failed to search for publications", response.status_code)
-        results = response.json()
-        items = results.get('records', [])
-        if isinstance(items, dict):
-            items = items.get('hits', {}).get('hits', []) or []
-        elif not isinstance(items, list):
-            items = list(items)
-        scroll_id = results.get('scrollId')
+        with request_policy(self.session, idempotent=True):
+            response = self.session.post(
+                f"{self.base_url}/items/search?scroll=true",
+                headers=headers,
+                data=json.dumps(with_source(query, source)),
+                stream=True
+            )
+        try:
+            if response.status_code != 200:
+                raise Exception("Failed to search for publications", response.status_code)
+            page = JSONStream(response.iter_content(chunk_size=SCROLL_CHUNK_SIZE),
+                              [("records",), ("records", "hits", "hits")])
+            for item in page:
+                yield as_record(item)
+        finally:
+            response.close()
+        scroll_id = page.document.get('scrollId')
         while scroll_id:
-            scroll_response = self.fetch_scroll_results(scroll_id)
-            if not scroll_response:
+            # each scroll call advances the cursor, so a repeated request could skip a page
+            with request_policy(self.session, idempotent=False):
+                response = self.session.get(
+                    f"{self.base_url}/items/search/scroll?scrollId={scroll_id}",
+                    headers=self.headers_json,
+                    stream=True
+                )
+            try:
+                if response.status_code != 200:
+                    raise Exception("Failed to fetch scroll page", response.status_code)
+                page = JSONStream(response.iter_content(chunk_size=SCROLL_CHUNK_SIZE), [("hits", "hits")])
+                hits = 0
+                for hit in page:
+                    hits += 1
+                    yield as_record(hit)
+            finally:
+                response.close()
+            if not hits:
                 break
-            items.extend(scroll_response.get('hits', {}).get('hits', []))
-            scroll_id = scroll_response.get('_scroll_id')
-        return items
+            scroll_id = page.document.get('_scroll_id')
 
-    def fetch_all_organizations(self, size=10000):
-        query = {
-            "query": {
-                "match_all": {}
-            },
-            "size": size,
-            "_source": ["metadata.creators.person.organizations"]
-        }
-        headers = {
-            "Authorization": self.auth_token,
-            "Content-Type": "application/json"
-        }
-        response = requests.post(
-            f"{self.base_url}/items/search",
-            headers=headers,
-            data=json.dumps(query)
-        )
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to fetch organizations: {response.status_code}")
-        results = response.json().get('records', [])
-        organizations = {}
-        for record in results:
-            data = record.get('data', {})
-            metadata = data.get('metadata', {})
-            for creator in metadata.get("creators", []):
-                person = creator.get("person", {})
-                for org in person.get("organizations", []):
-                    org_id = org.get("identifier")
-                    org_name = org.get("name")
-                    if org_id and org_name:
-                        organizations[org_name.strip()] = org_id.strip()
+    def iter_organization_records(self, modified_since=None, page_size=1000):
+        """
+        Yield every item (or every item modified at or after `modified_since`), projected
+        to the creators' organizations and lastModificationDate.
+        """
+        query = {"match_all": {}}
+        if modified_since:
+            query = {"range": {"lastModificationDate": {"gte": modified_since}}}
+        yield from self.iter_scroll({"query": query, "size": page_size},
+                                    source=["lastModificationDate", "metadata.creators.person.organizations"])
 
+    def fetch_all_organizations(self):
+        """Map every organization name found on any PuRe item to its id."""
+        organizations = {}
+        for record in self.iter_organization_records():
+            for org_name, org_id in record_organizations(record):
+                organizations[org_name] = org_id
         return organizations
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import logging
+
+import jwt
+
+from pubman_manager import USER_DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+TOKEN_CACHE_FILE = USER_DATA_DIR / ".token_cache.json"
+# Tokens closer than this to their expiry are refreshed instead of reused
+REFRESH_MARGIN = 300
+
+_lock = threading.Lock()
+
+
+def token_expiry(auth_token):
+    """Return the JWT `exp` claim (unix time), or None if the token has none."""
+    try:
+        exp = jwt.decode(auth_token, options={"verify_signature": False}).get("exp")
+    except jwt.PyJWTError:
+        return None
+    return float(exp) if exp is not None else None
+
+
+def is_fresh(auth_token, now=None):
+    exp = token_expiry(auth_token)
+    return exp is not None and exp - (now or time.time()) > REFRESH_MARGIN
+
+
+def _token_key(auth_token):
+    return hashlib.sha256(auth_token.encode("utf-8")).hexdigest()
+
+
+def _login_key(username, password):
+    """Cache key of a login; a changed password doesn't reuse the old token."""
+    derived = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), username.encode("utf-8"), 100_000)
+    return f"{username}:{derived.hex()}"
+
+
+def _load():
+    try:
+        with open(TOKEN_CACHE_FILE, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(cache):
+    now = time.time()
+    cache["tokens"] = {k: v for k, v in cache.get("tokens", {}).items() if is_fresh(v["auth_token"], now)}
+    cache["user_info"] = {k: v for k, v in cache.get("user_info", {}).items() if v["expires"] - now > REFRESH_MARGIN}
+    tmp_path = TOKEN_CACHE_FILE.with_name(f"{TOKEN_CACHE_FILE.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump(cache, fh)
+    os.replace(tmp_path, TOKEN_CACHE_FILE)
+
+
+def cached_login(username, password, login, stale_token=None):
+    """
+    Return (auth_token, user_id) for `username` and `password`, reusing a cached token
+    until it is within REFRESH_MARGIN of its `exp` claim or it is the `stale_token` PuRe
+    just rejected. Otherwise `login(username, password)` is called and its token
+    cached. Tokens without `exp` are never cached.
+    """
+    key = _login_key(username, password)
+    with _lock:
+        entry = _load().get("tokens", {}).get(key)
+        if entry and entry["auth_token"] != stale_token and is_fresh(entry["auth_token"]):
+            logger.debug(f"Reusing cached PuRe token for '{username}'")
+            return entry["auth_token"], entry["user_id"]
+
+        auth_token, user_id = login(username, password)
+        if token_expiry(auth_token) is not None:
+            cache = _load()
+            cache.setdefault("tokens", {})[key] = {"auth_token": auth_token, "user_id": user_id}
+            _save(cache)
+        return auth_token, user_id
+
+
+def cached_user_info(auth_token, user_id, get_user_info):
+    """Return `get_user_info(auth_token, user_id)`, cached for the token's lifetime."""
+    key = _token_key(auth_token)
+    with _lock:
+        entry = _load().get("user_info", {}).get(key)
+        if entry and entry["user_id"] == user_id and entry["expires"] - time.time() > REFRESH_MARGIN:
+            return dict(entry["info"])
+
+        info = get_user_info(auth_token, user_id)
+        expires = token_expiry(auth_token)
+        if expires is not None:
+            cache = _load()
+            cache.setdefault("user_info", {})[key] = {"user_id": user_id, "expires": expires, "info": info}
+            _save(cache)
+        return info
+
+
+def clear_token_cache():
+    with _lock:
+        try:
+            os.remove(TOKEN_CACHE_FILE)
+        except FileNotFoundError:
+            pass
@@ -1,6 +1,7 @@
 from pathlib import Path
 from ruamel.yaml import YAML
 import re
+import threading
 from dateutil import parser
 import pandas as pd
 
@@ -20,12 +21,91 @@ def load_yaml(file_path):
     with path.open("r", encoding="utf-8") as fh:
         return yaml_obj.load(fh)
 
+class FrozenDict(dict):
+    """dict that refuses modification; returned inside cached YAML snapshots."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached YAML snapshots are read-only, copy them before modifying")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(data):
+    """Recursively convert dicts to FrozenDicts and lists to tuples."""
+    if isinstance(data, dict):
+        return FrozenDict((key, freeze(value)) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return tuple(freeze(value) for value in data)
+    return data
+
+
+_snapshots = {}
+_snapshots_lock = threading.Lock()
+
+
+def _snapshot_entry(file_path):
+    path = Path(file_path).resolve()
+    if not path.exists():
+        raise FileNotFoundError(f"YAML file not found: {path}")
+    stat = path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _snapshots_lock:
+        entry = _snapshots.get(path)
+        if entry is not None and entry["version"] == version:
+            return entry
+    logger.debug(f"Loading YAML snapshot {path}")
+    entry = {"version": version, "data": freeze(load_yaml(path)), "derived": {}}
+    with _snapshots_lock:
+        _snapshots[path] = entry
+    return entry
+
+
+def load_yaml_snapshot(file_path):
+    """
+    Load `file_path` as a read-only snapshot shared across the process.
+
+    The parsed data is cached by path and reparsed only when the file's mtime or size
+    changes, so repeated PubmanCreator/DOIParser instantiations don't re-read the caches.
+    """
+    return _snapshot_entry(file_path)["data"]
+
+
+def load_yaml_derived(file_path, name, build):
+    """
+    Return `build(snapshot)` for the current snapshot of `file_path`, computed once per
+    file version and cached under `name`. The result is shared, don't modify it.
+    """
+    entry = _snapshot_entry(file_path)
+    derived = entry["derived"]
+    if name not in derived:
+        derived[name] = build(entry["data"])
+    return derived[name]
+
+
+def clear_yaml_snapshots():
+    with _snapshots_lock:
+        _snapshots.clear()
+
+
 def save_yaml(data, file_path):
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as fh:
         yaml_obj.dump(data, fh)
 
+def later_date(current, candidate):
+    """Return the later of two PuRe timestamps; None values are ignored."""
+    if not candidate:
+        return current
+    if not current:
+        return candidate
+    return candidate if parser.parse(candidate) > parser.parse(current) else current
+
 def normalize_user_id(user_id) -> str:
     user_id_str = str(user_id) if user_id is not None else ""
     if user_id_str.lower() == "metadata":
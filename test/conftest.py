@@ -39,12 +39,17 @@ def mock_calls_dir():
 
 @pytest.fixture
 def mock_pubman(monkeypatch):
-    """Force PubmanBase.search_publication_by_criteria to report no matches."""
+    """Force PubmanBase.search_publication_by_criteria(_batch) to report no matches."""
     monkeypatch.setattr(
         PubmanBase,
         "search_publication_by_criteria",
         lambda self, match_criteria, size=100000: [],
     )
+    monkeypatch.setattr(
+        PubmanBase,
+        "search_publications_by_criteria_batch",
+        lambda self, criteria_list, **kwargs: {},
+    )
 
 
 @pytest.fixture
@@ -205,6 +210,8 @@ def _make_response(entry: dict[str, Any]) -> requests.Response:
         resp._content = payload.encode("utf-8")
         resp.headers.setdefault("Content-Type", "text/plain")
     resp.encoding = "utf-8"
+    # recorded bodies are fully read, so streamed reads replay them too
+    resp._content_consumed = True
     return resp
 
 
@@ -272,6 +279,7 @@ def external_http_cache(monkeypatch, request, mock_calls_dir):
                 resp.headers["Content-Type"] = "application/json"
                 resp.headers["X-External-HTTP-Cache"] = "mocked-create-item"
                 resp.encoding = "utf-8"
+                resp._content_consumed = True
             else:
                 resp = real_request(self, method, url, **kwargs)
 
@@ -0,0 +1,43 @@
+import random
+
+from pubman_manager.pubman_extractor import PubmanExtractor
+
+
+def _reference(authors_info):
+    """The original nested-loop implementation."""
+    to_remove = []
+    for author in authors_info:
+        if '.' in author[0]:
+            if len(author[0].split()[0]) <= 2:
+                for author_ in authors_info:
+                    if len(author[0]) > 2 and author_[1] == author[1] and author[0][0] == author_[0][0]:
+                        to_remove.append(author)
+            elif (author[0].split()[0], author[1]) in authors_info:
+                to_remove.append(author)
+    for author in set(to_remove):
+        del authors_info[author]
+
+    full_names = {name for name in authors_info.keys() if '.' not in name[0].split()[0]}
+    abbreviated_names = {name for name in authors_info.keys() if '.' in name[0].split()[0]}
+    for abbreviated_name in abbreviated_names:
+        for full_name in full_names:
+            if abbreviated_name[1] != full_name[1]:
+                continue
+            ab_first = abbreviated_name[0].split()[0]
+            full_first = full_name[0].split()[0]
+            if ('.' not in ab_first and ab_first == full_first) or ('.' in ab_first and ab_first[0] == full_first[0]):
+                authors_info.pop(abbreviated_name, None)
+                break
+
+
+def test_abbreviated_name_dedup_matches_nested_loops():
+    rng = random.Random(11)
+    firsts = ["J.", "J", "J. K.", "Jo.", "Jo. K.", "John", "Jane", "K.", "Karl", "J.K.", "Jo", "Joh.", "John K.", "A. B. C."]
+    surnames = ["Doe", "Roe", "Poe", "Mentock", "Diehl"]
+    for _ in range(50):
+        names = {(rng.choice(firsts), rng.choice(surnames)) for _ in range(rng.randint(1, 30))}
+        expected = {name: {} for name in names}
+        actual = {name: {} for name in names}
+        _reference(expected)
+        PubmanExtractor._remove_abbreviated_duplicates(actual)
+        assert list(actual) == list(expected)
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+from rapidfuzz import fuzz
+
+from pubman_manager.affiliation_clustering import MIN_THRESHOLD, AffiliationClusterer, similarity_key
+
+
+def _reference_clusters(strings, threshold):
+    """Plain extractOne-style clustering against every representative."""
+    reps, assigned = [], []
+    for s in strings:
+        scores = [round(fuzz.token_set_ratio(similarity_key(s), similarity_key(r))) for r in reps]
+        best = max(range(len(reps)), key=lambda i: (scores[i], -i), default=None)
+        if best is not None and scores[best] >= threshold:
+            assigned.append(reps[best])
+        else:
+            reps.append(s)
+            assigned.append(s)
+    return assigned
+
+
+def test_clusterer_matches_exhaustive_search():
+    rng = random.Random(7)
+    words = ["Max", "Planck", "Institut", "für", "Eisenforschung", "GmbH", "Society", "Department",
+             "Microstructure", "Physics", "Alloy", "Design", "Düsseldorf", "Germany", "Materials", "a", "b"]
+    strings = []
+    for _ in range(400):
+        tokens = rng.sample(words, rng.randint(1, 6))
+        s = ", ".join(tokens)
+        if rng.random() < 0.3:
+            i = rng.randrange(len(s))
+            s = s[:i] + rng.choice("xyz-") + s[i + 1:]
+        strings.append(s)
+    strings += strings[:50]
+
+    for threshold in (MIN_THRESHOLD, 95):
+        clusterer = AffiliationClusterer(threshold)
+        assert [clusterer.add(s) for s in strings] == _reference_clusters(strings, threshold)
+
+
+def test_clusterer_groups_near_duplicates():
+    clusterer = AffiliationClusterer(95)
+    rep = clusterer.add("Max-Planck-Institut für Eisenforschung GmbH, Max Planck Society")
+    assert clusterer.add("Max-Planck-Institut fur Eisenforschung GmbH; Max Planck Society") == rep
+    assert clusterer.add("Max Planck Institute for Sustainable Materials") != rep
+    assert clusterer.representatives == [rep, "Max Planck Institute for Sustainable Materials"]
+
+
+def test_clusterer_rejects_thresholds_blocking_cant_serve():
+    with pytest.raises(ValueError):
+        AffiliationClusterer(MIN_THRESHOLD - 1)
+
+
+def test_clusterer_matches_exhaustive_search_on_short_strings():
+    # short strings over a small alphabet come closest without sharing a blocking key
+    rng = random.Random(11)
+    strings = ["MPIE", "MPxIE", "IFAM", "IFxAM", "abcd", "abxcd", "aa ac", "aaac"]
+    strings += ["".join(rng.choice("abc ") for _ in range(rng.randint(1, 7))) for _ in range(800)]
+    assert round(fuzz.token_set_ratio("abcd", "abxcd")) == MIN_THRESHOLD - 1
+
+    for threshold in (MIN_THRESHOLD, MIN_THRESHOLD + 1, 95):
+        clusterer = AffiliationClusterer(threshold)
+        assert [clusterer.add(s) for s in strings] == _reference_clusters(strings, threshold)
@@ -0,0 +1,68 @@
+from collections import Counter
+
+from pubman_manager import affiliation_decisions
+from pubman_manager.affiliation_decisions import AffiliationDecisionCache, get_decision_cache
+from pubman_manager.doi_parser import DecisionColor, DOIParser
+import pubman_manager.doi_parser as doi_parser_module
+
+
+def _parser(tmp_path, version):
+    dp = DOIParser.__new__(DOIParser)
+    dp.authors_affiliation_counters = {("Alice", "Smith"): Counter({"University X": 3, "Institute Y": 1})}
+    dp.authors_info_version = version
+    dp.decision_cache = AffiliationDecisionCache(tmp_path / "decisions.sqlite")
+    return dp
+
+
+def test_decisions_are_reused_across_runs_of_the_same_version(tmp_path, monkeypatch):
+    affiliations = {("Alice", "Smith"): ["University X, Somewhere", "Unrelated Company"]}
+    first = DOIParser.compare_author_list_to_pure_db(_parser(tmp_path, "v1"), affiliations)[("Alice", "Smith")]
+    assert [(res.affiliation, res.color) for res in first] == [
+        ("University X", DecisionColor.GREEN), ("Unrelated Company", DecisionColor.GRAY),
+    ]
+
+    calls = []
+    match = doi_parser_module.find_best_fuzzy_match
+    monkeypatch.setattr(doi_parser_module, "find_best_fuzzy_match", lambda *args: calls.append(args) or match(*args))
+
+    dp = _parser(tmp_path, "v1")
+    assert len(dp.decision_cache) == 2
+    again = DOIParser.compare_author_list_to_pure_db(dp, affiliations)[("Alice", "Smith")]
+    assert again == first
+    assert calls == []
+
+    # a refreshed authors_info decides anew
+    DOIParser.compare_author_list_to_pure_db(_parser(tmp_path, "v2"), affiliations)
+    assert len(calls) == 2
+
+
+def test_decisions_of_one_comparison_are_written_in_one_batch(tmp_path, monkeypatch):
+    batches = []
+    put_many = AffiliationDecisionCache.put_many
+    monkeypatch.setattr(AffiliationDecisionCache, "put_many",
+                        lambda self, version, decisions: batches.append(list(decisions)) or put_many(self, version, decisions))
+
+    dp = _parser(tmp_path, "v1")
+    DOIParser.compare_author_list_to_pure_db(dp, {("Alice", "Smith"): ["University X, Somewhere", "Unrelated Company"]})
+
+    assert [[decision[1] for decision in batch] for batch in batches] == [["University X, Somewhere", "Unrelated Company"]]
+    assert len(dp.decision_cache) == 2
+
+
+def test_old_decisions_are_pruned(tmp_path):
+    with AffiliationDecisionCache(tmp_path / "decisions.sqlite") as cache:
+        cache.put("v1", ("Alice", "Smith"), "University X", "University X", "GREEN", 0.1)
+        assert cache.get("v1", ("Alice", "Smith"), "University X") == ("University X", "GREEN", 0.1)
+    with AffiliationDecisionCache(tmp_path / "decisions.sqlite", max_age=-1) as cache:
+        assert cache.get("v1", ("Alice", "Smith"), "University X") is None
+        # stale rows are only deleted with the first write
+        assert len(cache) == 1
+        cache.put("v2", ("Alice", "Smith"), "University X", "University X", "GREEN", 0.1)
+        assert len(cache) == 1
+
+
+def test_decision_cache_is_shared_per_process(tmp_path, monkeypatch):
+    monkeypatch.setattr(affiliation_decisions, "AFFILIATION_DECISIONS_FILE", tmp_path / "decisions.sqlite")
+    monkeypatch.setattr(affiliation_decisions, "_shared_cache", None)
+    assert get_decision_cache() is get_decision_cache()
+    assert get_decision_cache().path == tmp_path / "decisions.sqlite"
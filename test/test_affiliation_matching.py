@@ -1,3 +1,5 @@
+from collections import Counter
+
 from pubman_manager.doi_parser import DOIParser
 
 
@@ -20,3 +22,29 @@ def test_affiliation_reuses_similar_publisher_affiliation_without_pure_history()
     bob_aff = results[("Bob", "Jones")][0].affiliation
 
     assert alice_aff == bob_aff
+
+
+def test_ranked_affiliations_are_precomputed_per_author():
+    dp = DOIParser.__new__(DOIParser)
+    dp.authors_affiliation_counters = {
+        ("Alice", "Smith"): Counter({
+            "University X": 2,
+            "Max-Planck-Institut für Eisenforschung GmbH": 5,
+            "University Y": 2,
+            "Max Planck Institute for Iron Research": 1,
+        }),
+    }
+
+    ranked = dp.ranked_affiliations[("Alice", "Smith")]
+
+    assert ranked.ranked == ("Max-Planck-Institut für Eisenforschung GmbH", "University X", "University Y",
+                             "Max Planck Institute for Iron Research")
+    assert ranked.mpi == ("Max-Planck-Institut für Eisenforschung GmbH", "Max Planck Institute for Iron Research")
+    assert ranked.external == ("University X", "University Y")
+
+    results = DOIParser.compare_author_list_to_pure_db(dp, {
+        ("Alice", "Smith"): ["Max Planck Institute for Iron Research", "University X, Somewhere"],
+    })
+    assert [res.affiliation for res in results[("Alice", "Smith")]] == [
+        "Max-Planck-Institut für Eisenforschung GmbH", "University X",
+    ]
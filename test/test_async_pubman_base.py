@@ -0,0 +1,58 @@
+import threading
+import time
+
+from pubman_manager.async_pubman_base import AsyncPubmanBase, run_sync
+
+
+class FakePubman:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def search_publication_by_criteria(self, match_criteria, size=100000, source=None):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return [{"data": {"objectId": match_criteria["metadata.identifiers"]["id"]}}]
+
+    def delete_item(self, item_id, last_modification_date):
+        return item_id != "item_locked"
+
+
+def test_search_many_keeps_order_and_respects_concurrency():
+    pubman = FakePubman()
+    async_api = AsyncPubmanBase(pubman, concurrency=3)
+    dois = [f"10.1000/{i}" for i in range(12)]
+    criteria = [{"metadata.identifiers": {"id": doi, "type": "DOI"}} for doi in dois]
+
+    results = run_sync(async_api.search_publications_by_criteria_many(criteria))
+
+    assert [records[0]["data"]["objectId"] for records in results] == dois
+    assert 1 < pubman.max_in_flight <= 3
+
+
+def test_delete_items_returns_one_result_per_item():
+    async_api = AsyncPubmanBase(FakePubman())
+    items = [("item_1", "t1"), ("item_locked", "t2"), ("item_3", "t3")]
+    assert run_sync(async_api.delete_items(items)) == [True, False, True]
+    # a second event loop must not trip over the semaphore of the first one
+    assert run_sync(async_api.delete_items(items[:1])) == [True]
+
+
+def test_concurrency_limit_holds_across_event_loops():
+    pubman = FakePubman()
+    async_api = AsyncPubmanBase(pubman, concurrency=2)
+    criteria = [{"metadata.identifiers": {"id": f"10.1000/{i}", "type": "DOI"}} for i in range(6)]
+
+    threads = [threading.Thread(target=run_sync, args=(async_api.search_publications_by_criteria_many(criteria),))
+               for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert pubman.max_in_flight == 2
@@ -0,0 +1,112 @@
+from pubman_manager.doi_parser import AuthorNameIndex, DOIParser, normalize_name_for_comparison
+
+
+def _scan(pure_author_names, first_name, surname):
+    """The linear scan the index replaces."""
+    surname_key = normalize_name_for_comparison(surname)
+    first_key = normalize_name_for_comparison(first_name)
+    primary_key = normalize_name_for_comparison(first_name.split()[0] if first_name else "")
+    for pure_first, pure_last in pure_author_names:
+        if surname_key != normalize_name_for_comparison(pure_last):
+            continue
+        if first_key == normalize_name_for_comparison(pure_first):
+            return pure_first, pure_last
+        if primary_key == normalize_name_for_comparison(pure_first.split()[0] if pure_first else ""):
+            return pure_first, pure_last
+    return None
+
+
+PURE_NAMES = [
+    ("Hans Peter", "Müller"),
+    ("Hans", "Mueller"),
+    ("HansPeter", "Müller"),
+    ("J.-P.", "Dupont"),
+    ("Jean Pierre", "Dupont"),
+    ("Jean", "Dupont"),
+    ("Li", "Wang"),
+    ("", "Nobody"),
+]
+
+
+def test_index_resolves_like_a_scan():
+    dp = DOIParser.__new__(DOIParser)
+    dp.authors_affiliation_counters = {name: {} for name in PURE_NAMES}
+    queries = [
+        ("Hans Peter", "Muller"),
+        ("Hans-Peter", "Müller"),
+        ("Hans", "Müller"),
+        ("Hans", "Mueller"),
+        ("Jean", "Dupont"),
+        ("Jean-Pierre", "Dupont"),
+        ("J.-P.", "Dupont"),
+        ("Jean Paul", "Dupont"),
+        ("L.", "Wang"),
+        ("Li", "WANG"),
+        ("", "Nobody"),
+        ("Anna Maria", "Unknown"),
+    ]
+    for first_name, surname in queries:
+        expected = _scan(PURE_NAMES, first_name, surname)
+        assert dp.author_name_index.resolve(first_name, surname) == expected
+        if expected:
+            assert dp.compare_author_name_to_pure_db(PURE_NAMES, first_name, surname) == expected
+
+
+def test_earliest_match_wins_across_both_keys():
+    index = AuthorNameIndex([("Hans", "Müller"), ("Hans Peter", "Müller")])
+    # the full-name match comes later than the primary-name match
+    assert index.resolve("Hans Peter", "Müller") == ("Hans", "Müller")
+    assert index.resolve("Peter", "Müller") is None
+
+
+def test_transliteration_variants_resolve_approximately():
+    dp = DOIParser.__new__(DOIParser)
+    dp.authors_affiliation_counters = {name: {} for name in [
+        ("Jörg", "Straßburger"), ("Hans Peter", "Müller"), ("Li", "Wang"), ("Lei", "Wang"), ("Zoë", "Brontë"),
+    ]}
+    resolve = lambda first, last: dp.compare_author_name_to_pure_db(dp.author_name_index, first, last)
+
+    assert resolve("Joerg", "Strassburger") == ("Jörg", "Straßburger")
+    assert resolve("Hans", "Mueller") == ("Hans Peter", "Müller")
+    assert resolve("Hanspeter", "Muller") == ("Hans Peter", "Müller")
+    assert resolve("Zoe", "Bronte") == ("Zoë", "Brontë")
+    # ambiguous initial and unknown people fall back to the external name
+    assert resolve("L.", "Wang") == ("L.", "Wang")
+    assert resolve("Peter", "Mueller") == ("Peter", "Mueller")
+    assert resolve("Anna", "Wong") == ("Anna", "Wong")
+
+
+def test_distinct_people_are_not_merged_approximately():
+    dp = DOIParser.__new__(DOIParser)
+    dp.authors_affiliation_counters = {name: {} for name in [
+        ("Wei", "Xue"), ("Min", "Shang"), ("Yu", "Yue"), ("Daniela", "Schmidt"), ("Jana", "Novak"), ("Yu", "Chen"),
+        ("Katharina", "Meier"),
+    ]}
+    resolve = lambda first, last: dp.compare_author_name_to_pure_db(dp.author_name_index, first, last)
+
+    assert resolve("Wei", "Xu") == ("Wei", "Xu")
+    assert resolve("Min", "Zhang") == ("Min", "Zhang")
+    assert resolve("Yu", "Yu") == ("Yu", "Yu")
+    assert resolve("Daniel", "Schmidt") == ("Daniel", "Schmidt")
+    assert resolve("Jan", "Novak") == ("Jan", "Novak")
+    # a short first name is not a bare initial
+    assert resolve("Yi", "Chen") == ("Yi", "Chen")
+    # similar names of different people are not merged, however close
+    dp.authors_affiliation_counters.update({("Christina", "Müller"): {}, ("Alexandra", "Schmidt"): {},
+                                            ("Jonas", "Neugebauer"): {}})
+    dp._author_name_index = None
+    assert resolve("Katherina", "Meier") == ("Katherina", "Meier")
+    assert resolve("Christian", "Müller") == ("Christian", "Müller")
+    assert resolve("Christian", "Mueller") == ("Christian", "Mueller")
+    assert resolve("Alexandre", "Schmidt") == ("Alexandre", "Schmidt")
+    # a bare initial is not resolved, even if only one PuRe author could be meant
+    assert resolve("C.", "Müller") == ("C.", "Müller")
+    assert resolve("J.", "Neugebauer") == ("J.", "Neugebauer")
+
+
+def test_large_transliteration_buckets_are_not_truncated():
+    names = [(f"Z{chr(97 + i // 26)}{chr(97 + i % 26)}", "Müller") for i in range(40)] + [("Zoë", "Müller")]
+    index = AuthorNameIndex(names)
+
+    assert index.resolve_approximate("Zoe", "Mueller") == ("Zoë", "Müller")
+    assert index.resolve_approximate("Zbn", "Mueller") == ("Zbn", "Müller")
@@ -0,0 +1,111 @@
+import threading
+import time
+
+from pubman_manager.doi_parser import DOIParser
+
+
+class FakeManager:
+    def __init__(self, overviews):
+        self.overviews = overviews
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get_overview(self, doi):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return dict(self.overviews.get(doi, {}))
+
+
+def test_collects_crossref_and_scopus_concurrently_in_doi_order():
+    dois = [f"10.1000/{i}" for i in range(10)]
+    dp = DOIParser.__new__(DOIParser)
+    dp.crossref_manager = FakeManager({doi: {"Title": f"Title {doi}", "Field": [], "crossref": doi} for doi in dois})
+    dp.scopus_manager = FakeManager({
+        dois[1]: {"scopus": "s1", "Field": ["Authors have no Max-Planck affiliation (Scopus)"]},
+        dois[2]: {"scopus": "s2"},
+    })
+
+    df = dp.collect_data_for_dois(dois[:6], dois[4:])
+
+    assert list(df["DOI"]) == dois
+    assert dp.crossref_manager.max_in_flight > 1
+    assert dp.scopus_manager.max_in_flight > 1
+    by_doi = df.set_index("DOI")
+    assert by_doi.loc[dois[1], "Field"] == "Authors have no Max-Planck affiliation (Scopus)"
+    assert by_doi.loc[dois[1], "scopus"] == "s1"
+    assert by_doi.loc[dois[2], "scopus"] == "s2"
+    assert by_doi.loc[dois[0], "Title"] == f"Title {dois[0]}"
+
+
+def test_scopus_author_name_cache_is_thread_safe(tmp_path):
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+
+    import requests
+    import yaml
+
+    from pubman_manager.api_manager_scopus import ScopusManager
+
+    class FakeSession:
+        def get(self, url, headers=None, **kwargs):
+            author_id = url.rsplit("/", 1)[-1]
+            resp = requests.Response()
+            resp.status_code = 200
+            resp._content = json.dumps({"author-retrieval-response": [{"author-profile": {
+                "preferred-name": {"given-name": f"First{author_id}", "surname": f"Last{author_id}"},
+            }}]}).encode("utf-8")
+            return resp
+
+    class NoWait:
+        def wait(self):
+            pass
+
+    cache_path = tmp_path / "scopus_author_names.yaml"
+    scopus = ScopusManager("MPI", api_key="key", author_name_cache_path=cache_path)
+    scopus.session = FakeSession()
+    scopus.rate_limiter = NoWait()
+
+    author_ids = [str(i) for i in range(50)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        names = list(executor.map(scopus.get_author_full_name, author_ids))
+
+    assert names == [(f"First{i}", f"Last{i}") for i in author_ids]
+    with cache_path.open(encoding="utf-8") as fh:
+        assert len(yaml.safe_load(fh)) == 50
+    assert list(tmp_path.iterdir()) == [cache_path]
+
+
+def test_crossref_metadata_failures_are_not_silently_dropped():
+    import json
+
+    import pytest
+    import requests
+
+    from pubman_manager.api_manager_crossref import CrossrefManager
+
+    class FakeSession:
+        def __init__(self):
+            self.calls = []
+
+        def get(self, url, **kwargs):
+            self.calls.append(url)
+            doi = url.split("/works/", 1)[1]
+            resp = requests.Response()
+            resp.status_code = {"10.1000/missing": 404, "10.1000/down": 503}.get(doi, 200)
+            resp._content = json.dumps({"message": {"DOI": doi}}).encode("utf-8")
+            return resp
+
+    crossref = CrossrefManager()
+    crossref.session = FakeSession()
+
+    assert crossref.get_metadata("10.1000/ok") == {"DOI": "10.1000/ok"}
+    assert crossref.get_metadata("10.1000/ok") == {"DOI": "10.1000/ok"}
+    assert crossref.get_metadata("10.1000/missing") is None
+    with pytest.raises(RuntimeError, match="503"):
+        crossref.get_metadata("10.1000/down")
+    assert crossref.session.calls.count("https://api.crossref.org/works/10.1000/ok") == 1
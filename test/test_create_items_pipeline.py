@@ -0,0 +1,99 @@
+import random
+import threading
+import time
+
+import pytest
+
+from pubman_manager.pubman_base import criteria_key
+from pubman_manager.pubman_creator import CREATE_WORKERS, PubmanCreator
+
+
+class FakeCreator(PubmanCreator):
+    def __init__(self, existing, undeletable=()):
+        self.existing = existing
+        self.undeletable = set(undeletable)
+        self.lock = threading.Lock()
+        self.created = []
+        self.submitted = []
+        self.deleted = []
+
+    def search_publications_by_criteria_batch(self, criteria_list, **kwargs):
+        return {criteria_key(c): self.existing[c["metadata.title"]] for c in criteria_list
+                if c["metadata.title"] in self.existing}
+
+    def delete_item(self, item_id, last_modification_date):
+        with self.lock:
+            self.deleted.append(item_id)
+        return item_id not in self.undeletable
+
+    def create_item(self, request_json):
+        time.sleep(random.uniform(0, 0.01))
+        title = request_json["metadata"]["title"]
+        with self.lock:
+            self.created.append(title)
+        return {"objectId": f"new_{title}", "lastModificationDate": "2024", "versionState": "PENDING"}
+
+    def submit_item(self, item_id, last_modification_date):
+        time.sleep(random.uniform(0, 0.01))
+        with self.lock:
+            self.submitted.append(item_id)
+        return item_id
+
+
+def _existing(object_id, state="PENDING"):
+    return [{"data": {"objectId": object_id, "lastModificationDate": "2023", "versionState": state}}]
+
+
+def _requests(titles):
+    return [({"metadata.title": t}, {"metadata": {"title": t}}) for t in titles]
+
+
+def test_create_items_pipeline_counts_and_submits():
+    titles = [f"t{i}" for i in range(20)]
+    creator = FakeCreator({"t3": _existing("old_t3"), "t7": _existing("old_t7", state="RELEASED")})
+
+    summary = creator.create_items(_requests(titles), submit_items=True)
+
+    assert summary == {"created": 18, "skipped_existing": 2, "blocked_existing": 0, "total": 20}
+    assert sorted(creator.created) == sorted(set(titles) - {"t3", "t7"})
+    # released items are not resubmitted, pending existing ones are
+    assert sorted(creator.submitted) == sorted([f"new_{t}" for t in titles if t not in ("t3", "t7")] + ["old_t3"])
+
+
+def test_create_items_overwrite_blocks_released_items():
+    creator = FakeCreator({"a": _existing("old_a"), "b": _existing("old_b")}, undeletable={"old_b"})
+
+    summary = creator.create_items(_requests(["a", "b", "c"]), overwrite=True)
+
+    assert summary == {"created": 2, "skipped_existing": 0, "blocked_existing": 1, "total": 3}
+    assert sorted(creator.created) == ["a", "c"]
+    assert sorted(creator.deleted) == ["old_a", "old_b"]
+    assert creator.submitted == []
+
+
+def test_create_items_creates_duplicate_rows_once():
+    creator = FakeCreator({})
+
+    summary = creator.create_items(_requests(["a", "b", "a"]), submit_items=True)
+
+    assert summary == {"created": 2, "skipped_existing": 1, "blocked_existing": 0, "total": 3}
+    assert sorted(creator.created) == ["a", "b"]
+    assert sorted(creator.submitted) == ["new_a", "new_b"]
+
+
+def test_create_items_stops_at_the_first_failed_row():
+    class FailingCreator(FakeCreator):
+        def create_item(self, request_json):
+            if request_json["metadata"]["title"] == "t0":
+                raise Exception("Failed to create item", 500, "")
+            time.sleep(0.05)
+            return super().create_item(request_json)
+
+    creator = FailingCreator({})
+
+    with pytest.raises(Exception, match="Failed to create item"):
+        creator.create_items(_requests([f"t{i}" for i in range(40)]), submit_items=True)
+
+    # only rows already picked up by the create workers were completed
+    assert len(creator.created) <= CREATE_WORKERS
+    assert "t0" not in creator.created
@@ -0,0 +1,35 @@
+import random
+
+from pubman_manager import pubman_extractor
+from pubman_manager.pubman_extractor import PubmanExtractor
+
+
+def _publications(n_records=300, seed=3):
+    rng = random.Random(seed)
+    surnames = ["Mentock", "Roongta", "Diehl", "Roters", "Eisenlohr", "Raabe"]
+    orgs = ["Max-Planck-Institut für Eisenforschung GmbH, Max Planck Society", "KU Leuven, Belgium",
+            "Michigan State University, USA", "RWTH Aachen University", "Theory and Simulation, Düsseldorf"]
+    records = []
+    for _ in range(n_records):
+        creators = []
+        for surname in rng.sample(surnames, 3):
+            name = rng.choice(orgs)
+            if rng.random() < 0.5:
+                name = f"Department {rng.randint(1, 40)}, {name}"
+            creators.append({"person": {"givenName": surname[0] + "ane", "familyName": surname,
+                                        "organizations": [{"name": name}]}})
+        records.append({"data": {"metadata": {"creators": creators}}})
+    return records
+
+
+def test_parallel_clustering_matches_serial(monkeypatch):
+    monkeypatch.setattr(pubman_extractor, "MIN_PARALLEL_AFFILIATIONS", 10)
+    extractor = PubmanExtractor.__new__(PubmanExtractor)
+    publications = _publications()
+
+    serial = extractor.extract_authors_info(publications)
+    parallel = extractor.extract_authors_info(publications, workers=2)
+
+    assert list(parallel.items()) == list(serial.items())
+    assert all(list(parallel[a]["affiliation_counts"].items()) == list(serial[a]["affiliation_counts"].items())
+               for a in serial)
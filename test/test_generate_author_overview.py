@@ -37,6 +37,9 @@ def test_generate_author_overview_filters_existing_pure(tmp_path, monkeypatch):
         def has_pubman_entry(self, doi, title=None):
             return doi == "10.1111/aaa"
 
+        def has_pubman_entries(self, candidates):
+            return {doi for doi, title in candidates if self.has_pubman_entry(doi, title=title)}
+
         def process_dois(self, dois_data):
             return []
 
@@ -46,7 +49,7 @@ def test_generate_author_overview_filters_existing_pure(tmp_path, monkeypatch):
     monkeypatch.setattr(pubman_main, "PubmanCreator", DummyCreator)
     monkeypatch.setattr(pubman_main, "DOIParser", FakeParser)
 
-    pubman_main.generate_author_overview(user_yaml, update_user_yaml=False)
+    pubman_main.generate_author_overview(user_yaml, output_path=tmp_path / "overview.xlsx", update_user_yaml=False)
 
     cache_path = user_yaml.parent / "publication_collection_history.yaml"
     cache_data = yaml.safe_load(cache_path.read_text(encoding="utf-8"))
@@ -92,7 +95,7 @@ def test_generate_author_overview_handles_legacy_cache(tmp_path, monkeypatch):
     monkeypatch.setattr(pubman_main, "PubmanCreator", DummyCreator)
     monkeypatch.setattr(pubman_main, "DOIParser", FakeParser)
 
-    pubman_main.generate_author_overview(user_yaml, update_user_yaml=False)
+    pubman_main.generate_author_overview(user_yaml, output_path=tmp_path / "overview.xlsx", update_user_yaml=False)
 
     cache_data = pubman_main._load_doi_cache(legacy_cache)
     assert isinstance(cache_data, dict)
@@ -0,0 +1,203 @@
+import threading
+
+import pytest
+import requests
+
+from pubman_manager import http_session
+from pubman_manager.http_session import PooledSession, RateLimiter, configure_session, get_session
+
+
+def test_get_session_is_shared_per_service():
+    assert get_session("pubman") is get_session("pubman")
+    assert get_session("pubman") is not get_session("crossref")
+
+
+def test_pooled_session_applies_default_timeout(monkeypatch):
+    captured = {}
+
+    def fake_request(self, method, url, **kwargs):
+        captured.update(kwargs)
+        return requests.Response()
+
+    monkeypatch.setattr(requests.sessions.Session, "request", fake_request)
+
+    session = PooledSession(pool_size=2, timeout=(1, 5))
+    session.get("https://pure.mpg.de/rest/items/item_1")
+    assert captured["timeout"] == (1, 5)
+
+    session.get("https://pure.mpg.de/rest/items/item_1", timeout=30)
+    assert captured["timeout"] == 30
+
+
+def test_configure_session_replaces_shared_session():
+    old = get_session("test-service")
+    new = configure_session("test-service", pool_size=4, timeout=(2, 10))
+    assert new is not old
+    assert get_session("test-service") is new
+    assert new.pool_size == 4
+
+
+def _response(status, headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update(headers or {})
+    resp._content = b"{}"
+    resp._content_consumed = True
+    return resp
+
+
+def _patch(monkeypatch, outcomes):
+    """Replay `outcomes` (responses or exceptions) for Session.request; sleeps are recorded."""
+    from pubman_manager import http_session
+    sleeps = []
+    monkeypatch.setattr(http_session.time, "sleep", sleeps.append)
+    outcomes = list(outcomes)
+    scripted = type("Scripted", (), {"calls": 0})()
+
+    def fake_request(self, method, url, **kwargs):
+        scripted.calls += 1
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(requests.sessions.Session, "request", fake_request)
+    return scripted, sleeps
+
+
+def test_retries_transient_failures_honoring_retry_after(monkeypatch):
+    scripted, sleeps = _patch(monkeypatch, [
+        requests.ConnectionError("reset"),
+        _response(503, {"Retry-After": "7"}),
+        _response(200),
+    ])
+    response = PooledSession().get("https://api.crossref.org/works")
+    assert response.status_code == 200
+    assert scripted.calls == 3
+    assert sleeps[1] == 7.0
+
+
+def test_post_is_only_retried_when_marked_idempotent(monkeypatch):
+    scripted, _ = _patch(monkeypatch, [_response(503), _response(503), _response(200)])
+    session = PooledSession()
+    assert session.post("https://pure.mpg.de/rest/items").status_code == 503
+    assert scripted.calls == 1
+    with session.policy(idempotent=True):
+        assert session.post("https://pure.mpg.de/rest/items/search").status_code == 200
+    assert scripted.calls == 3
+
+
+def test_put_and_delete_are_only_retried_when_marked_idempotent(monkeypatch):
+    scripted, _ = _patch(monkeypatch, [_response(503), _response(503), _response(503), _response(200)])
+    session = PooledSession()
+    assert session.put("https://pure.mpg.de/rest/items/item_1/submit").status_code == 503
+    assert session.delete("https://pure.mpg.de/rest/items/item_1").status_code == 503
+    assert scripted.calls == 2
+    with session.policy(idempotent=True):
+        assert session.put("https://pure.mpg.de/rest/items/item_1").status_code == 200
+    assert scripted.calls == 4
+
+
+def test_give_up_and_retry_budget(monkeypatch):
+    from pubman_manager.http_session import RetryPolicy
+    scripted, sleeps = _patch(monkeypatch, [
+        _response(429, {"X-ELS-Status": "QUOTA_EXCEEDED"}),
+        _response(429, {"Retry-After": "600"}),
+    ])
+    session = PooledSession(retry=RetryPolicy(max_retry_time=60))
+    quota = lambda resp: "QUOTA_EXCEEDED" in resp.headers.get("X-ELS-Status", "")
+    with session.policy(give_up=quota):
+        assert session.get("https://api.elsevier.com/a").status_code == 429
+    assert session.get("https://api.elsevier.com/a").status_code == 429
+    assert scripted.calls == 2
+    assert sleeps == []
+
+
+def test_rate_limiter_is_waited_for_before_every_attempt(monkeypatch):
+    scripted, _ = _patch(monkeypatch, [_response(503), _response(503), _response(200)])
+    waits = []
+    limiter = type("Limiter", (), {"wait": lambda self: waits.append(scripted.calls)})()
+
+    session = PooledSession()
+    with session.policy(rate_limiter=limiter):
+        assert session.get("https://api.elsevier.com/a").status_code == 200
+    assert waits == [0, 1, 2]
+    assert session._local.policy is None
+
+
+def test_request_policy_works_with_plain_sessions(monkeypatch):
+    from pubman_manager.http_session import request_policy
+    from pubman_manager.pubman_base import PubmanBase
+
+    scripted, _ = _patch(monkeypatch, [_response(200)])
+    waits = []
+    limiter = type("Limiter", (), {"wait": lambda self: waits.append(1)})()
+
+    with request_policy(requests.Session(), give_up=bool, rate_limiter=limiter):
+        pass
+    assert waits == [1]
+
+    pubman = PubmanBase.__new__(PubmanBase)
+    pubman.session = requests.Session()
+    pubman.base_url = "https://pure.mpg.de/rest"
+    pubman.headers_json = {}
+    assert pubman.search_publication_by_criteria({"metadata.title": "A title"}) is None
+    assert scripted.calls == 1
+
+
+def test_circuit_breaker_opens_per_host(monkeypatch):
+    from pubman_manager.http_session import CircuitOpenError, RetryPolicy
+    scripted, _ = _patch(monkeypatch, [requests.ConnectionError("down")] * 3 + [_response(200)])
+    session = PooledSession(retry=RetryPolicy(max_retries=0), failure_threshold=2, reset_timeout=60)
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            session.get("https://api.elsevier.com/a")
+    with pytest.raises(CircuitOpenError):
+        session.get("https://api.elsevier.com/b")
+    assert scripted.calls == 2
+    with pytest.raises(requests.ConnectionError):
+        session.get("https://api.crossref.org/works")
+    assert scripted.calls == 3
+
+
+def test_circuit_breaker_trial_is_freed_after_other_errors(monkeypatch):
+    from pubman_manager.http_session import RetryPolicy
+    scripted, _ = _patch(monkeypatch, [
+        requests.ConnectionError("down"),
+        requests.exceptions.ChunkedEncodingError("truncated"),
+        _response(200),
+    ])
+    session = PooledSession(retry=RetryPolicy(max_retries=0), failure_threshold=1, reset_timeout=0)
+    with pytest.raises(requests.ConnectionError):
+        session.get("https://api.elsevier.com/a")
+    # the trial call fails with an error that neither closes nor reopens the circuit
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        session.get("https://api.elsevier.com/a")
+    assert session.get("https://api.elsevier.com/a").status_code == 200
+    assert scripted.calls == 3
+
+
+def test_rate_limiter_spaces_request_starts_across_threads(monkeypatch):
+    sleeps = []
+
+    class FrozenTime:
+        @staticmethod
+        def monotonic():
+            return 100.0
+
+        @staticmethod
+        def sleep(seconds):
+            sleeps.append(round(seconds, 6))
+
+    monkeypatch.setattr(http_session, "time", FrozenTime)
+    limiter = RateLimiter(0.05)
+
+    threads = [threading.Thread(target=limiter.wait) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # every caller reserved its own slot: the first starts at once, the others 50 ms apart
+    assert sorted(sleeps) == [0.05, 0.1, 0.15, 0.2]
+    assert limiter._next_slot == pytest.approx(100.25)
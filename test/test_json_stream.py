@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from pubman_manager.json_stream import JSONStream
+
+
+def _chunks(payload, size):
+    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1 << 16])
+def test_stream_yields_array_items_and_collects_the_rest(size):
+    payload = {
+        "_scroll_id": "s2",
+        "took": 12345,
+        "hits": {"total": {"value": 3}, "hits": [
+            {"_source": {"objectId": "item_1", "title": "Fe–Mn ßteel"}},
+            {"_source": {"objectId": "item_2", "year": 2024.5}},
+            {"_source": {"objectId": "item_3", "tags": [1, [2, 3]], "empty": {}}},
+        ], "max_score": None},
+    }
+    stream = JSONStream(_chunks(payload, size), [("hits", "hits")])
+
+    assert list(stream) == payload["hits"]["hits"]
+    assert stream.document == {"_scroll_id": "s2", "took": 12345,
+                               "hits": {"total": {"value": 3}, "hits": [], "max_score": None}}
+
+
+def test_items_are_yielded_before_the_document_is_complete():
+    chunks = iter(_chunks({"records": [{"id": 1}, {"id": 2}], "scrollId": "s1"}, 4))
+    stream = iter(JSONStream(chunks, [("records",)]))
+
+    assert next(stream) == {"id": 1}
+    assert next(chunks)  # the rest of the body has not been read yet
+
+
+def test_arrays_at_other_shapes_are_kept_whole():
+    payload = {"records": {"hits": {"hits": [{"id": 1}]}}, "numberOfRecords": 0}
+    stream = JSONStream(_chunks(payload, 5), [("records",), ("records", "hits", "hits")])
+    assert list(stream) == [{"id": 1}]
+
+    stream = JSONStream(_chunks({"records": [], "other": [1, 2]}, 5), [("records",)])
+    assert list(stream) == []
+    assert stream.document == {"records": [], "other": [1, 2]}
+
+
+def test_truncated_stream_raises():
+    data = json.dumps({"records": [{"id": 1}, {"id": 2}]}).encode("utf-8")[:-5]
+    with pytest.raises(ValueError):
+        list(JSONStream([data], [("records",)]))
@@ -0,0 +1,121 @@
+import threading
+
+import pytest
+
+from pubman_manager.organization_directory import OrganizationDirectory
+
+
+def _record(modified, *orgs):
+    return {"data": {"lastModificationDate": modified, "metadata": {"creators": [
+        {"person": {"organizations": [{"name": name, "identifier": org_id} for name, org_id in orgs]}}
+    ]}}}
+
+
+class FakeExtractor:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    def iter_organization_records(self, modified_since=None):
+        self.calls.append(modified_since)
+        yield from self.responses[modified_since]
+
+
+def test_directory_refreshes_incrementally(tmp_path):
+    extractor = FakeExtractor({
+        None: [
+            _record("2024-01-01T00:00:00.000+0000", ("Dept A ", "ou_a"), ("Dept B", "ou_b")),
+            _record("2024-02-01T00:00:00.000+0000", ("Department A", "ou_a"), ("No id", None)),
+        ],
+        "2024-02-01T00:00:00.000+0000": [
+            _record("2024-03-01T00:00:00.000+0000", ("Dept B", "ou_b2"), ("Dept C", "ou_c")),
+        ],
+    })
+    path = tmp_path / "organizations.sqlite"
+
+    with OrganizationDirectory(path) as directory:
+        assert directory.refresh(extractor) == 3
+        assert directory.as_mapping() == {"Department A": "ou_a", "Dept A": "ou_a", "Dept B": "ou_b"}
+        assert directory.get_names("ou_a") == ["Department A", "Dept A"]
+
+    with OrganizationDirectory(path) as directory:
+        directory.refresh(extractor)
+        assert extractor.calls == [None, "2024-02-01T00:00:00.000+0000"]
+        assert directory.get_id("Dept B") == "ou_b2"
+        assert directory.get_id("Dept C") == "ou_c"
+        assert directory.get_id("Unknown") is None
+        assert directory.high_water_mark == "2024-03-01T00:00:00.000+0000"
+
+
+def test_refresh_does_not_lock_the_directory_while_scrolling(tmp_path):
+    path = tmp_path / "organizations.sqlite"
+    OrganizationDirectory(path).close()
+
+    def iter_organization_records(modified_since=None):
+        yield _record("2024-01-01T00:00:00.000+0000", ("Dept A", "ou_a"))
+        # other processes can read and write the directory without waiting
+        with OrganizationDirectory(path) as other:
+            other.conn.execute("PRAGMA busy_timeout = 0")
+            assert other.as_mapping() == {}
+            with other.conn:
+                other.conn.execute("INSERT INTO organization_names (name, org_id) VALUES ('Dept B', 'ou_b')")
+        yield _record("2024-03-01T00:00:00.000+0000", ("Dept C", "ou_c"))
+
+    extractor = FakeExtractor({})
+    extractor.iter_organization_records = iter_organization_records
+    with OrganizationDirectory(path) as directory:
+        assert directory.refresh(extractor) == 3
+        assert directory.high_water_mark == "2024-03-01T00:00:00.000+0000"
+
+
+def test_concurrent_refreshes_scroll_one_after_the_other(tmp_path):
+    path = tmp_path / "organizations.sqlite"
+    scrolling = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def iter_organization_records(modified_since=None):
+        calls.append(modified_since)
+        if modified_since is None:
+            scrolling.set()
+            release.wait(5)
+            yield _record("2024-01-01T00:00:00.000+0000", ("Dept A", "ou_a"))
+
+    extractor = FakeExtractor({})
+    extractor.iter_organization_records = iter_organization_records
+
+    def refresh():
+        with OrganizationDirectory(path) as directory:
+            directory.refresh(extractor)
+
+    first = threading.Thread(target=refresh)
+    first.start()
+    assert scrolling.wait(5)
+    second = threading.Thread(target=refresh)
+    second.start()
+    second.join(0.2)
+    assert calls == [None]
+    release.set()
+    first.join()
+    second.join()
+
+    # the second refresh continues from the mark of the first instead of scrolling everything again
+    assert calls == [None, "2024-01-01T00:00:00.000+0000"]
+
+
+def test_failed_scroll_leaves_the_directory_unchanged(tmp_path):
+    path = tmp_path / "organizations.sqlite"
+    extractor = FakeExtractor({None: [_record("2024-01-01T00:00:00.000+0000", ("Dept A", "ou_a"))]})
+    with OrganizationDirectory(path) as directory:
+        directory.refresh(extractor)
+
+    def truncated(modified_since=None):
+        yield _record("2024-02-01T00:00:00.000+0000", ("Dept B", "ou_b"))
+        raise Exception("Failed to fetch scroll page", 503)
+
+    extractor.iter_organization_records = truncated
+    with OrganizationDirectory(path) as directory:
+        with pytest.raises(Exception, match="Failed to fetch scroll page"):
+            directory.refresh(extractor)
+        assert directory.high_water_mark == "2024-01-01T00:00:00.000+0000"
+        assert directory.as_mapping() == {"Dept A": "ou_a"}
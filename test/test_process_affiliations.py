@@ -0,0 +1,34 @@
+from pubman_manager.pubman_extractor import PubmanExtractor, reduce_affiliations
+
+EIN = "Max-Planck-Institut für Eisenforschung GmbH, Max Planck Society"
+SUS = "Max Planck Institute for Sustainable Materials, Max Planck Society"
+
+
+def test_process_affiliations_reduces_and_swaps_suffixes():
+    extractor = PubmanExtractor.__new__(PubmanExtractor)
+    result = extractor.process_affiliations([
+        f"Microstructure Physics and Alloy Design, {EIN}\n",
+        f"Microstructure  Physics and Alloy Design, {EIN}",
+        "ou_12345",
+        "KU Leuven, Belgium",
+    ])
+    assert result == [
+        f"Microstructure Physics and Alloy Design, {EIN}",
+        "KU Leuven, Belgium",
+        f"Microstructure Physics and Alloy Design, {SUS}",
+    ]
+
+
+def test_process_affiliations_is_memoized_per_name_tuple():
+    extractor = PubmanExtractor.__new__(PubmanExtractor)
+    names = [f"Theory and Simulation, {SUS}", "RWTH Aachen University"]
+    first = extractor.process_affiliations(names)
+    before = reduce_affiliations.cache_info()
+
+    second = extractor.process_affiliations([name + " " for name in names])
+    second.append("modified by caller")
+
+    after = reduce_affiliations.cache_info()
+    assert after.hits == before.hits + 1
+    assert after.misses == before.misses
+    assert extractor.process_affiliations(names) == first
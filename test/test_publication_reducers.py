@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from pubman_manager.util import load_yaml
+from pubman_manager.pubman_extractor import PubmanExtractor, PublicationReducer, feed_reducers, reduce_publications
+
+
+def _record(object_id, creators, sources=()):
+    return {"data": {"objectId": object_id, "metadata": {"creators": creators, "sources": list(sources)}}}
+
+
+def _creator(given, family, orgs):
+    return {"person": {"givenName": given, "familyName": family, "organizations": [
+        {"name": name, "identifier": identifier, "identifierPath": [identifier, "ou_root"]} for name, identifier in orgs
+    ]}}
+
+
+SOURCE = {"title": "Acta Materialia", "genre": "JOURNAL",
+          "identifiers": [{"type": "ISSN", "id": "1359-6454"}, {"type": "CONE", "id": "cone_1"}]}
+MPIE = "Max-Planck-Institut für Eisenforschung GmbH, Max Planck Society"
+
+PUBLICATIONS = [
+    _record("item_1", [_creator("Jane", "Doe", [("KU Leuven, Belgium", "ou_1")])], [SOURCE]),
+    _record("item_2", [_creator("John", "Roe", [("RWTH Aachen University", "ou_2")]),
+                       _creator("Jane", "Doe", [("RWTH Aachen University", "ou_2")])]),
+    _record("item_1", [_creator("Jane", "Doe", [("KU Leuven, Belgium", "ou_1")])], [SOURCE]),
+    {"data": {"metadata": {"creators": [_creator("No", "Id", [("Nowhere", "ou_3")])]}}},
+]
+
+# Distinct publications the golden files in resources/publication_reducers were built
+# from, with the per-output extract_* methods the fused reducers replaced
+GOLDEN_PUBLICATIONS = [
+    _record("item_1", [_creator("Jane", "Doe", [("KU Leuven, Belgium", "ou_1")])], [SOURCE]),
+    _record("item_2", [_creator("John", "Roe", [("RWTH Aachen University", "ou_2"), (MPIE, "ou_mpie")]),
+                       _creator("Jane", "Doe", [("RWTH Aachen University", "ou_2")])],
+            [{"title": "Scripta Materialia", "identifiers": [{"type": "ISSN", "id": "1359-6462"}]}]),
+    _record("item_3", [_creator("J.", "Doe", [("KU Leuven, Belgium", "ou_1")]),
+                       _creator("Jane", "Doe", [("KU Leuven Belgium", "ou_persistent22")]),
+                       _creator("", "Anonymous", [("Nowhere", "ou_3")]),
+                       _creator("John", "Roe", [(MPIE, "ou_mpie"), ("Ruhr-Universität Bochum", "ou_4")])],
+            [dict(SOURCE, title="Acta Mater.")]),
+]
+GOLDEN_DIR = Path(__file__).parent / "resources" / "publication_reducers"
+
+
+@pytest.mark.parametrize("name", ["authors_info", "identifier_paths", "journals"])
+def test_fused_pass_matches_golden_outputs(name):
+    extractor = PubmanExtractor.__new__(PubmanExtractor)
+    publications = GOLDEN_PUBLICATIONS + GOLDEN_PUBLICATIONS[:1]
+    results = reduce_publications(publications, extractor.cache_reducers(), unique=True)
+
+    assert results[name] == load_yaml(GOLDEN_DIR / f"{name}.yaml")
+
+
+def test_feed_reducers_streams_and_skips_duplicates():
+    extractor = PubmanExtractor.__new__(PubmanExtractor)
+    reducers = extractor.cache_reducers()
+    stream = feed_reducers(iter(PUBLICATIONS), list(reducers.values()), unique=True)
+
+    assert [r["data"]["objectId"] for r in stream] == ["item_1", "item_2"]
+    authors_info = reducers["authors_info"].result()
+    assert authors_info[("Jane", "Doe")]["affiliation_counts"] == {"KU Leuven, Belgium": 1, "RWTH Aachen University": 1}
+    assert ("No", "Id") not in authors_info
+
+
+def test_reducers_must_implement_result():
+    class NoResult(PublicationReducer):
+        def add_record(self, data):
+            pass
+
+    with pytest.raises(TypeError):
+        NoResult()
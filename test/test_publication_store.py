@@ -0,0 +1,75 @@
+import pytest
+
+from pubman_manager.publication_store import PublicationStore
+
+
+def _record(object_id, dois=(), orgs=(), state="RELEASED", title="T"):
+    return {"data": {
+        "objectId": object_id,
+        "versionState": state,
+        "metadata": {
+            "title": title,
+            "identifiers": [{"type": "DOI", "id": doi} for doi in dois],
+            "creators": [{"person": {"organizations": [
+                {"identifier": org, "identifierPath": [org, "ou_root"]} for org in orgs
+            ]}}],
+        },
+    }}
+
+
+def test_replace_and_lookups(tmp_path):
+    path = tmp_path / "publications.sqlite"
+    records = [
+        _record("item_1", dois=["10.1/ABC"], orgs=["ou_a"]),
+        _record("item_2", dois=["10.1/def"], orgs=["ou_b"]),
+        _record("item_1", dois=["10.1/abc"], orgs=["ou_a"], title="duplicate from second org"),
+        _record("item_3", orgs=["ou_a"]),
+        _record("item_4", dois=["10.1/gone"], orgs=["ou_a"], state="WITHDRAWN"),
+    ]
+
+    assert PublicationStore.replace(path, iter(records)) == 3
+    with PublicationStore(path) as store:
+        assert [r["data"]["objectId"] for r in store.iter_records(batch_size=2)] == ["item_1", "item_2", "item_3"]
+        assert store.get("item_1")["data"]["metadata"]["title"] == "duplicate from second org"
+        assert store.get("missing") is None
+        assert store.get("item_4") is None
+        assert store.find_by_doi("10.1/gone") == []
+        assert [r["data"]["objectId"] for r in store.find_by_doi(" 10.1/abc ")] == ["item_1"]
+        assert [r["data"]["objectId"] for r in store.iter_by_org("ou_a")] == ["item_1", "item_3"]
+        assert [r["data"]["objectId"] for r in store.iter_by_org("ou_root")] == ["item_1", "item_2", "item_3"]
+
+
+def test_merge_replaces_in_place_and_drops_withdrawn(tmp_path):
+    path = tmp_path / "publications.sqlite"
+    PublicationStore.replace(path, [_record("item_1", dois=["10.1/a"]), _record("item_2"), _record("item_3")])
+
+    count = PublicationStore.merge(path, [
+        _record("item_1", state="WITHDRAWN"),
+        _record("item_2", dois=["10.1/b"], title="updated"),
+        _record("item_4"),
+    ])
+
+    assert count == 3
+    with PublicationStore(path) as store:
+        assert [r["data"]["objectId"] for r in store.iter_records()] == ["item_2", "item_3", "item_4"]
+        assert store.get("item_2")["data"]["metadata"]["title"] == "updated"
+        assert store.find_by_doi("10.1/a") == []
+        assert [r["data"]["objectId"] for r in store.find_by_doi("10.1/b")] == ["item_2"]
+
+
+def test_failed_replace_keeps_store_and_leaves_no_temp_files(tmp_path):
+    path = tmp_path / "publications.sqlite"
+    PublicationStore.replace(path, [_record("item_1")])
+
+    def _broken_download():
+        yield _record("item_2")
+        raise ConnectionError("scroll aborted")
+
+    with pytest.raises(ConnectionError):
+        PublicationStore.replace(path, _broken_download())
+    with pytest.raises(ConnectionError):
+        PublicationStore.merge(path, _broken_download())
+
+    assert [p.name for p in tmp_path.iterdir()] == ["publications.sqlite"]
+    with PublicationStore(path) as store:
+        assert [r["data"]["objectId"] for r in store.iter_records()] == ["item_1"]
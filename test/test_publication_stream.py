@@ -0,0 +1,77 @@
+import json
+
+import pytest
+import requests
+
+from pubman_manager.pubman_extractor import PubmanExtractor, CORPUS_SOURCE_FIELDS
+
+
+def _response(payload, status_code=200):
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp._content = json.dumps(payload).encode("utf-8")
+    resp._content_consumed = True
+    return resp
+
+
+class FakeScrollSession:
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.calls = []
+        self.queries = []
+
+    def post(self, url, headers=None, data=None, **kwargs):
+        self.calls.append(("POST", url))
+        self.queries.append(json.loads(data))
+        return _response({"records": [{"data": {"objectId": "item_0"}}], "scrollId": "s1"})
+
+    def get(self, url, headers=None, **kwargs):
+        self.calls.append(("GET", url))
+        page = self.pages.pop(0)
+        return _response({}, status_code=page) if isinstance(page, int) else _response(page)
+
+
+def _extractor(session):
+    extractor = PubmanExtractor.__new__(PubmanExtractor)
+    extractor.base_url = "https://pure.mpg.de/rest"
+    extractor.auth_token = "token"
+    extractor.headers_json = {}
+    extractor.session = session
+    return extractor
+
+
+def test_iter_publications_by_organization_streams_scroll_pages():
+    session = FakeScrollSession([
+        {"_scroll_id": "s2", "hits": {"hits": [{"_source": {"objectId": "item_1"}}]}},
+        {"_scroll_id": "s3", "hits": {"hits": [{"_source": {"objectId": "item_2"}}]}},
+        {"_scroll_id": "s4", "hits": {"hits": []}},
+    ])
+    stream = _extractor(session).iter_publications_by_organization("ou_1", page_size=1)
+
+    assert next(stream) == {"data": {"objectId": "item_0"}}
+    assert len(session.calls) == 1  # nothing beyond the first page was requested yet
+    assert [r["data"]["objectId"] for r in stream] == ["item_1", "item_2"]
+    assert len(session.calls) == 4
+
+
+
+def test_iter_publications_by_organization_projects_only_when_asked():
+    session = FakeScrollSession([{"_scroll_id": None, "hits": {"hits": []}}] * 2)
+
+    list(_extractor(session).iter_publications_by_organization("ou_1", source=CORPUS_SOURCE_FIELDS))
+    list(_extractor(session).iter_publications_by_organization("ou_1"))
+
+    assert session.queries[0]["_source"] == CORPUS_SOURCE_FIELDS
+    assert "_source" not in session.queries[1]
+
+
+def test_failed_scroll_page_raises_instead_of_truncating():
+    session = FakeScrollSession([
+        {"_scroll_id": "s2", "hits": {"hits": [{"_source": {"objectId": "item_1"}}]}},
+        503,
+    ])
+    stream = _extractor(session).iter_publications_by_organization("ou_1", page_size=1)
+
+    assert [next(stream)["data"]["objectId"] for _ in range(2)] == ["item_0", "item_1"]
+    with pytest.raises(Exception, match="Failed to fetch scroll page"):
+        next(stream)
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+import requests
+
+from pubman_manager.pubman_base import PubmanBase, criteria_key, record_matches_criteria
+
+
+def _record(object_id, doi=None, title="", event=None):
+    metadata = {"title": title, "identifiers": [{"id": doi, "type": "DOI"}] if doi else []}
+    if event:
+        metadata["event"] = {"title": event}
+    return {"data": {"objectId": object_id, "lastModificationDate": "t", "versionState": "PENDING",
+                     "metadata": metadata}}
+
+
+class FakeSession:
+    def __init__(self, records, status_code=200):
+        self.records = records
+        self.status_code = status_code
+        self.queries = []
+
+    def post(self, url, headers=None, data=None, **kwargs):
+        query = json.loads(data)
+        self.queries.append(query)
+        records = self.records(query) if callable(self.records) else self.records
+        resp = requests.Response()
+        resp.status_code = self.status_code
+        resp._content = json.dumps({"numberOfRecords": len(records), "records": records}).encode()
+        return resp
+
+
+def _pubman(records, status_code=200):
+    pubman = PubmanBase.__new__(PubmanBase)
+    pubman.base_url = "https://pure.mpg.de/rest"
+    pubman.headers_json = {}
+    pubman.session = FakeSession(records, status_code)
+    return pubman
+
+
+def test_batch_lookup_uses_one_projected_query_per_chunk():
+    pubman = _pubman([
+        _record("item_1", doi="10.1000/ABC"),
+        _record("item_3", title="My Talk", event="Conference X 2024"),
+    ])
+    doi_abc = {"metadata.identifiers": {"id": "10.1000/abc", "type": "DOI"}}
+    doi_missing = {"metadata.identifiers": {"id": "10.1000/missing", "type": "DOI"}}
+    talk = {"metadata.title": "My Talk", "metadata.event.title": "Conference X"}
+
+    found = pubman.search_publications_by_criteria_batch([doi_abc, doi_missing, talk, doi_abc])
+
+    assert len(pubman.session.queries) == 1
+    query = pubman.session.queries[0]
+    assert len(query["query"]["bool"]["should"]) == 3
+    assert query["size"] == 12
+    assert "objectId" in query["_source"]
+    assert [r["data"]["objectId"] for r in found[criteria_key(doi_abc)]] == ["item_1"]
+    assert [r["data"]["objectId"] for r in found[criteria_key(talk)]] == ["item_3"]
+    assert criteria_key(doi_missing) not in found
+
+
+def test_batch_lookup_chunks_criteria():
+    pubman = _pubman([])
+    criteria = [{"metadata.identifiers": {"id": f"10.1000/{i}", "type": "DOI"}} for i in range(5)]
+    assert pubman.search_publications_by_criteria_batch(criteria, chunk_size=2) == {}
+    assert len(pubman.session.queries) == 3
+
+
+def test_record_matches_phrase_not_substring():
+    record = _record("item_1", title="Deformation of steels at high temperature")
+    assert record_matches_criteria(record, {"metadata.title": "steels at high"})
+    assert not record_matches_criteria(record, {"metadata.title": "steel"})
+
+
+def test_batch_lookup_asks_per_criteria_when_a_record_matches_none():
+    # PuRe's analyzer stems "boundaries", the client-side phrase matching doesn't
+    hit = _record("item_1", title="Grain boundaries segregation")
+
+    def search(query):
+        clauses = query["query"]["bool"].get("must", [])
+        if clauses and clauses[0]["match_phrase"]["metadata.title"] != "Grain boundary segregation":
+            return []
+        return [hit]
+
+    pubman = _pubman(search)
+    stemmed = {"metadata.title": "Grain boundary segregation"}
+    other = {"metadata.title": "Unrelated"}
+
+    found = pubman.search_publications_by_criteria_batch([stemmed, other])
+
+    assert len(pubman.session.queries) == 3
+    assert [r["data"]["objectId"] for r in found[criteria_key(stemmed)]] == ["item_1"]
+    assert criteria_key(other) not in found
+
+
+def test_batch_lookup_raises_on_failed_search():
+    pubman = _pubman([], status_code=502)
+    with pytest.raises(Exception, match="Failed batched pubman search"):
+        pubman.search_publications_by_criteria_batch([{"metadata.title": "Anything"}])
+
+
+def test_record_matches_folded_tokens():
+    record = _record("item_1", title="Kristallplastizität in snake_case Modellen")
+    assert record_matches_criteria(record, {"metadata.title": "kristallplastizitat"})
+    assert record_matches_criteria(record, {"metadata.title": "case modellen"})
+
+
+def test_doi_criteria_match_the_full_doi_only():
+    longer = _record("item_1", doi="10.1000/abc.def")
+    doi_abc = {"metadata.identifiers": {"id": "10.1000/abc", "type": "DOI"}}
+    assert not record_matches_criteria(longer, doi_abc)
+    assert record_matches_criteria(_record("item_2", doi="https://doi.org/10.1000/ABC"), doi_abc)
+
+    # PuRe's match_phrase returns the longer DOI, which must not count as existing
+    pubman = _pubman([longer])
+    assert pubman.search_publications_by_criteria_batch([doi_abc]) == {}
+    assert len(pubman.session.queries) == 1
+    assert pubman.search_publication_by_criteria(doi_abc) == []
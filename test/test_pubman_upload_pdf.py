@@ -14,6 +14,7 @@ def test_pubman_upload_pdf_posts_binary_payload(tmp_path, monkeypatch):
     creator = PubmanCreator.__new__(PubmanCreator)
     creator.auth_token = "token"
     creator.base_url = "https://pure.mpg.de/rest"
+    creator.session = requests.Session()
 
     captured = {}
 
@@ -28,7 +29,7 @@ def test_pubman_upload_pdf_posts_binary_payload(tmp_path, monkeypatch):
         resp.headers["Content-Type"] = "application/json"
         return resp
 
-    monkeypatch.setattr(requests, "post", _fake_post)
+    monkeypatch.setattr(requests.Session, "post", lambda _self, url, **kwargs: _fake_post(url, **kwargs))
 
     file_id = creator.upload_pdf(pdf_path)
 
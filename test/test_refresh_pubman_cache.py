@@ -0,0 +1,248 @@
+import fcntl
+import os
+import threading
+
+import pytest
+
+from pubman_manager import main as pubman_main
+from pubman_manager import org_cache, organization_directory
+from pubman_manager.pubman_extractor import PublicationReducer, CORPUS_SOURCE_FIELDS
+from pubman_manager.publication_store import PublicationStore, PUBLICATIONS_STORE_FILE
+from pubman_manager.util import load_yaml
+
+
+def _record(object_id, modified, state="RELEASED"):
+    return {"data": {"objectId": object_id, "lastModificationDate": modified, "versionState": state}}
+
+
+class FakeExtractor:
+    responses = {}
+    calls = []
+
+    def iter_organization_records(self, modified_since=None):
+        yield {"data": {"lastModificationDate": "2024-01-01T10:00:00.000+0000", "metadata": {"creators": [
+            {"person": {"organizations": [{"name": "Department A", "identifier": "ou_a"}]}}
+        ]}}}
+
+    def iter_publications_by_organization(self, org_id, modified_since=None, source=None):
+        assert source == CORPUS_SOURCE_FIELDS
+        FakeExtractor.calls.append((org_id, modified_since))
+        yield from FakeExtractor.responses[(org_id, modified_since)]
+
+    def cache_reducers(self, workers=1):
+        return {"authors_info": IdsReducer(), "identifier_paths": EmptyReducer(), "journals": EmptyReducer()}
+
+
+class IdsReducer(PublicationReducer):
+    built = 0
+
+    def __init__(self):
+        self.ids = []
+
+    def add_record(self, data):
+        self.ids.append(data["objectId"])
+
+    def result(self):
+        IdsReducer.built += 1
+        return {"ids": self.ids}
+
+
+class EmptyReducer(PublicationReducer):
+    def result(self):
+        return {}
+
+
+@pytest.fixture
+def cache_dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(pubman_main, "PubmanExtractor", FakeExtractor)
+    monkeypatch.setattr(pubman_main, "get_user_cache_dir", lambda user_id: tmp_path / f"user_{user_id}")
+    monkeypatch.setattr(organization_directory, "ORGANIZATIONS_FILE", tmp_path / "organizations.sqlite")
+    monkeypatch.setattr(org_cache, "ORG_CACHE_DIR", tmp_path / "org_cache")
+    FakeExtractor.calls = []
+    IdsReducer.built = 0
+    return tmp_path
+
+
+def test_incremental_refresh_merges_changes_by_object_id(cache_dirs):
+    FakeExtractor.responses = {
+        ("ou_a", None): [
+            _record("item_1", "2024-01-01T10:00:00.000+0000"),
+            _record("item_2", "2024-03-01T10:00:00.000+0000"),
+            _record("item_3", "2024-02-01T10:00:00.000+0000"),
+        ],
+        ("ou_a", "2024-03-01T10:00:00.000+0000"): [
+            _record("item_1", "2024-04-01T10:00:00.000+0000", state="WITHDRAWN"),
+            _record("item_3", "2024-04-02T10:00:00.000+0000"),
+            _record("item_4", "2024-04-03T10:00:00.000+0000"),
+        ],
+    }
+    user_dir = cache_dirs / "user_1"
+
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+    assert load_yaml(user_dir / "authors_info.yaml") == {"ids": ["item_1", "item_2", "item_3"]}
+
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+    assert FakeExtractor.calls[-1] == ("ou_a", "2024-03-01T10:00:00.000+0000")
+    corpus_dir = org_cache.org_corpus_dir("ou_a")
+    with PublicationStore(corpus_dir / PUBLICATIONS_STORE_FILE) as store:
+        publications = list(store.iter_records())
+    assert [(p["data"]["objectId"], p["data"]["lastModificationDate"][:10]) for p in publications] == [
+        ("item_2", "2024-03-01"),
+        ("item_3", "2024-04-02"),
+        ("item_4", "2024-04-03"),
+    ]
+    assert load_yaml(user_dir / "authors_info.yaml") == {"ids": ["item_2", "item_3", "item_4"]}
+    assert load_yaml(corpus_dir / org_cache.ORG_STATE_FILE)["high_water_mark"] == "2024-04-03T10:00:00.000+0000"
+
+    FakeExtractor.responses[("ou_a", None)] = [_record("item_9", "2024-05-01T10:00:00.000+0000")]
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"], incremental=False)
+    assert FakeExtractor.calls[-1] == ("ou_a", None)
+    assert load_yaml(user_dir / "authors_info.yaml") == {"ids": ["item_9"]}
+
+
+def test_refresh_merges_shared_publications_of_several_orgs(cache_dirs):
+    FakeExtractor.responses = {
+        ("ou_a", None): [_record("item_1", "2024-01-01T10:00:00.000+0000"), _record("item_2", "2024-02-01T10:00:00.000+0000")],
+        ("ou_b", None): [_record("item_2", "2024-02-01T10:00:00.000+0000"), _record("item_3", "2024-03-01T10:00:00.000+0000")],
+    }
+
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_b", "ou_a"])
+
+    assert sorted(FakeExtractor.calls) == [("ou_a", None), ("ou_b", None)]
+    assert load_yaml(cache_dirs / "user_1" / "authors_info.yaml") == {"ids": ["item_1", "item_2", "item_3"]}
+
+
+def test_refresh_output_does_not_depend_on_org_order_or_completion(cache_dirs, monkeypatch):
+    FakeExtractor.responses = {
+        ("ou_a", None): [_record("item_1", "2024-01-01T10:00:00.000+0000"), _record("item_2", "2024-02-01T10:00:00.000+0000")],
+        ("ou_b", None): [_record("item_3", "2024-03-01T10:00:00.000+0000"), _record("item_2", "2024-02-01T10:00:00.000+0000")],
+        ("ou_a", "2024-02-01T10:00:00.000+0000"): [],
+        ("ou_b", "2024-03-01T10:00:00.000+0000"): [],
+    }
+    ou_b_done = threading.Event()
+    refresh_org_corpus = org_cache.refresh_org_corpus
+
+    def refresh_ou_b_first(extractor, org_id, incremental=True):
+        # ou_a is listed first but finishes last
+        if org_id == "ou_a":
+            assert ou_b_done.wait(5)
+        content_hash = refresh_org_corpus(extractor, org_id, incremental=incremental)
+        if org_id == "ou_b":
+            ou_b_done.set()
+        return content_hash
+
+    monkeypatch.setattr(org_cache, "refresh_org_corpus", refresh_ou_b_first)
+
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a", "ou_b"])
+    pubman_main.refresh_pubman_cache_for_user("2", ["ou_b", "ou_a"])
+
+    first, second = (cache_dirs / f"user_{user_id}" / "authors_info.yaml" for user_id in "12")
+    assert load_yaml(first) == {"ids": ["item_1", "item_2", "item_3"]}
+    assert os.path.samefile(first, second)
+
+
+def test_users_of_the_same_orgs_share_the_derived_files(cache_dirs):
+    FakeExtractor.responses = {
+        ("ou_a", None): [_record("item_1", "2024-01-01T10:00:00.000+0000")],
+        ("ou_a", "2024-01-01T10:00:00.000+0000"): [],
+    }
+
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+    pubman_main.refresh_pubman_cache_for_user("2", ["ou_a"])
+
+    assert FakeExtractor.calls == [("ou_a", None), ("ou_a", "2024-01-01T10:00:00.000+0000")]
+    assert IdsReducer.built == 1
+    first, second = (cache_dirs / f"user_{user_id}" / "authors_info.yaml" for user_id in "12")
+    assert os.path.samefile(first, second)
+    assert load_yaml(second) == {"ids": ["item_1"]}
+
+
+def test_unreferenced_views_are_pruned(cache_dirs):
+    FakeExtractor.responses = {
+        ("ou_a", None): [_record("item_1", "2024-01-01T10:00:00.000+0000")],
+        ("ou_a", "2024-01-01T10:00:00.000+0000"): [_record("item_2", "2024-02-01T10:00:00.000+0000")],
+    }
+
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+    assert len([path for path in org_cache.views_dir().iterdir() if path.is_dir()]) == 2
+
+    assert org_cache.prune_views(grace_period=0) == 1
+    assert load_yaml(cache_dirs / "user_1" / "authors_info.yaml") == {"ids": ["item_1", "item_2"]}
+
+
+def test_views_are_rebuilt_when_a_reducer_input_file_changes(cache_dirs, monkeypatch):
+    FakeExtractor.responses = {
+        ("ou_a", None): [_record("item_1", "2024-01-01T10:00:00.000+0000")],
+        ("ou_a", "2024-01-01T10:00:00.000+0000"): [],
+    }
+    director_file = cache_dirs / "director_affiliations.yaml"
+    director_file.write_text("[]\n")
+    monkeypatch.setattr(IdsReducer, "input_files", (director_file,))
+
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+    assert IdsReducer.built == 1
+    director_file.write_text("- {first_name: A, last_name: B, affiliation: C}\n")
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+
+    assert IdsReducer.built == 2
+    assert len([path for path in org_cache.views_dir().iterdir() if path.is_dir()]) == 2
+
+
+def test_views_are_not_pruned_while_in_use(cache_dirs):
+    FakeExtractor.responses = {
+        ("ou_a", None): [_record("item_1", "2024-01-01T10:00:00.000+0000")],
+        ("ou_a", "2024-01-01T10:00:00.000+0000"): [_record("item_2", "2024-02-01T10:00:00.000+0000")],
+    }
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+
+    with org_cache.views_lock():
+        assert org_cache.prune_views(grace_period=0) == 0
+    assert org_cache.prune_views(grace_period=0) == 1
+
+
+def test_org_refresh_is_locked_across_processes(cache_dirs):
+    corpus_dir = org_cache.org_corpus_dir("ou_a")
+    corpus_dir.mkdir(parents=True)
+
+    with org_cache._org_lock("ou_a"):
+        # a separate open file description, as another process would have
+        with open(corpus_dir / org_cache.ORG_LOCK_FILE, "a") as other:
+            with pytest.raises(BlockingIOError):
+                fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    with open(corpus_dir / org_cache.ORG_LOCK_FILE, "a") as other:
+        fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def test_failed_scroll_leaves_corpus_and_mark_unchanged(cache_dirs):
+    def failing_second_page():
+        yield _record("item_3", "2024-05-01T10:00:00.000+0000")
+        raise Exception("Failed to fetch scroll page", 503)
+
+    FakeExtractor.responses = {("ou_a", None): [_record("item_1", "2024-01-01T10:00:00.000+0000")]}
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+    state_path = org_cache.org_corpus_dir("ou_a") / org_cache.ORG_STATE_FILE
+    state = load_yaml(state_path)
+
+    FakeExtractor.responses[("ou_a", "2024-01-01T10:00:00.000+0000")] = failing_second_page()
+    with pytest.raises(Exception, match="Failed to fetch scroll page"):
+        pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+
+    assert load_yaml(state_path) == state
+    with PublicationStore(org_cache.org_corpus_dir("ou_a") / PUBLICATIONS_STORE_FILE) as store:
+        assert [r["data"]["objectId"] for r in store.iter_records()] == ["item_1"]
+
+
+def test_stale_corpus_is_downloaded_anew(cache_dirs, monkeypatch):
+    FakeExtractor.responses = {
+        ("ou_a", None): [_record("item_1", "2024-01-01T10:00:00.000+0000")],
+        ("ou_a", "2024-01-01T10:00:00.000+0000"): [],
+    }
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+    monkeypatch.setattr(org_cache, "FULL_REFRESH_INTERVAL", 0)
+    pubman_main.refresh_pubman_cache_for_user("1", ["ou_a"])
+
+    assert FakeExtractor.calls == [("ou_a", None), ("ou_a", "2024-01-01T10:00:00.000+0000"), ("ou_a", None)]
@@ -0,0 +1,124 @@
+import os
+import stat
+import time
+
+import jwt
+import pytest
+
+from pubman_manager import token_cache
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / ".token_cache.json"
+    monkeypatch.setattr(token_cache, "TOKEN_CACHE_FILE", path)
+    return path
+
+
+def _token(user_id, expires_in=None):
+    payload = {"id": user_id}
+    if expires_in is not None:
+        payload["exp"] = int(time.time() + expires_in)
+    return jwt.encode(payload, "test-signing-key-for-token-cache-tests", algorithm="HS256")
+
+
+def test_login_is_reused_until_close_to_expiry(cache_file):
+    logins = []
+
+    def login(username, password):
+        logins.append(username)
+        return _token("user_1", expires_in=3600 if len(logins) == 1 else 7200), "user_1"
+
+    first = token_cache.cached_login("alice", "pw", login)
+    assert token_cache.cached_login("alice", "pw", login) == first
+    assert logins == ["alice"]
+    assert stat.S_IMODE(os.stat(cache_file).st_mode) == 0o600
+
+    cache = token_cache._load()
+    cache["tokens"][token_cache._login_key("alice", "pw")]["auth_token"] = _token("user_1", expires_in=token_cache.REFRESH_MARGIN - 10)
+    token_cache._save(cache)
+    assert token_cache.cached_login("alice", "pw", login) != first
+    assert logins == ["alice", "alice"]
+
+
+def test_tokens_without_exp_are_not_cached(cache_file):
+    logins = []
+
+    def login(username, password):
+        logins.append(username)
+        return _token("user_1"), "user_1"
+
+    token_cache.cached_login("alice", "pw", login)
+    token_cache.cached_login("alice", "pw", login)
+    assert logins == ["alice", "alice"]
+
+
+def test_user_info_is_cached_per_token(cache_file):
+    calls = []
+
+    def get_user_info(auth_token, user_id):
+        calls.append(auth_token)
+        return {"ctx_id": "ctx_1", "org_id": "ou_1", "org_name": "MPI"}
+
+    token = _token("user_1", expires_in=3600)
+    assert token_cache.cached_user_info(token, "user_1", get_user_info)["org_id"] == "ou_1"
+    assert token_cache.cached_user_info(token, "user_1", get_user_info)["ctx_id"] == "ctx_1"
+    assert len(calls) == 1
+
+    token_cache.cached_user_info(_token("user_1", expires_in=3601), "user_1", get_user_info)
+    assert len(calls) == 2
+
+
+def test_token_is_cached_per_password(cache_file):
+    logins = []
+
+    def login(username, password):
+        logins.append(password)
+        return _token(f"user_{len(logins)}", expires_in=3600), "user_1"
+
+    first = token_cache.cached_login("alice", "old", login)
+    assert token_cache.cached_login("alice", "new", login) != first
+    assert token_cache.cached_login("alice", "old", login) == first
+    assert logins == ["old", "new"]
+    assert "old" not in cache_file.read_text() and "new" not in cache_file.read_text()
+
+
+def test_rejected_token_is_renewed_once_and_the_request_repeated(cache_file, monkeypatch):
+    import requests
+
+    from pubman_manager import pubman_base
+    from pubman_manager.pubman_base import PubmanBase
+
+    tokens = [_token("user_1", expires_in=3600), _token("user_1", expires_in=7200)]
+    logins = []
+
+    def login(username, password):
+        logins.append(username)
+        return tokens[len(logins) - 1], "user_1"
+
+    class FakeSession:
+        def __init__(self):
+            self.sent = []
+
+        def request(self, method, url, headers=None, **kwargs):
+            self.sent.append((method, headers["Authorization"]))
+            resp = requests.Response()
+            resp.status_code = 401 if headers["Authorization"] == tokens[0] else 200
+            resp._content = b"{}"
+            resp._content_consumed = True
+            return resp
+
+    monkeypatch.setattr(pubman_base, "ENV_USERNAME", "alice")
+    monkeypatch.setattr(pubman_base, "ENV_PASSWORD", "pw")
+    monkeypatch.setattr(PubmanBase, "login", staticmethod(login))
+    monkeypatch.setattr(PubmanBase, "get_user_info", staticmethod(lambda auth_token, user_id: {
+        "ctx_id": "ctx_1", "org_id": "ou_1", "org_name": "MPI", "user_name": "Alice", "user_email": "a@b.c"}))
+    session = FakeSession()
+    pubman = PubmanBase(session=session)
+
+    assert pubman.get_item("item_1") == {}
+    assert session.sent == [("GET", tokens[0]), ("GET", tokens[1])]
+    assert pubman.headers_json["Authorization"] == tokens[1]
+    assert pubman.renew_auth_token(tokens[0]) == tokens[1]
+    assert logins == ["alice", "alice"]
+    assert token_cache.cached_login("alice", "pw", login) == (tokens[1], "user_1")
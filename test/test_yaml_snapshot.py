@@ -0,0 +1,48 @@
+import json
+import os
+
+import pytest
+
+from pubman_manager.util import load_yaml_derived, load_yaml_snapshot, save_yaml
+
+
+def test_snapshot_is_shared_until_file_changes(tmp_path):
+    path = tmp_path / "journals.yaml"
+    save_yaml({"1234-5678": {"title": "Journal", "alternativeTitles": ["J"]}}, path)
+
+    first = load_yaml_snapshot(path)
+    assert load_yaml_snapshot(path) is first
+    assert json.loads(json.dumps(first)) == {"1234-5678": {"title": "Journal", "alternativeTitles": ["J"]}}
+    with pytest.raises(TypeError):
+        first["1234-5678"]["title"] = "changed"
+    assert first["1234-5678"]["alternativeTitles"] == ("J",)
+
+    save_yaml({"1234-5678": {"title": "Renamed journal"}}, path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = load_yaml_snapshot(path)
+    assert second is not first
+    assert second["1234-5678"]["title"] == "Renamed journal"
+
+
+def test_derived_values_follow_snapshot_version(tmp_path):
+    path = tmp_path / "authors_info.yaml"
+    save_yaml({"a": 1}, path)
+    builds = []
+
+    def build(data):
+        builds.append(dict(data))
+        return sorted(data)
+
+    assert load_yaml_derived(path, "keys", build) == ["a"]
+    assert load_yaml_derived(path, "keys", build) == ["a"]
+    assert len(builds) == 1
+
+    save_yaml({"a": 1, "bb": 2}, path)
+    assert load_yaml_derived(path, "keys", build) == ["a", "bb"]
+    assert len(builds) == 2
+
+
+def test_snapshot_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_yaml_snapshot(tmp_path / "missing.yaml")
@@ -17,6 +17,7 @@ from user import User
 from misc import update_cache, send_test_mail_, send_author_publications, get_file_for_dois, get_user_dois
 from pubman_manager import DOIParser, PubmanExtractor, PubmanCreator, TALKS_DIR, USER_DATA_DIR, get_user_cache_dir, get_user_dir, FILES_DIR
 from pubman_manager import generate_author_overview, PubmanCreator
+from pubman_manager.token_cache import cached_user_info
 
 # Initialize your core objects
 # pubman_api = None
@@ -47,7 +48,7 @@ def login():
             app.logger.info("Authenticating user %s", username)
             auth_token, user_id, = PubmanCreator.login(username, form.password.data)
             app.logger.info("Auth success for user_id %s", user_id)
-            user_info = PubmanCreator.get_user_info(auth_token, user_id)
+            user_info = cached_user_info(auth_token, user_id, PubmanCreator.get_user_info)
             app.logger.info("User info retrieved for user_id %s", user_id)
             ctx_id = user_info['ctx_id']
             org_id = user_info['org_id']